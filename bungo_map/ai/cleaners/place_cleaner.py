@@ -10,7 +10,7 @@ from dataclasses import asdict
 import sqlite3
 from pathlib import Path
 
-from ..models.openai_client import OpenAIClient, PlaceAnalysis
+from ..models.openai_client import OpenAIClient, PlaceAnalysis, DEFAULT_RPM, DEFAULT_TPM
 from ..utils.logger import get_logger
 from ...core.database import Database
 from ..validators.context_analyzer import ContextAnalyzer, ContextAnalysis
@@ -20,18 +20,23 @@ logger = get_logger(__name__)
 class PlaceCleaner:
     """地名データクリーニングメインクラス"""
     
-    def __init__(self, database_path: str, openai_api_key: Optional[str] = None):
+    def __init__(self, database_path: str, openai_api_key: Optional[str] = None,
+                 rpm: int = DEFAULT_RPM, tpm: int = DEFAULT_TPM, max_workers: int = 4):
         """
         Args:
             database_path: データベースファイルパス
             openai_api_key: OpenAI APIキー
+            rpm: 1分あたりのリクエスト数上限
+            tpm: 1分あたりのトークン数上限
+            max_workers: 並行して送信するバッチ数
         """
         self.db = Database(database_path)
-        self.openai_client = OpenAIClient(openai_api_key)
-        self.context_analyzer = ContextAnalyzer(openai_api_key)
+        self.openai_client = OpenAIClient(openai_api_key, rpm=rpm, tpm=tpm, max_workers=max_workers)
+        self.context_analyzer = ContextAnalyzer(openai_api_key, openai_client=self.openai_client)
         self.analysis_cache = {}
         
-    def analyze_all_places(self, limit: Optional[int] = None, confidence_threshold: float = 0.7, save_to_db: bool = False) -> List[PlaceAnalysis]:
+    def analyze_all_places(self, limit: Optional[int] = None, confidence_threshold: float = 0.7, save_to_db: bool = False,
+                           batch_size: int = 10) -> List[PlaceAnalysis]:
         """
         データベース内の全地名を分析
         
@@ -39,6 +44,7 @@ class PlaceCleaner:
             limit: 分析する地名数の上限
             confidence_threshold: 信頼度の閾値
             save_to_db: AI分析結果をデータベースに保存するか
+            batch_size: 1リクエストにまとめる地名数
             
         Returns:
             List[PlaceAnalysis]: 分析結果リスト
@@ -48,7 +54,7 @@ class PlaceCleaner:
         logger.info(f"地名データ取得完了: {len(places_data)}件")
         
         # GPT-3.5で一括分析
-        analyses = self.openai_client.batch_analyze_places(places_data)
+        analyses = self.openai_client.batch_analyze_places(places_data, batch_size=batch_size)
         
         # データベースに保存（オプション）
         if save_to_db:
@@ -15,11 +15,15 @@ Features:
 import asyncio
 import logging
 import re
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from dataclasses import dataclass
 import json
 
 from bungo_map.geo.enhanced_geocoding import GeocodingResult, EnhancedGeocodingService
+from bungo_map.utils.lru import LRUCache, MISS
+from bungo_map.geo.gazetteer import (
+    TOKYO_DETAIL_PLACES, KYOTO_DETAIL_PLACES, HOKKAIDO_PLACES, FOREIGN_PLACES
+)
 
 logger = logging.getLogger(__name__)
 
@@ -111,46 +115,24 @@ class ContextAwareGeocodingService:
         }
         
         # 東京詳細地名データベース
-        self.tokyo_detail_places = {
-            "本郷": (35.7081, 139.7619, "東京都文京区"),
-            "神田": (35.6918, 139.7648, "東京都千代田区"),
-            "青山": (35.6736, 139.7263, "東京都港区"),
-            "麻布": (35.6581, 139.7414, "東京都港区"),
-            "両国": (35.6967, 139.7933, "東京都墨田区"),
-            "赤坂": (35.6745, 139.7378, "東京都港区"),
-            "日本橋": (35.6813, 139.7744, "東京都中央区"),
-            "築地": (35.6654, 139.7707, "東京都中央区"),
-        }
+        self.tokyo_detail_places = TOKYO_DETAIL_PLACES
         
         # 京都詳細地名データベース
-        self.kyoto_detail_places = {
-            "伏見": (34.9393, 135.7578, "京都府京都市伏見区"),
-            "嵐山": (35.0088, 135.6761, "京都府京都市右京区"),
-            "清水": (34.9948, 135.7849, "京都府京都市東山区"),
-            "祇園": (35.0037, 135.7744, "京都府京都市東山区"),
-            "宇治": (34.8842, 135.7991, "京都府宇治市"),
-        }
+        self.kyoto_detail_places = KYOTO_DETAIL_PLACES
         
         # 北海道地名データベース  
-        self.hokkaido_places = {
-            "小樽": (43.1907, 140.9947, "北海道小樽市"),
-            "函館": (41.7687, 140.7291, "北海道函館市"),
-            "札幌": (43.0642, 141.3469, "北海道札幌市"),
-        }
+        self.hokkaido_places = HOKKAIDO_PLACES
         
         # 海外地名データベース（文学作品頻出）
-        self.foreign_places = {
-            "ローマ": (41.9028, 12.4964, "イタリア"),
-            "パリ": (48.8566, 2.3522, "フランス"),
-            "ロンドン": (51.5074, -0.1278, "イギリス"),
-            "ベルリン": (52.5200, 13.4050, "ドイツ"),
-            "ニューヨーク": (40.7128, -74.0060, "アメリカ"),
-            "上海": (31.2304, 121.4737, "中国"),
-            "ペキン": (39.9042, 116.4074, "中国"),
-            "北京": (39.9042, 116.4074, "中国"),
-            "モスクワ": (55.7558, 37.6176, "ロシア"),
-            "ウィーン": (48.2082, 16.3738, "オーストリア"),
-            "アテネ": (37.9838, 23.7275, "ギリシャ"),
+        self.foreign_places = FOREIGN_PLACES
+        
+        # (地名, 文脈シグネチャ) ごとの解決結果メモ（バッチ間で共有）
+        self._resolved = LRUCache(16384)
+        
+        # 一括Geocoding統計
+        self.batch_stats = {
+            'requests': 0,   # 入力地名数
+            'resolved': 0,   # 実際に解決した (地名, 文脈シグネチャ) 数
         }
         
         print("🤖 AI文脈判断型Geocodingサービス初期化完了")
@@ -281,6 +263,11 @@ class ContextAwareGeocodingService:
         # 1. 文脈分析
         context_analysis = self._analyze_context_rule_based(place_name, sentence, before_text, after_text)
         
+        return self._resolve_with_context(place_name, context_analysis)
+    
+    def _resolve_with_context(self, place_name: str, context_analysis: ContextAnalysisResult) -> EnhancedGeocodingResult:
+        """文脈分析結果に基づく座標解決"""
+        
         # 2. 地名でない場合は早期リターン
         if not context_analysis.is_place_name:
             return EnhancedGeocodingResult(
@@ -399,7 +386,53 @@ class ContextAwareGeocodingService:
         """同期版のエントリーポイント（既存インターフェース互換）"""
         
         result = self.enhanced_geocode_sync(place_name, sentence, before_text, after_text)
+        return self._to_geocoding_result(result)
+    
+    def geocode_places_batch(self, places: Iterable[Tuple[str, str, str, str]]) -> List[Optional[GeocodingResult]]:
+        """重複排除付き一括Geocoding
+        
+        (地名, 文脈シグネチャ) が同じ地名は座標解決を1回だけ行い、結果を共有する。
+        解決結果はインスタンス内のLRUに保持し、以降のバッチでも再利用する。
+        文脈シグネチャは解決結果を左右する文脈分析の判定部分のみから成る。
         
+        Args:
+            places: (地名, 文, 前文脈, 後文脈) のイテラブル
+        
+        Returns:
+            入力順に対応する GeocodingResult（失敗時は None）のリスト
+        """
+        results = []
+        
+        for place_name, sentence, before_text, after_text in places:
+            context_analysis = self._analyze_context_rule_based(
+                place_name, sentence or "", before_text or "", after_text or ""
+            )
+            key = (place_name, self._context_signature(context_analysis))
+            
+            result = self._resolved.get(key)
+            if result is MISS:
+                result = self._to_geocoding_result(
+                    self._resolve_with_context(place_name, context_analysis)
+                )
+                self._resolved.put(key, result)
+                self.batch_stats['resolved'] += 1
+            results.append(result)
+        
+        self.batch_stats['requests'] += len(results)
+        return results
+    
+    @staticmethod
+    def _context_signature(context_analysis: ContextAnalysisResult) -> Tuple:
+        """座標解決に影響する文脈分析結果（判断理由などの説明文は除く）"""
+        return (
+            context_analysis.is_place_name,
+            round(context_analysis.confidence, 4),
+            context_analysis.place_type,
+            context_analysis.suggested_location,
+        )
+    
+    def _to_geocoding_result(self, result: EnhancedGeocodingResult) -> Optional[GeocodingResult]:
+        """既存インターフェースの GeocodingResult へ変換"""
         if result.latitude is not None:
             return GeocodingResult(
                 place_name=result.place_name,
@@ -11,10 +11,74 @@ from typing import List, Dict, Set, Optional, Tuple
 from dataclasses import dataclass
 
 from bungo_map.core.models import Place
-from bungo_map.utils.aozora_text_cleaner import clean_aozora_sentence
+from bungo_map.processors.aozora_content_processor import ProcessedWork
+from bungo_map.utils.span_resolver import select_non_overlapping
 
 logger = logging.getLogger(__name__)
 
+# 都道府県の完全リスト
+PREFECTURES = (
+    '北海道', '青森', '岩手', '宮城', '秋田', '山形', '福島',
+    '茨城', '栃木', '群馬', '埼玉', '千葉', '東京', '神奈川',
+    '新潟', '富山', '石川', '福井', '山梨', '長野', '岐阜',
+    '静岡', '愛知', '三重', '滋賀', '京都', '大阪', '兵庫',
+    '奈良', '和歌山', '鳥取', '島根', '岡山', '広島', '山口',
+    '徳島', '香川', '愛媛', '高知', '福岡', '佐賀', '長崎',
+    '熊本', '大分', '宮崎', '鹿児島', '沖縄'
+)
+
+# 地名の前後文脈として保存する文字数
+CONTEXT_LENGTH = 20
+
+
+def build_trie_pattern(words) -> str:
+    """語の集合を共通接頭辞でまとめた正規表現（例: 福(?:井|岡|島)）に変換"""
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def render(node: Dict) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if '' in node else body
+    
+    return render(trie)
+
+
+# 都道府県名（北海道は接尾辞を含む）
+PREFECTURE_PATTERN = (
+    f"(?:北海道|{build_trie_pattern(pref for pref in PREFECTURES if pref != '北海道')}[都道府県])"
+)
+
+# 都道府県+郡+町村 / 都道府県+市区町村 / 市+区 を1回の走査で検出する統合パターン
+# 各位置で先読みするため重なり合う一致も拾える。各層は (?=(?P<x>...))(?P=x) の形で
+# 層ごとの最長一致に固定する（先読み内の一致は後から縮まないため、層をまたいだバックトラックはしない。
+# Python 3.10 では独占的グループ (?>...) が使えないための書き方）。
+# 市+区は漢字列の先頭からのみ照合する。
+COMPOUND_PLACE_PATTERN = re.compile(
+    r'(?=(?:'
+    rf'(?P<prefecture>{PREFECTURE_PATTERN})'
+    r'(?:(?=(?P<gun>[一-龯]{2,4}郡))(?P=gun)(?=(?P<village>[一-龯]{2,6}[町村]))(?P=village)'
+    r'|(?=(?P<city>[一-龯]{2,8}[市区町村]))(?P=city))'
+    r'|(?<![一-龯])(?=(?P<ward_city>[一-龯]{2,8}市))(?P=ward_city)(?=(?P<ward>[一-龯]{2,4}区))(?P=ward)'
+    r'))'
+)
+
+# lastgroup → (match_type, 信頼度, 構成要素 [(種別, グループ名)])
+COMPOUND_MATCH_TYPES = {
+    'village': ('prefecture_gun_village', 0.95,  # 3層構造は高信頼度
+                (('prefecture', 'prefecture'), ('gun', 'gun'), ('village', 'village'))),
+    'city': ('prefecture_city', 0.90,  # 2層構造
+             (('prefecture', 'prefecture'), ('city', 'city'))),
+    'ward': ('city_ward', 0.85,  # 市区構造
+             (('city', 'ward_city'), ('ward', 'ward'))),
+}
+
 @dataclass
 class PrecisePlaceMatch:
     """精密地名マッチ"""
@@ -31,206 +95,86 @@ class PreciseCompoundExtractor:
     def __init__(self, openai_api_key: str = None):
         self.ai_enabled = openai_api_key is not None
         
-        # 都道府県の完全リスト
-        self.prefectures = [
-            '北海道', '青森', '岩手', '宮城', '秋田', '山形', '福島',
-            '茨城', '栃木', '群馬', '埼玉', '千葉', '東京', '神奈川',
-            '新潟', '富山', '石川', '福井', '山梨', '長野', '岐阜',
-            '静岡', '愛知', '三重', '滋賀', '京都', '大阪', '兵庫',
-            '奈良', '和歌山', '鳥取', '島根', '岡山', '広島', '山口',
-            '徳島', '香川', '愛媛', '高知', '福岡', '佐賀', '長崎',
-            '熊本', '大分', '宮崎', '鹿児島', '沖縄'
-        ]
-        
-        # 都道府県接尾辞
-        self.prefecture_suffixes = ['都', '道', '府', '県']
-        
-        # 地名接尾辞
-        self.place_suffixes = ['市', '区', '町', '村', '郡']
-        
         logger.info(f"🎯 精密複合地名抽出器初期化完了 (AI機能: {'有効' if self.ai_enabled else '無効'})")
     
-    def extract_precise_places(self, work_id: int, text: str, aozora_url: str = None) -> List[Place]:
-        """精密複合地名抽出のメインメソッド"""
+    def extract_precise_places(self, work_id: int, text: str, aozora_url: str = None,
+                               processed: Optional[ProcessedWork] = None) -> List[Place]:
+        """精密複合地名抽出のメインメソッド
+        
+        processed（作品の前処理結果）を渡した場合はその文分割・クリーニング結果を使う。
+        """
         logger.info(f"🎯 精密地名抽出開始 (work_id: {work_id})")
         
-        if not text:
-            return []
+        if processed is None:
+            if not text:
+                return []
+            # 文に分割して処理（青空文庫テキストのクリーニング）
+            processed = ProcessedWork.from_text(work_id, text)
         
         places = []
         
-        # 文に分割して処理
-        sentences = re.split(r'[。！？]', text)
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) < 10:
-                continue
-            
-            # 青空文庫テキストのクリーニング
-            clean_sentence = clean_aozora_sentence(sentence)
+        for sentence_index, (_, clean_sentence) in enumerate(processed.sentence_pairs()):
             if len(clean_sentence) < 10:
                 continue
             
             # 複合地名パターンをクリーンアップされた文で検索
-            sentence_places = self._extract_from_sentence(work_id, clean_sentence, sentence, aozora_url)
+            sentence_places = self._extract_from_sentence(work_id, clean_sentence, aozora_url, sentence_index)
             places.extend(sentence_places)
         
-        # 重複排除と最適化
-        optimized_places = self._optimize_compound_places(places)
-        
-        logger.info(f"✅ 精密抽出完了: {len(optimized_places)}件")
-        return optimized_places
+        logger.info(f"✅ 精密抽出完了: {len(places)}件")
+        return places
 
-    def _extract_from_sentence(self, work_id: int, clean_sentence: str, original_sentence: str, aozora_url: str = None) -> List[Place]:
+    def _extract_from_sentence(self, work_id: int, clean_sentence: str, aozora_url: str = None,
+                               sentence_index: Optional[int] = None) -> List[Place]:
         """単一文からの地名抽出"""
-        places = []
-        
-        # 複合地名パターンで検索
-        for pattern_name, (pattern, confidence) in self.compound_patterns.items():
-            matches = re.finditer(pattern, clean_sentence)
-            for match in matches:
-                compound_place = match.group()
-                
-                # 地理的妥当性チェック
-                if self._validate_geographic_structure(compound_place):
-                    # 人名との区別チェック
-                    if not self._is_person_name(compound_place, clean_sentence):
-                        # 前後のコンテキスト取得（元の文から）
-                        before_text, after_text = self._get_context(original_sentence, compound_place)
-                        
-                        place = Place(
-                            work_id=work_id,
-                            place_name=compound_place,
-                            before_text=before_text,
-                            sentence=clean_sentence,  # クリーンアップされた文を保存
-                            after_text=after_text,
-                            aozora_url=aozora_url,
-                            confidence=confidence,
-                            extraction_method=pattern_name
-                        )
-                        places.append(place)
-        
-        return places
-    
-    def _find_prefecture_gun_village(self, sentence: str) -> List[PrecisePlaceMatch]:
-        """都道府県+郡+町村パターンの検出"""
-        matches = []
-        
-        for pref in self.prefectures:
-            # 都道府県名を検索
-            pref_pattern = f'{pref}[都道府県]'
-            pref_matches = list(re.finditer(pref_pattern, sentence))
-            
-            for pref_match in pref_matches:
-                pref_end = pref_match.end()
-                
-                # 都道府県の直後から郡を検索
-                remaining_text = sentence[pref_end:]
-                gun_pattern = r'([一-龯]{2,4}郡)'
-                gun_match = re.match(gun_pattern, remaining_text)
-                
-                if gun_match:
-                    gun_end = pref_end + gun_match.end()
-                    
-                    # 郡の直後から町村を検索
-                    remaining_text2 = sentence[gun_end:]
-                    village_pattern = r'([一-龯]{2,6}[町村])'
-                    village_match = re.match(village_pattern, remaining_text2)
-                    
-                    if village_match:
-                        # 完全な複合地名を構築
-                        full_name = sentence[pref_match.start():gun_end + village_match.end()]
-                        
-                        # 境界チェック
-                        if self._check_boundaries(sentence, pref_match.start(), gun_end + village_match.end()):
-                            match = PrecisePlaceMatch(
-                                full_name=full_name,
-                                start_pos=pref_match.start(),
-                                end_pos=gun_end + village_match.end(),
-                                confidence=0.95,  # 3層構造は高信頼度
-                                match_type="prefecture_gun_village",
-                                components=[
-                                    {'type': 'prefecture', 'text': pref_match.group()},
-                                    {'type': 'gun', 'text': gun_match.group()},
-                                    {'type': 'village', 'text': village_match.group()}
-                                ]
-                            )
-                            matches.append(match)
-        
-        return matches
-    
-    def _find_prefecture_city(self, sentence: str) -> List[PrecisePlaceMatch]:
-        """都道府県+市区町村パターンの検出"""
-        matches = []
+        matches = self._filter_and_deduplicate(self._find_compound_matches(clean_sentence), clean_sentence)
         
-        for pref in self.prefectures:
-            pref_pattern = f'{pref}[都道府県]'
-            pref_matches = list(re.finditer(pref_pattern, sentence))
+        places = []
+        for match in matches:
+            # 前後のコンテキスト（一致位置から切り出す）
+            before_text = clean_sentence[max(0, match.start_pos - CONTEXT_LENGTH):match.start_pos].strip()
+            after_text = clean_sentence[match.end_pos:match.end_pos + CONTEXT_LENGTH].strip()
             
-            for pref_match in pref_matches:
-                pref_end = pref_match.end()
-                
-                # 都道府県の直後から市区町村を検索
-                remaining_text = sentence[pref_end:]
-                city_pattern = r'([一-龯]{2,8}[市区町村])'
-                city_match = re.match(city_pattern, remaining_text)
-                
-                if city_match:
-                    # 完全な複合地名を構築
-                    full_name = sentence[pref_match.start():pref_end + city_match.end()]
-                    
-                    # 境界チェック
-                    if self._check_boundaries(sentence, pref_match.start(), pref_end + city_match.end()):
-                        match = PrecisePlaceMatch(
-                            full_name=full_name,
-                            start_pos=pref_match.start(),
-                            end_pos=pref_end + city_match.end(),
-                            confidence=0.90,  # 2層構造
-                            match_type="prefecture_city",
-                            components=[
-                                {'type': 'prefecture', 'text': pref_match.group()},
-                                {'type': 'city', 'text': city_match.group()}
-                            ]
-                        )
-                        matches.append(match)
+            places.append(Place(
+                work_id=work_id,
+                place_name=match.full_name,
+                before_text=before_text,
+                sentence=clean_sentence,  # クリーンアップされた文を保存
+                after_text=after_text,
+                aozora_url=aozora_url,
+                confidence=match.confidence,
+                extraction_method=f"precise_compound_{match.match_type}",
+                sentence_index=sentence_index,
+                start_pos=match.start_pos,
+                end_pos=match.end_pos
+            ))
         
-        return matches
+        return places
     
-    def _find_city_ward(self, sentence: str) -> List[PrecisePlaceMatch]:
-        """市+区パターンの検出"""
+    def _find_compound_matches(self, sentence: str) -> List[PrecisePlaceMatch]:
+        """都道府県+郡+町村・都道府県+市区町村・市+区パターンを1回の走査で検出"""
         matches = []
         
-        # 市を検索
-        city_pattern = r'([一-龯]{2,8}市)'
-        city_matches = list(re.finditer(city_pattern, sentence))
-        
-        for city_match in city_matches:
-            city_end = city_match.end()
+        for found in COMPOUND_PLACE_PATTERN.finditer(sentence):
+            match_type, confidence, layers = COMPOUND_MATCH_TYPES[found.lastgroup]
+            start = found.start(layers[0][1])
+            end = found.end(layers[-1][1])
             
-            # 市の直後から区を検索
-            remaining_text = sentence[city_end:]
-            ward_pattern = r'([一-龯]{2,4}区)'
-            ward_match = re.match(ward_pattern, remaining_text)
+            # 境界チェック
+            if not self._check_boundaries(sentence, start, end):
+                continue
             
-            if ward_match:
-                # 完全な複合地名を構築
-                full_name = sentence[city_match.start():city_end + ward_match.end()]
-                
-                # 境界チェック
-                if self._check_boundaries(sentence, city_match.start(), city_end + ward_match.end()):
-                    match = PrecisePlaceMatch(
-                        full_name=full_name,
-                        start_pos=city_match.start(),
-                        end_pos=city_end + ward_match.end(),
-                        confidence=0.85,  # 市区構造
-                        match_type="city_ward",
-                        components=[
-                            {'type': 'city', 'text': city_match.group()},
-                            {'type': 'ward', 'text': ward_match.group()}
-                        ]
-                    )
-                    matches.append(match)
+            matches.append(PrecisePlaceMatch(
+                full_name=sentence[start:end],
+                start_pos=start,
+                end_pos=end,
+                confidence=confidence,
+                match_type=match_type,
+                components=[
+                    {'type': component_type, 'text': found.group(group)}
+                    for component_type, group in layers
+                ]
+            ))
         
         return matches
     
@@ -287,38 +231,12 @@ class PreciseCompoundExtractor:
         if self.ai_enabled:
             matches = self._ai_context_filter(matches, sentence)
         
-        # 重複排除（包含関係を考慮）
-        filtered = []
-        
-        # 信頼度と長さでソート
-        sorted_matches = sorted(matches, key=lambda m: (-m.confidence, -len(m.full_name)))
-        
-        for match in sorted_matches:
-            # 既存の地名に包含されるかチェック
-            is_contained = False
-            for existing in filtered:
-                if (match.start_pos >= existing.start_pos and 
-                    match.end_pos <= existing.end_pos and
-                    match.full_name != existing.full_name):
-                    is_contained = True
-                    break
-            
-            if not is_contained:
-                # 現在の地名が既存の地名を包含するかチェック
-                to_remove = []
-                for i, existing in enumerate(filtered):
-                    if (existing.start_pos >= match.start_pos and
-                        existing.end_pos <= match.end_pos and
-                        existing.full_name != match.full_name):
-                        to_remove.append(i)
-                
-                # 包含される地名を削除
-                for i in reversed(to_remove):
-                    filtered.pop(i)
-                
-                filtered.append(match)
-        
-        return filtered
+        # 重複排除（文中位置が重なる場合は長い地名・高信頼度を優先）
+        return select_non_overlapping(
+            matches,
+            span=lambda m: (m.start_pos, m.end_pos),
+            rank=lambda m: (-len(m.full_name), -m.confidence)
+        )
     
     def _ai_context_filter(self, matches: List[PrecisePlaceMatch], sentence: str) -> List[PrecisePlaceMatch]:
         """AI文脈フィルタリング"""
@@ -0,0 +1,268 @@
+"""
+非同期ジオコーディングプロバイダー
+
+aiohttpによる並行ジオコーディング
+- プロバイダーごとのトークンバケット式レート制限と同時接続数制限
+- ジッター付き指数バックオフによる再試行
+- プロバイダーのフォールバックチェーン
+- 同期版プロバイダーと共通のGeocodingキャッシュ（SQLiteの参照・保存はスレッドで実行し、イベントループを止めない）
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import asdict
+from typing import Any, Dict, Iterable, List, Optional
+
+import aiohttp
+
+from bungo_map.geo.geocoding_cache import GeocodingCache, MISS, get_geocoding_cache
+from .providers import GeocodingResult, NominatimProvider, GoogleProvider
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RetryableError(Exception):
+    """再試行すべき一時的なエラー（429・5xx等）"""
+
+
+class TokenBucket:
+    """トークンバケット式レート制限
+
+    rate 個/秒でトークンを補充し、最大 capacity 個まで貯める。
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError("rate は正の値である必要があります")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """トークンを1つ取得（不足時は補充まで待機）"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AsyncGeocodingProvider:
+    """非同期ジオコーディングプロバイダーの基底クラス
+
+    サブクラスは name・build_request・parse_response を実装する。
+    base_url を差し替えることでローカルのスタブサーバーに向けられる。
+    """
+
+    name = 'base'
+
+    def __init__(self, base_url: str, rate: float = 1.0, burst: int = 1,
+                 max_concurrency: int = 1, max_retries: int = 3,
+                 backoff_base: float = 0.5, timeout: float = 10.0):
+        self.base_url = base_url
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.timeout = timeout
+
+        self._bucket: Optional[TokenBucket] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # 統計情報
+        self.stats = {
+            'requests': 0,
+            'retries': 0,
+            'successes': 0,
+            'not_found': 0,
+            'errors': 0,
+        }
+
+    def open(self) -> None:
+        """イベントループごとのレート制限・同時接続制限を初期化"""
+        self._bucket = TokenBucket(self.rate, self.burst)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def build_request(self, place_name: str) -> Dict[str, Any]:
+        """aiohttp の get() に渡す params・headers"""
+        raise NotImplementedError
+
+    def parse_response(self, data: Any) -> Optional[GeocodingResult]:
+        """APIレスポンス（JSON）を GeocodingResult に変換（該当なしは None）"""
+        raise NotImplementedError
+
+    async def geocode(self, session: aiohttp.ClientSession, place_name: str) -> Optional[GeocodingResult]:
+        """地名をジオコーディング（再試行を使い切った場合は例外を送出）"""
+        data = await self._fetch_json(session, self.build_request(place_name))
+        result = self.parse_response(data)
+        self.stats['successes' if result else 'not_found'] += 1
+        return result
+
+    async def _fetch_json(self, session: aiohttp.ClientSession, request: Dict[str, Any]) -> Any:
+        """レート制限・再試行付きのGETリクエスト"""
+        for attempt in range(self.max_retries + 1):
+            await self._bucket.acquire()
+            try:
+                async with self._semaphore:
+                    self.stats['requests'] += 1
+                    async with session.get(
+                        self.base_url,
+                        timeout=aiohttp.ClientTimeout(total=self.timeout),
+                        **request
+                    ) as response:
+                        if response.status == 429 or response.status >= 500:
+                            raise RetryableError(f"HTTP {response.status}")
+                        response.raise_for_status()
+                        return await response.json(content_type=None)
+
+            except (RetryableError, aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == self.max_retries:
+                    self.stats['errors'] += 1
+                    raise
+                # フルジッター付き指数バックオフ
+                delay = random.uniform(0, self.backoff_base * (2 ** attempt))
+                self.stats['retries'] += 1
+                logger.debug(f"{self.name}: {e} - {delay:.2f}秒後に再試行 ({attempt + 1}/{self.max_retries})")
+                await asyncio.sleep(delay)
+
+            except aiohttp.ClientError:
+                self.stats['errors'] += 1
+                raise
+
+
+class AsyncNominatimProvider(AsyncGeocodingProvider):
+    """OpenStreetMap Nominatim API 非同期プロバイダー（無料・1リクエスト/秒）"""
+
+    name = 'nominatim'
+
+    def __init__(self, user_agent: str = "BungoMap/1.0",
+                 base_url: str = "https://nominatim.openstreetmap.org/search", **kwargs):
+        kwargs.setdefault('rate', 1.0)  # 利用規約準拠
+        kwargs.setdefault('max_concurrency', 1)
+        super().__init__(base_url, **kwargs)
+        self.user_agent = user_agent
+
+    def build_request(self, place_name: str) -> Dict[str, Any]:
+        return {
+            'params': NominatimProvider.build_params(place_name),
+            'headers': {'User-Agent': self.user_agent},
+        }
+
+    def parse_response(self, data: Any) -> Optional[GeocodingResult]:
+        return NominatimProvider.parse_response(data)
+
+
+class AsyncGoogleProvider(AsyncGeocodingProvider):
+    """Google Geocoding API 非同期プロバイダー（有料）"""
+
+    name = 'google'
+
+    def __init__(self, api_key: str,
+                 base_url: str = "https://maps.googleapis.com/maps/api/geocode/json", **kwargs):
+        kwargs.setdefault('rate', 25.0)
+        kwargs.setdefault('burst', 5)
+        kwargs.setdefault('max_concurrency', 5)
+        super().__init__(base_url, **kwargs)
+        self.api_key = api_key
+
+    def build_request(self, place_name: str) -> Dict[str, Any]:
+        return {'params': GoogleProvider.build_params(place_name, self.api_key)}
+
+    def parse_response(self, data: Any) -> Optional[GeocodingResult]:
+        return GoogleProvider.parse_response(data)
+
+
+class AsyncGeocodingPipeline:
+    """フォールバックチェーン付き非同期ジオコーディング
+
+    地名ごとにプロバイダーを先頭から順に試し、最初に得られた結果を採用する。
+    該当なし・エラーの場合は次のプロバイダーへ進む。
+    """
+
+    def __init__(self, providers: List[AsyncGeocodingProvider],
+                 cache: Optional[GeocodingCache] = None, use_cache: bool = True):
+        if not providers:
+            raise ValueError("プロバイダーを1つ以上指定してください")
+        self.providers = providers
+        self.cache = (cache or get_geocoding_cache()) if use_cache else None
+
+        # 統計情報
+        self.stats = {
+            'places': 0,
+            'cache_hits': 0,
+            'resolved': 0,
+            'unresolved': 0,
+            'fallbacks': 0,
+        }
+
+    async def _geocode_one(self, session: aiohttp.ClientSession, place_name: str) -> Optional[GeocodingResult]:
+        """1地名をフォールバックチェーンで解決"""
+        for index, provider in enumerate(self.providers):
+            if index > 0:
+                self.stats['fallbacks'] += 1
+
+            if self.cache is not None:
+                cached = await asyncio.to_thread(self.cache.get, place_name, provider.name)
+                if cached is not MISS:
+                    self.stats['cache_hits'] += 1
+                    if cached is not None:
+                        return GeocodingResult(**cached)
+                    continue
+
+            try:
+                result = await provider.geocode(session, place_name)
+            except Exception as e:
+                # 一時的な障害はキャッシュせず次のプロバイダーへ
+                logger.warning(f"{provider.name} ジオコーディング失敗: {place_name} - {e}")
+                continue
+
+            if self.cache is not None:
+                await asyncio.to_thread(
+                    self.cache.set, place_name, provider.name, asdict(result) if result else None
+                )
+            if result:
+                return result
+
+        return None
+
+    async def geocode_many(self, place_names: Iterable[str]) -> Dict[str, Optional[GeocodingResult]]:
+        """複数地名を並行してジオコーディング（重複地名は1回のみ）"""
+        unique_names = list(dict.fromkeys(place_names))
+        self.stats['places'] += len(unique_names)
+
+        for provider in self.providers:
+            provider.open()
+
+        async with aiohttp.ClientSession() as session:
+            results = await asyncio.gather(
+                *(self._geocode_one(session, name) for name in unique_names)
+            )
+
+        resolved = dict(zip(unique_names, results))
+        succeeded = sum(1 for result in results if result)
+        self.stats['resolved'] += succeeded
+        self.stats['unresolved'] += len(results) - succeeded
+        return resolved
+
+    def run(self, place_names: Iterable[str]) -> Dict[str, Optional[GeocodingResult]]:
+        """同期コードからの実行用ラッパー"""
+        return asyncio.run(self.geocode_many(place_names))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """パイプライン・プロバイダー別の統計"""
+        stats = dict(self.stats)
+        stats['providers'] = {provider.name: dict(provider.stats) for provider in self.providers}
+        if self.cache is not None:
+            stats['cache'] = self.cache.get_stats()
+        return stats
@@ -85,10 +85,26 @@ class PlaceGeocoder:
         
         return results
     
+    @staticmethod
+    def _search_name(place_record: PlaceRecord) -> str:
+        """検索に使う地名（正規化名を優先使用）"""
+        return place_record.ai_normalized_name or place_record.place_name
+    
+    def build_async_pipeline(self):
+        """非同期パイプライン（Nominatim → Google のフォールバックチェーン）"""
+        from .async_providers import (
+            AsyncGeocodingPipeline, AsyncNominatimProvider, AsyncGoogleProvider
+        )
+        
+        providers = [AsyncNominatimProvider(user_agent=self.nominatim.user_agent)]
+        if self.google:
+            providers.append(AsyncGoogleProvider(self.google.api_key))
+        
+        return AsyncGeocodingPipeline(providers, cache=self.nominatim.cache)
+    
     def geocode_place(self, place_record: PlaceRecord) -> Optional[GeocodingResult]:
         """単一地名のジオコーディング"""
-        # 正規化名を優先使用
-        search_name = place_record.ai_normalized_name or place_record.place_name
+        search_name = self._search_name(place_record)
         
         logger.info(f"ジオコーディング: {search_name} (信頼度: {place_record.ai_confidence:.2f})")
         
@@ -105,8 +121,12 @@ class PlaceGeocoder:
     def batch_geocode(self, 
                      min_ai_confidence: float = 0.7,
                      limit: Optional[int] = None,
-                     dry_run: bool = False) -> Dict[str, Any]:
-        """バッチジオコーディング実行"""
+                     dry_run: bool = False,
+                     use_async: bool = False) -> Dict[str, Any]:
+        """バッチジオコーディング実行
+        
+        use_async=True の場合は非同期パイプラインで全地名を並行して解決してから反映する。
+        """
         places = self.get_places_for_geocoding(min_ai_confidence, limit=limit)
         
         results = {
@@ -119,6 +139,16 @@ class PlaceGeocoder:
         
         logger.info(f"ジオコーディング開始: {len(places)}件")
         
+        # 非同期モード: 架空地名以外を一括で先に解決
+        resolved = None
+        if use_async:
+            pipeline = self.build_async_pipeline()
+            resolved = pipeline.run(
+                self._search_name(place) for place in places
+                if place.ai_place_type != 'fictional'
+            )
+            results['async_stats'] = pipeline.get_stats()
+        
         for place in places:
             results['total_processed'] += 1
             
@@ -129,7 +159,10 @@ class PlaceGeocoder:
                     self._update_geocoding_status(place.place_id, 'skipped', 'fictional')
                 continue
             
-            geocoding_result = self.geocode_place(place)
+            if resolved is not None:
+                geocoding_result = resolved.get(self._search_name(place))
+            else:
+                geocoding_result = self.geocode_place(place)
             
             if geocoding_result:
                 results['successful'] += 1
@@ -154,7 +187,10 @@ class PlaceGeocoder:
                 
                 logger.warning(f"失敗: {place.place_name}")
         
+        results['cache_stats'] = self.nominatim.cache.get_stats()
+        
         logger.info(f"ジオコーディング完了: 成功 {results['successful']}, 失敗 {results['failed']}, スキップ {results['skipped']}")
+        logger.info(f"キャッシュヒット率: {results['cache_stats']['hit_rate']:.1f}%")
         return results
     
     def _save_geocoding_result(self, place_id: int, result: GeocodingResult):
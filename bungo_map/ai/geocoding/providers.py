@@ -10,6 +10,8 @@ from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
+from bungo_map.geo.geocoding_cache import GeocodingCache, get_geocoding_cache
+
 @dataclass
 class GeocodingResult:
     """ジオコーディング結果"""
@@ -31,61 +33,80 @@ class GeocodingProvider(ABC):
 class NominatimProvider(GeocodingProvider):
     """OpenStreetMap Nominatim API プロバイダー（無料）"""
     
-    def __init__(self, user_agent: str = "BungoMap/1.0"):
+    def __init__(self, user_agent: str = "BungoMap/1.0", cache: Optional[GeocodingCache] = None):
         self.base_url = "https://nominatim.openstreetmap.org/search"
         self.user_agent = user_agent
         self.rate_limit_delay = 1.0  # 1秒間隔（利用規約準拠）
+        self.cache = cache or get_geocoding_cache()
+        self._last_request_at = 0.0
         
     def geocode(self, place_name: str, context: str = "") -> Optional[GeocodingResult]:
-        """Nominatim APIで地名をジオコーディング"""
+        """Nominatim APIで地名をジオコーディング（キャッシュ経由）"""
         try:
-            # 日本に限定した検索クエリ
-            query = f"{place_name}, Japan"
-            
-            params = {
-                'q': query,
-                'format': 'json',
-                'limit': 1,
-                'countrycodes': 'jp',  # 日本に限定
-                'addressdetails': 1
-            }
-            
-            headers = {'User-Agent': self.user_agent}
-            
-            response = requests.get(
-                self.base_url,
-                params=params,
-                headers=headers,
-                timeout=10
+            return self.cache.get_or_geocode(
+                place_name, 'nominatim', lambda: self._request(place_name), GeocodingResult
             )
-            
-            response.raise_for_status()
-            results = response.json()
-            
-            if results:
-                result = results[0]
-                
-                # 精度判定
-                accuracy = self._determine_accuracy(result)
-                
-                return GeocodingResult(
-                    latitude=float(result['lat']),
-                    longitude=float(result['lon']),
-                    accuracy=accuracy,
-                    address=result.get('display_name', ''),
-                    provider='nominatim',
-                    confidence=float(result.get('importance', 0.5))
-                )
-            
-            # レート制限遵守
-            time.sleep(self.rate_limit_delay)
-            return None
-            
         except Exception as e:
             print(f"Nominatim geocoding error for {place_name}: {str(e)}")
             return None
     
-    def _determine_accuracy(self, result: Dict[str, Any]) -> str:
+    def _wait_for_rate_limit(self) -> None:
+        """前回リクエストから rate_limit_delay 秒経過するまで待機"""
+        wait = self._last_request_at + self.rate_limit_delay - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_request_at = time.monotonic()
+    
+    def _request(self, place_name: str) -> Optional[GeocodingResult]:
+        """Nominatim APIへの問い合わせ（通信エラーは例外として送出）"""
+        # レート制限遵守（実際にAPIを呼ぶ場合のみ）
+        self._wait_for_rate_limit()
+        
+        headers = {'User-Agent': self.user_agent}
+        
+        response = requests.get(
+            self.base_url,
+            params=self.build_params(place_name),
+            headers=headers,
+            timeout=10
+        )
+        
+        response.raise_for_status()
+        return self.parse_response(response.json())
+    
+    @staticmethod
+    def build_params(place_name: str) -> Dict[str, Any]:
+        """検索パラメータ（日本に限定）"""
+        return {
+            'q': f"{place_name}, Japan",
+            'format': 'json',
+            'limit': 1,
+            'countrycodes': 'jp',  # 日本に限定
+            'addressdetails': 1
+        }
+    
+    @classmethod
+    def parse_response(cls, results: list) -> Optional[GeocodingResult]:
+        """APIレスポンス（JSON）を GeocodingResult に変換（該当なしは None）"""
+        if results:
+            result = results[0]
+            
+            # 精度判定
+            accuracy = cls._determine_accuracy(result)
+            
+            return GeocodingResult(
+                latitude=float(result['lat']),
+                longitude=float(result['lon']),
+                accuracy=accuracy,
+                address=result.get('display_name', ''),
+                provider='nominatim',
+                confidence=float(result.get('importance', 0.5))
+            )
+        
+        return None
+    
+    @staticmethod
+    def _determine_accuracy(result: Dict[str, Any]) -> str:
         """結果の精度を判定"""
         place_rank = result.get('place_rank', 30)
         osm_type = result.get('osm_type', '')
@@ -100,51 +121,64 @@ class NominatimProvider(GeocodingProvider):
 class GoogleProvider(GeocodingProvider):
     """Google Geocoding API プロバイダー（有料）"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache: Optional[GeocodingCache] = None):
         self.api_key = api_key
         self.base_url = "https://maps.googleapis.com/maps/api/geocode/json"
+        self.cache = cache or get_geocoding_cache()
         
     def geocode(self, place_name: str, context: str = "") -> Optional[GeocodingResult]:
-        """Google Geocoding APIで地名をジオコーディング"""
+        """Google Geocoding APIで地名をジオコーディング（キャッシュ経由）"""
         try:
-            # 日本に限定した検索
-            query = f"{place_name}, Japan"
-            
-            params = {
-                'address': query,
-                'key': self.api_key,
-                'region': 'jp',
-                'language': 'ja'
-            }
-            
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data['status'] == 'OK' and data['results']:
-                result = data['results'][0]
-                location = result['geometry']['location']
-                
-                # 精度判定
-                accuracy = self._determine_accuracy(result)
-                
-                return GeocodingResult(
-                    latitude=location['lat'],
-                    longitude=location['lng'],
-                    accuracy=accuracy,
-                    address=result['formatted_address'],
-                    provider='google',
-                    confidence=1.0  # Googleは常に高信頼度
-                )
-            
-            return None
-            
+            return self.cache.get_or_geocode(
+                place_name, 'google', lambda: self._request(place_name), GeocodingResult
+            )
         except Exception as e:
             print(f"Google geocoding error for {place_name}: {str(e)}")
             return None
     
-    def _determine_accuracy(self, result: Dict[str, Any]) -> str:
+    def _request(self, place_name: str) -> Optional[GeocodingResult]:
+        """Google Geocoding APIへの問い合わせ（通信エラーは例外として送出）"""
+        response = requests.get(self.base_url, params=self.build_params(place_name, self.api_key), timeout=10)
+        response.raise_for_status()
+        return self.parse_response(response.json())
+    
+    @staticmethod
+    def build_params(place_name: str, api_key: str) -> Dict[str, Any]:
+        """検索パラメータ（日本に限定）"""
+        return {
+            'address': f"{place_name}, Japan",
+            'key': api_key,
+            'region': 'jp',
+            'language': 'ja'
+        }
+    
+    @classmethod
+    def parse_response(cls, data: Dict[str, Any]) -> Optional[GeocodingResult]:
+        """APIレスポンス（JSON）を GeocodingResult に変換（該当なしは None）"""
+        # 該当なし以外のエラー（クォータ超過等）はネガティブキャッシュしない
+        if data['status'] not in ('OK', 'ZERO_RESULTS'):
+            raise RuntimeError(f"Google Geocoding API status: {data['status']}")
+        
+        if data['status'] == 'OK' and data['results']:
+            result = data['results'][0]
+            location = result['geometry']['location']
+            
+            # 精度判定
+            accuracy = cls._determine_accuracy(result)
+            
+            return GeocodingResult(
+                latitude=location['lat'],
+                longitude=location['lng'],
+                accuracy=accuracy,
+                address=result['formatted_address'],
+                provider='google',
+                confidence=1.0  # Googleは常に高信頼度
+            )
+        
+        return None
+    
+    @staticmethod
+    def _determine_accuracy(result: Dict[str, Any]) -> str:
         """結果の精度を判定"""
         location_type = result.get('geometry', {}).get('location_type', '')
         
@@ -15,6 +15,8 @@ from bungo_map.extractors.simple_place_extractor import SimplePlaceExtractor
 from bungo_map.ai.validators.context_analyzer import ContextAnalyzer
 from bungo_map.ai.cleaners.place_cleaner import PlaceCleaner
 from bungo_map.ai.extractors.precise_compound_extractor import PreciseCompoundExtractor
+from bungo_map.processors.aozora_content_processor import ProcessedWork
+from bungo_map.utils.span_resolver import METHOD_PRIORITY, resolve_overlaps
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,9 @@ class ExtractionResult:
     category: str
     reasoning: str = ""
     is_valid: bool = True
+    sentence_index: Optional[int] = None  # 作品内の文番号（不明な場合は None）
+    start_pos: Optional[int] = None  # sentence 内の位置（不明な場合は None）
+    end_pos: Optional[int] = None
 
 class ExtractionCoordinator:
     """地名抽出の統合調整システム"""
@@ -57,17 +62,17 @@ class ExtractionCoordinator:
         self.method_configs = {
             ExtractionMethod.REGEX: {
                 "base_reliability": 0.95,  # Regex系は高精度維持
-                "priority": 1,             # 最高優先度維持
+                "priority": METHOD_PRIORITY['regex'],        # 最高優先度維持
                 "trust_threshold": 0.6     # 閾値を緩和（0.7→0.6）
             },
             ExtractionMethod.GINZA_NLP: {
                 "base_reliability": 0.75,  # 中程度の精度
-                "priority": 3,             # 優先度を下げる（AI複合地名抽出を優先）
+                "priority": METHOD_PRIORITY['ginza_nlp'],    # 優先度を下げる（AI複合地名抽出を優先）
                 "trust_threshold": 0.65    # 閾値を上げる（0.6→0.65）
             },
             ExtractionMethod.AI_COMPOUND: {
                 "base_reliability": 0.90,  # 高精度複合地名抽出
-                "priority": 2,             # Regexの次に高い優先度
+                "priority": METHOD_PRIORITY['ai_compound'],  # Regexの次に高い優先度
                 "trust_threshold": 0.7     # 高信頼度
             },
             ExtractionMethod.AI_CONTEXT: {
@@ -80,14 +85,21 @@ class ExtractionCoordinator:
         ai_status = "有効" if self.ai_enabled else "無効"
         logger.info(f"✅ 地名抽出統合システム初期化完了 (AI機能: {ai_status})")
     
-    def extract_and_coordinate(self, work_id: int, text: str, aozora_url: str = None) -> List[Place]:
-        """統合地名抽出の実行"""
+    def extract_and_coordinate(self, work_id: int, text: str, aozora_url: str = None,
+                               processed: Optional[ProcessedWork] = None) -> List[Place]:
+        """統合地名抽出の実行
+        
+        文分割・クリーニングは1回だけ行い（processed があればそれを使う）、全手法で共有する。
+        """
         logger.info(f"🎯 統合地名抽出開始 (work_id: {work_id})")
         
+        if processed is None:
+            processed = ProcessedWork.from_text(work_id, text)
+        
         # 各手法での抽出実行
-        regex_results = self._extract_with_regex(work_id, text, aozora_url)
-        ginza_results = self._extract_with_ginza(work_id, text, aozora_url)
-        compound_results = self._extract_with_ai_compound(work_id, text, aozora_url)  # 新追加
+        regex_results = self._extract_with_regex(work_id, processed, aozora_url)
+        ginza_results = self._extract_with_ginza(work_id, processed, aozora_url)
+        compound_results = self._extract_with_ai_compound(work_id, processed, aozora_url)  # 新追加
         
         # 結果の統合と調整
         coordinated_results = self._coordinate_results(regex_results, ginza_results, compound_results, text)
@@ -101,9 +113,11 @@ class ExtractionCoordinator:
         logger.info(f"✅ 統合抽出完了: {len(final_places)}件")
         return final_places
     
-    def _extract_with_regex(self, work_id: int, text: str, aozora_url: str) -> List[ExtractionResult]:
+    def _extract_with_regex(self, work_id: int, processed: ProcessedWork, aozora_url: str) -> List[ExtractionResult]:
         """Regex抽出"""
-        places = self.regex_extractor.extract_places_from_text(work_id, text, aozora_url)
+        places = self.regex_extractor.extract_places_from_sentences(
+            work_id, processed.sentence_pairs(), aozora_url
+        )
         
         results = []
         for place in places:
@@ -124,50 +138,63 @@ class ExtractionCoordinator:
                 before_text=place.before_text,
                 after_text=place.after_text,
                 category=category,
-                reasoning=f"Regex抽出: {category}"
+                reasoning=f"Regex抽出: {category}",
+                sentence_index=place.sentence_index,
+                start_pos=place.start_pos,
+                end_pos=place.end_pos
             ))
         
         logger.info(f"📍 Regex抽出: {len(results)}件")
         return results
     
-    def _extract_with_ginza(self, work_id: int, text: str, aozora_url: str) -> List[ExtractionResult]:
+    def _extract_with_ginza(self, work_id: int, processed: ProcessedWork, aozora_url: str) -> List[ExtractionResult]:
         """GinzaNLP抽出（シミュレート）"""
         # 実際のGinzaNLP抽出は既存システムを使用
         # ここでは問題のある抽出例をシミュレート
         
-        # データベースからginza_nlp結果を取得してシミュレート
+        # データベースからginza_nlp結果を取得してシミュレート（地名, 誤抽出の種類）
         known_ginza_issues = [
-            ("萩", "plant", "大きな萩が人の背より高く延びて"),
-            ("柏", "building_part", "高柏寺の五重の塔"),
-            ("東", "direction", "東から西へ貫いた廊下"),
-            ("都", "general_noun", "都のまん中に立って")
+            ("萩", "plant"),
+            ("柏", "building_part"),
+            ("東", "direction"),
+            ("都", "general_noun")
         ]
         
         results = []
-        for place_name, issue_type, context in known_ginza_issues:
-            if place_name in text:
+        for place_name, issue_type in known_ginza_issues:
+            # 共有の文分割・クリーニング結果から最初に現れる文を採用
+            for sentence_index, clean_sentence in enumerate(processed.cleaned_sentences):
+                start = clean_sentence.find(place_name)
+                if start < 0:
+                    continue
                 results.append(ExtractionResult(
                     place_name=place_name,
                     confidence=0.6,  # GinzaNLPの標準信頼度
                     extraction_method=ExtractionMethod.GINZA_NLP,
                     original_confidence=0.6,
-                    sentence=context,
+                    sentence=clean_sentence,
                     before_text="",
                     after_text="",
                     category="地名候補",
-                    reasoning=f"GinzaNLP抽出: {issue_type}の可能性"
+                    reasoning=f"GinzaNLP抽出: {issue_type}の可能性",
+                    sentence_index=sentence_index,
+                    start_pos=start,
+                    end_pos=start + len(place_name)
                 ))
+                break
         
         logger.info(f"📍 GinzaNLP抽出: {len(results)}件")
         return results
     
-    def _extract_with_ai_compound(self, work_id: int, text: str, aozora_url: str) -> List[ExtractionResult]:
+    def _extract_with_ai_compound(self, work_id: int, processed: ProcessedWork, aozora_url: str) -> List[ExtractionResult]:
         """AI複合地名抽出"""
         if not self.ai_enabled:
             logger.info("⚠️  AI機能無効: 複合地名抽出をスキップ")
             return []
         
-        places = self.compound_extractor.extract_precise_places(work_id, text, aozora_url)
+        places = self.compound_extractor.extract_precise_places(
+            work_id, processed.main_content, aozora_url, processed=processed
+        )
         
         results = []
         for place in places:
@@ -184,7 +211,10 @@ class ExtractionCoordinator:
                 before_text=place.before_text,
                 after_text=place.after_text,
                 category=category,
-                reasoning=f"AI複合地名抽出: {category}"
+                reasoning=f"AI複合地名抽出: {category}",
+                sentence_index=place.sentence_index,
+                start_pos=place.start_pos,
+                end_pos=place.end_pos
             ))
         
         logger.info(f"📍 AI複合地名抽出: {len(results)}件")
@@ -194,62 +224,25 @@ class ExtractionCoordinator:
                           ginza_results: List[ExtractionResult], 
                           compound_results: List[ExtractionResult], 
                           text: str) -> List[ExtractionResult]:
-        """抽出結果の統合調整"""
+        """抽出結果の統合調整（文中位置の重なりを解消）"""
         logger.info("🔄 抽出結果の統合調整中...")
         
         # すべての結果をマージ
         all_results = regex_results + ginza_results + compound_results
         
-        # 文別にグループ化
-        by_sentence = {}
-        for result in all_results:
-            sentence_key = result.sentence[:50] if result.sentence else ""
-            if sentence_key not in by_sentence:
-                by_sentence[sentence_key] = []
-            by_sentence[sentence_key].append(result)
-        
-        coordinated = []
-        
-        for sentence, sentence_results in by_sentence.items():
-            if len(sentence_results) == 1:
-                coordinated.extend(sentence_results)
-                continue
-            
-            # 同じ地名の重複をチェック
-            by_place_name = {}
-            for result in sentence_results:
-                if result.place_name not in by_place_name:
-                    by_place_name[result.place_name] = []
-                by_place_name[result.place_name].append(result)
-            
-            for place_name, place_results in by_place_name.items():
-                if len(place_results) == 1:
-                    coordinated.extend(place_results)
-                else:
-                    # 手法の優先度で選択
-                    best_result = self._select_best_by_priority(place_results)
-                    coordinated.append(best_result)
+        # 文ごとに、位置の重なる結果から長い地名・高優先度の手法・高信頼度の順に採用
+        coordinated = resolve_overlaps(all_results, rank=self._result_rank)
         
         logger.info(f"✅ 統合調整完了: {len(coordinated)}件")
         return coordinated
     
-    def _select_best_by_priority(self, results: List[ExtractionResult]) -> ExtractionResult:
-        """優先度に基づく最適結果の選択"""
-        # 優先度順でソート（数値が小さいほど高優先度）
-        sorted_results = sorted(results, key=lambda r: (
-            self.method_configs[r.extraction_method]["priority"],
-            -r.confidence,
-            -len(r.place_name)
-        ))
-        
-        best = sorted_results[0]
-        
-        # 選択理由を更新
-        if len(results) > 1:
-            other_methods = [r.extraction_method.value for r in sorted_results[1:]]
-            best.reasoning += f" (優先選択: {', '.join(other_methods)}より高優先度)"
-        
-        return best
+    def _result_rank(self, result: ExtractionResult) -> Tuple[int, int, float]:
+        """統合時の優先順（数値が小さいほど高優先度）"""
+        return (
+            -len(result.place_name),
+            self.method_configs[result.extraction_method]["priority"],
+            -result.confidence
+        )
     
     def _apply_ai_validation(self, results: List[ExtractionResult]) -> List[ExtractionResult]:
         """AI文脈分析による品質向上"""
@@ -329,7 +322,9 @@ class ExtractionCoordinator:
                 after_text=result.after_text,
                 aozora_url=aozora_url,
                 confidence=result.confidence,
-                extraction_method=f"{result.extraction_method.value}_{result.category}_integrated"
+                extraction_method=f"{result.extraction_method.value}_{result.category}_integrated",
+                start_pos=result.start_pos,
+                end_pos=result.end_pos
             )
             places.append(place)
         
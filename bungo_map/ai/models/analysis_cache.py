@@ -0,0 +1,203 @@
+"""
+AI分析結果キャッシュ
+同一入力に対するGPT呼び出しを再実行しないための永続キャッシュ
+
+- hash(モデル, プロンプトテンプレート版, 正規化済み入力) をキーとするSQLite永続キャッシュ
+- 解析済みの分析結果（PlaceAnalysis・ContextAnalysis）をdictで保存
+- プロセス内LRUによる高速な再参照
+- 経過日数・テンプレート版による削除とヒット率統計
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from bungo_map.core.connection_pool import SQLiteConnectionPool
+from bungo_map.utils.lru import LRUCache, MISS
+
+DEFAULT_ANALYSIS_CACHE_PATH = os.getenv('BUNGO_AI_CACHE', 'data/ai_analysis_cache.db')
+
+
+def normalize_inputs(value: Any) -> Any:
+    """キャッシュキー用の入力正規化（文字列はNFKC・前後空白除去）"""
+    if isinstance(value, str):
+        return unicodedata.normalize('NFKC', value).strip()
+    if isinstance(value, dict):
+        return {key: normalize_inputs(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize_inputs(item) for item in value]
+    return value
+
+
+class AnalysisCache:
+    """AI分析結果の2層キャッシュ（プロセス内LRU + SQLite）
+
+    kind は分析の種類（'place_analysis' 等）、template_version はプロンプトの版。
+    プロンプトを変更した場合は版を上げることで古い結果が参照されなくなる。
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_ANALYSIS_CACHE_PATH,
+                 memory_size: int = 4096):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.memory = LRUCache(memory_size)
+        self.pool = SQLiteConnectionPool(self.db_path, pool_size=2)
+
+        # 統計情報
+        self.stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'writes': 0,
+        }
+
+        self._init_table()
+
+    def _init_table(self) -> None:
+        """キャッシュテーブル初期化"""
+        with self.pool.connection() as conn:
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS ai_analysis_cache (
+                cache_key TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                model TEXT NOT NULL,
+                template_version TEXT NOT NULL,
+                result_json TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ai_analysis_cache_kind "
+                "ON ai_analysis_cache(kind, template_version)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ai_analysis_cache_created "
+                "ON ai_analysis_cache(created_at)"
+            )
+            conn.commit()
+
+    @staticmethod
+    def make_key(kind: str, model: str, template_version: str, inputs: Dict[str, Any]) -> str:
+        """キャッシュキー生成"""
+        payload = json.dumps(
+            [kind, model, template_version, normalize_inputs(inputs)],
+            ensure_ascii=False, sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, kind: str, model: str, template_version: str, inputs: Dict[str, Any]):
+        """キャッシュ参照
+
+        Returns:
+            結果dict、未登録なら MISS
+        """
+        key = self.make_key(kind, model, template_version, inputs)
+
+        value = self.memory.get(key)
+        if value is not MISS:
+            self.stats['memory_hits'] += 1
+            return value
+
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT result_json FROM ai_analysis_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            self.stats['misses'] += 1
+            return MISS
+
+        value = json.loads(row[0])
+        self.memory.put(key, value)
+        self.stats['disk_hits'] += 1
+        return value
+
+    def set(self, kind: str, model: str, template_version: str,
+            inputs: Dict[str, Any], value: Dict[str, Any]) -> None:
+        """キャッシュ登録"""
+        key = self.make_key(kind, model, template_version, inputs)
+
+        with self.pool.connection() as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO ai_analysis_cache
+                   (cache_key, kind, model, template_version, result_json, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (key, kind, model, template_version,
+                 json.dumps(value, ensure_ascii=False), time.time())
+            )
+            conn.commit()
+
+        self.memory.put(key, value)
+        self.stats['writes'] += 1
+
+    def prune_older_than(self, max_age: float, kind: Optional[str] = None) -> int:
+        """作成から max_age 秒以上経過したエントリの削除"""
+        sql = "DELETE FROM ai_analysis_cache WHERE created_at < ?"
+        params: List[Any] = [time.time() - max_age]
+        if kind:
+            sql += " AND kind = ?"
+            params.append(kind)
+        return self._delete(sql, params)
+
+    def prune_template_versions(self, kind: str, keep_version: str) -> int:
+        """kind のうちテンプレート版が keep_version 以外のエントリの削除"""
+        return self._delete(
+            "DELETE FROM ai_analysis_cache WHERE kind = ? AND template_version != ?",
+            [kind, keep_version]
+        )
+
+    def clear(self) -> int:
+        """全エントリの削除"""
+        return self._delete("DELETE FROM ai_analysis_cache", [])
+
+    def _delete(self, sql: str, params: List[Any]) -> int:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(sql, params)
+            conn.commit()
+        # 削除された値がメモリ層から返らないよう破棄
+        self.memory.clear()
+        return cursor.rowcount
+
+    def size(self) -> int:
+        """永続キャッシュの件数"""
+        with self.pool.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM ai_analysis_cache").fetchone()[0]
+
+    def summarize(self) -> List[Tuple[str, str, str, int]]:
+        """(kind, model, template_version, 件数) の一覧"""
+        with self.pool.connection() as conn:
+            return [tuple(row) for row in conn.execute(
+                """SELECT kind, model, template_version, COUNT(*)
+                   FROM ai_analysis_cache
+                   GROUP BY kind, model, template_version
+                   ORDER BY kind, template_version"""
+            )]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ヒット率などの統計"""
+        hits = self.stats['memory_hits'] + self.stats['disk_hits']
+        lookups = hits + self.stats['misses']
+        return {
+            **self.stats,
+            'hits': hits,
+            'lookups': lookups,
+            'hit_rate': (hits / lookups * 100) if lookups else 0.0,
+        }
+
+
+_default_caches: Dict[str, AnalysisCache] = {}
+_default_lock = threading.Lock()
+
+
+def get_analysis_cache(db_path: Union[str, Path] = DEFAULT_ANALYSIS_CACHE_PATH) -> AnalysisCache:
+    """プロセス内で共有するキャッシュ（パスごとに1インスタンス）"""
+    key = str(Path(db_path).resolve())
+    with _default_lock:
+        if key not in _default_caches:
+            _default_caches[key] = AnalysisCache(db_path)
+        return _default_caches[key]
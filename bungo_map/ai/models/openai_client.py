@@ -5,14 +5,91 @@ OpenAI GPT-3.5 クライアント
 
 import os
 import json
+import threading
 import time
-from typing import Dict, List, Optional, Union
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar, Union
+from dataclasses import asdict, dataclass
 import openai
+from .analysis_cache import AnalysisCache, MISS, get_analysis_cache
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar('T')
+
+# gpt-3.5-turbo の標準的な利用枠に合わせた既定値
+DEFAULT_RPM = 500
+DEFAULT_TPM = 60000
+
+# 分析結果キャッシュの種類とプロンプト版（プロンプト変更時は版を上げる）
+PLACE_ANALYSIS_KIND = 'place_analysis'
+PLACE_PROMPT_VERSION = '1'
+
+
+def estimate_tokens(text: str) -> int:
+    """トークン数の概算（ASCIIは4文字≒1トークン、日本語は1文字≒1トークン）"""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (len(text) - ascii_chars) + ascii_chars // 4 + 1
+
+
+def extract_json(response: str) -> str:
+    """応答からJSON部分（コードブロック・前後の説明文を除く）を取り出す"""
+    text = response.strip()
+    if '```' in text:
+        text = text.split('```')[1]
+        if text.startswith('json'):
+            text = text[4:]
+        text = text.strip()
+    
+    starts = [i for i in (text.find('['), text.find('{')) if i >= 0]
+    if not starts:
+        return text
+    start = min(starts)
+    end = text.rfind(']' if text[start] == '[' else '}')
+    return text[start:end + 1] if end > start else text[start:]
+
+
+class RequestBudget:
+    """RPM/TPM予算によるスレッドセーフなレート制限
+    
+    直近 window 秒間のリクエスト数とトークン数がそれぞれ rpm・tpm を
+    超えないよう、acquire() で送信前に待機する。
+    """
+    
+    def __init__(self, rpm: int = DEFAULT_RPM, tpm: int = DEFAULT_TPM, window: float = 60.0):
+        if rpm <= 0 or tpm <= 0:
+            raise ValueError("rpm・tpm は正の値である必要があります")
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window = window
+        self._events = deque()  # (送信時刻, トークン数)
+        self._tokens = 0
+        self._lock = threading.Lock()
+        self.waited = 0.0
+    
+    def acquire(self, tokens: int) -> None:
+        """tokens 分の予算を確保（不足時は空くまで待機）"""
+        # 1リクエストでTPMを超える場合も単独なら送信できるようにする
+        tokens = min(tokens, self.tpm)
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._events and self._events[0][0] <= now - self.window:
+                    self._tokens -= self._events.popleft()[1]
+                
+                if len(self._events) < self.rpm and self._tokens + tokens <= self.tpm:
+                    self._events.append((now, tokens))
+                    self._tokens += tokens
+                    return
+                
+                wait = self._events[0][0] + self.window - now
+            
+            self.waited += wait
+            time.sleep(max(wait, 0.01))
+
 @dataclass
 class PlaceAnalysis:
     """地名分析結果"""
@@ -27,10 +104,17 @@ class PlaceAnalysis:
 class OpenAIClient:
     """GPT-3.5を使用した地名データクリーニングクライアント"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, rpm: int = DEFAULT_RPM,
+                 tpm: int = DEFAULT_TPM, max_workers: int = 4,
+                 cache: Optional[AnalysisCache] = None, use_cache: bool = True):
         """
         Args:
             api_key: OpenAI APIキー。Noneの場合は環境変数から取得
+            rpm: 1分あたりのリクエスト数上限
+            tpm: 1分あたりのトークン数上限
+            max_workers: 一括分析時に並行して送信するバッチ数
+            cache: 分析結果キャッシュ（Noneの場合は既定のキャッシュ）
+            use_cache: 分析結果キャッシュを使用するか
         """
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         if not self.api_key:
@@ -40,6 +124,24 @@ class OpenAIClient:
         self.model = "gpt-3.5-turbo"
         self.max_retries = 3
         self.retry_delay = 1.0
+        self.max_workers = max(1, max_workers)
+        self.budget = RequestBudget(rpm, tpm)
+        self.cache = (cache or get_analysis_cache()) if use_cache else None
+        
+        # 一括分析の統計情報（並行するバッチから更新するため _count で加算）
+        self.batch_stats = {
+            'requests': 0,
+            'batched_items': 0,
+            'retried_items': 0,
+            'fallback_items': 0,
+        }
+        self._stats_lock = threading.Lock()
+    
+    def _count(self, **deltas: int) -> None:
+        """一括分析の統計情報を加算（スレッドセーフ）"""
+        with self._stats_lock:
+            for key, delta in deltas.items():
+                self.batch_stats[key] += delta
         
     def analyze_place_name(self, place_name: str, context: str = "", work_title: str = "", author: str = "") -> PlaceAnalysis:
         """
@@ -54,11 +156,15 @@ class OpenAIClient:
         Returns:
             PlaceAnalysis: 分析結果
         """
+        inputs = self._place_inputs(place_name, context, work_title, author)
+        cached = self.get_cached_analysis(PLACE_ANALYSIS_KIND, PLACE_PROMPT_VERSION, inputs)
+        if cached is not None:
+            return PlaceAnalysis(**cached)
+        
         prompt = self._create_analysis_prompt(place_name, context, work_title, author)
         
         try:
             response = self._call_openai_with_retry(prompt)
-            return self._parse_analysis_response(place_name, response)
         except Exception as e:
             logger.error(f"地名分析エラー: {place_name}, {str(e)}")
             return PlaceAnalysis(
@@ -70,44 +176,167 @@ class OpenAIClient:
                 suggestions=[],
                 reasoning=f"分析エラー: {str(e)}"
             )
+        
+        try:
+            analysis = self._place_analysis_from_dict(place_name, json.loads(extract_json(response)))
+        except (json.JSONDecodeError, ValueError, TypeError, AttributeError):
+            # 解析できなかった応答は基本判定を返し、キャッシュしない
+            return self._parse_analysis_response(place_name, response)
+        
+        self.store_analysis(PLACE_ANALYSIS_KIND, PLACE_PROMPT_VERSION, inputs, analysis)
+        return analysis
     
     def batch_analyze_places(self, places: List[Dict], batch_size: int = 10) -> List[PlaceAnalysis]:
         """
         複数の地名を一括分析
         
+        batch_size 件ずつ1つのプロンプトにまとめて問い合わせ、JSON配列の応答を
+        解析する。応答に含まれなかった項目のみ再試行し、それでも解析できない
+        項目は個別分析にフォールバックする。キャッシュ済みの地名は送信しない。
+        
         Args:
             places: 地名リスト（辞書形式：name, context, work_title, author）
-            batch_size: バッチサイズ
+            batch_size: 1リクエストにまとめる地名数
             
         Returns:
-            List[PlaceAnalysis]: 分析結果リスト
+            List[PlaceAnalysis]: 分析結果リスト（入力と同じ順序）
         """
-        results = []
-        total = len(places)
+        logger.info(f"地名一括分析開始: {len(places)}件")
+        
+        results: List[Optional[PlaceAnalysis]] = [None] * len(places)
+        pending = []
+        for i, place_data in enumerate(places):
+            inputs = self._place_inputs(
+                place_data.get('name', ''), place_data.get('context', ''),
+                place_data.get('work_title', ''), place_data.get('author', '')
+            )
+            cached = self.get_cached_analysis(PLACE_ANALYSIS_KIND, PLACE_PROMPT_VERSION, inputs)
+            if cached is not None:
+                results[i] = PlaceAnalysis(**cached)
+            else:
+                pending.append((i, inputs))
+        
+        if len(pending) < len(places):
+            logger.info(f"キャッシュ済み: {len(places) - len(pending)}件")
         
-        logger.info(f"地名一括分析開始: {total}件")
+        batch_results = self.run_batched(
+            [places[i] for i, _ in pending], self._create_batch_analysis_prompt, batch_size
+        )
         
-        for i in range(0, total, batch_size):
-            batch = places[i:i + batch_size]
-            batch_results = []
+        for (i, inputs), data in zip(pending, batch_results):
+            if data is not None:
+                try:
+                    results[i] = self._place_analysis_from_dict(inputs['name'], data)
+                    self.store_analysis(PLACE_ANALYSIS_KIND, PLACE_PROMPT_VERSION, inputs, results[i])
+                    continue
+                except (TypeError, ValueError):
+                    pass
             
-            for place_data in batch:
-                result = self.analyze_place_name(
-                    place_name=place_data.get('name', ''),
-                    context=place_data.get('context', ''),
-                    work_title=place_data.get('work_title', ''),
-                    author=place_data.get('author', '')
-                )
-                batch_results.append(result)
-                
-                # レート制限対策
-                time.sleep(0.1)
+            self._count(fallback_items=1)
+            results[i] = self.analyze_place_name(
+                place_name=inputs['name'],
+                context=inputs['context'],
+                work_title=inputs['work_title'],
+                author=inputs['author']
+            )
+        
+        logger.info(f"地名一括分析完了: {len(results)}件 "
+                    f"(リクエスト {self.batch_stats['requests']}回, 個別分析 {self.batch_stats['fallback_items']}件)")
+        return results
+    
+    def get_cached_analysis(self, kind: str, template_version: str,
+                            inputs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """キャッシュ済みの分析結果dict（未登録・キャッシュ無効時は None）"""
+        if self.cache is None:
+            return None
+        cached = self.cache.get(kind, self.model, template_version, inputs)
+        return None if cached is MISS else cached
+    
+    def store_analysis(self, kind: str, template_version: str, inputs: Dict[str, Any], analysis: Any) -> None:
+        """解析済みの分析結果（dataclass）をキャッシュに保存"""
+        if self.cache is not None:
+            self.cache.set(kind, self.model, template_version, inputs, asdict(analysis))
+    
+    @staticmethod
+    def _place_inputs(place_name: str, context: str, work_title: str, author: str) -> Dict[str, str]:
+        """地名分析の入力（キャッシュキーの元）"""
+        return {
+            'name': place_name or '',
+            'context': context or '',
+            'work_title': work_title or '',
+            'author': author or '',
+        }
+    
+    def run_batched(self, items: Sequence[T], build_prompt: Callable[[Sequence[T]], str],
+                    batch_size: int = 10, max_tokens_per_item: int = 250,
+                    max_rounds: int = 2) -> List[Optional[Dict[str, Any]]]:
+        """
+        複数項目をまとめたプロンプトを並行して送信し、項目ごとの結果を返す
+        
+        build_prompt はバッチを受け取り、各項目に1始まりの "id" を付けた
+        JSON配列で回答させるプロンプトを返す。応答に欠けた項目・解析できない
+        項目だけを次のラウンドで再送する。
+        
+        Returns:
+            項目ごとの結果dict（最終的に得られなかった項目は None）
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        pending = list(range(len(items)))
+        batch_size = max(1, batch_size)
+        
+        for round_index in range(max_rounds):
+            if not pending:
+                break
+            if round_index > 0:
+                self._count(retried_items=len(pending))
+                logger.info(f"未解決の {len(pending)}件を再試行します")
+            
+            batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+            
+            def run(indices: List[int]) -> Dict[int, Dict[str, Any]]:
+                return self._request_batch([items[i] for i in indices], build_prompt, max_tokens_per_item)
             
-            results.extend(batch_results)
-            logger.info(f"進捗: {min(i + batch_size, total)}/{total} 完了")
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+                for done, (indices, answers) in enumerate(zip(batches, executor.map(run, batches)), 1):
+                    for position, data in answers.items():
+                        results[indices[position - 1]] = data
+                    if done % 10 == 0 or done == len(batches):
+                        logger.info(f"進捗: {done}/{len(batches)} バッチ完了")
+            
+            pending = [i for i in pending if results[i] is None]
         
         return results
     
+    def _request_batch(self, batch: Sequence[T], build_prompt: Callable[[Sequence[T]], str],
+                       max_tokens_per_item: int) -> Dict[int, Dict[str, Any]]:
+        """1バッチを送信し、id -> 結果dict を返す（失敗時は空）"""
+        prompt = build_prompt(batch)
+        self._count(requests=1, batched_items=len(batch))
+        
+        try:
+            response = self._call_openai_with_retry(
+                prompt, max_tokens=min(4000, max_tokens_per_item * len(batch) + 100)
+            )
+            data = json.loads(extract_json(response))
+        except Exception as e:
+            logger.warning(f"バッチ分析エラー ({len(batch)}件): {str(e)}")
+            return {}
+        
+        if isinstance(data, dict):
+            data = data.get('results', [data])
+        
+        answers = {}
+        for entry in data if isinstance(data, list) else []:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                position = int(entry.get('id'))
+            except (TypeError, ValueError):
+                continue
+            if 1 <= position <= len(batch):
+                answers[position] = entry
+        return answers
+    
     def suggest_normalization(self, place_names: List[str]) -> Dict[str, str]:
         """
         地名の正規化提案
@@ -177,9 +406,50 @@ class OpenAIClient:
 日本の文学作品における地名の特徴を考慮して分析してください。
 """
     
-    def _call_openai_with_retry(self, prompt: str) -> str:
-        """リトライ機能付きOpenAI API呼び出し"""
+    def _create_batch_analysis_prompt(self, places: Sequence[Dict]) -> str:
+        """複数地名をまとめて分析するプロンプトを作成"""
+        items = [
+            {
+                'id': index,
+                'place_name': place_data.get('name', ''),
+                'context': place_data.get('context', ''),
+                'work_title': place_data.get('work_title', ''),
+                'author': place_data.get('author', ''),
+            }
+            for index, place_data in enumerate(places, 1)
+        ]
+        return f"""
+以下の{len(items)}件の地名をそれぞれ分析し、その妥当性と品質を評価してください。
+
+地名リスト:
+{json.dumps(items, ensure_ascii=False, indent=1)}
+
+各地名について以下の観点で分析してください：
+1. 実在する地名か（実在/架空/不明）
+2. 表記が適切か
+3. 作品の時代背景と整合するか
+4. 正規化が必要か
+
+すべての地名について、入力の id を付けた以下の形式のJSON配列のみで回答してください：
+[
+  {{
+    "id": 1,
+    "is_valid": true/false,
+    "confidence": 0.0-1.0,
+    "normalized_name": "正規化後の地名",
+    "place_type": "city/town/district/landmark/nature/fictional/other",
+    "suggestions": ["改善提案1", "改善提案2"],
+    "reasoning": "判定理由の簡潔な説明"
+  }}
+]
+
+日本の文学作品における地名の特徴を考慮して分析してください。
+"""
+    
+    def _call_openai_with_retry(self, prompt: str, max_tokens: int = 1000) -> str:
+        """リトライ機能付きOpenAI API呼び出し（RPM/TPM予算内で送信）"""
         for attempt in range(self.max_retries):
+            self.budget.acquire(estimate_tokens(prompt) + max_tokens)
             try:
                 response = openai.ChatCompletion.create(
                     model=self.model,
@@ -187,7 +457,7 @@ class OpenAIClient:
                         {"role": "system", "content": "あなたは日本の地名と文学に詳しい専門家です。地名の妥当性を正確に判定してください。"},
                         {"role": "user", "content": prompt}
                     ],
-                    max_tokens=1000,
+                    max_tokens=max_tokens,
                     temperature=0.1,
                     timeout=30
                 )
@@ -210,26 +480,10 @@ class OpenAIClient:
     def _parse_analysis_response(self, place_name: str, response: str) -> PlaceAnalysis:
         """GPT-3.5の応答を解析してPlaceAnalysisオブジェクトに変換"""
         try:
-            # JSONの抽出を試行
-            response_clean = response.strip()
-            if response_clean.startswith('```json'):
-                response_clean = response_clean[7:]
-            if response_clean.endswith('```'):
-                response_clean = response_clean[:-3]
-            
-            data = json.loads(response_clean)
-            
-            return PlaceAnalysis(
-                place_name=place_name,
-                is_valid=data.get('is_valid', False),
-                confidence=float(data.get('confidence', 0.0)),
-                normalized_name=data.get('normalized_name', place_name),
-                place_type=data.get('place_type', 'unknown'),
-                suggestions=data.get('suggestions', []),
-                reasoning=data.get('reasoning', '')
-            )
+            data = json.loads(extract_json(response))
+            return self._place_analysis_from_dict(place_name, data)
         
-        except (json.JSONDecodeError, ValueError) as e:
+        except (json.JSONDecodeError, ValueError, TypeError, AttributeError) as e:
             logger.error(f"応答解析エラー: {str(e)}, 応答: {response}")
             # フォールバック：基本的な分析結果を返す
             return PlaceAnalysis(
@@ -240,4 +494,17 @@ class OpenAIClient:
                 place_type='unknown',
                 suggestions=[],
                 reasoning=f"応答解析エラーのため基本判定: {str(e)}"
-            ) 
\ No newline at end of file
+            ) 
+    
+    @staticmethod
+    def _place_analysis_from_dict(place_name: str, data: Dict[str, Any]) -> PlaceAnalysis:
+        """応答JSONの1項目をPlaceAnalysisに変換"""
+        return PlaceAnalysis(
+            place_name=place_name,
+            is_valid=data.get('is_valid', False),
+            confidence=float(data.get('confidence', 0.0)),
+            normalized_name=data.get('normalized_name') or place_name,
+            place_type=data.get('place_type', 'unknown'),
+            suggestions=data.get('suggestions', []),
+            reasoning=data.get('reasoning', '')
+        )
@@ -4,8 +4,9 @@
 AI（GPT）を使用して地名抽出の文脈妥当性を分析
 """
 
+import json
 import re
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
 from ..models.openai_client import OpenAIClient
@@ -13,6 +14,10 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 分析結果キャッシュの種類とプロンプト版（プロンプト変更時は版を上げる）
+CONTEXT_ANALYSIS_KIND = 'context_analysis'
+CONTEXT_PROMPT_VERSION = '1'
+
 @dataclass
 class ContextAnalysis:
     """文脈分析結果"""
@@ -27,8 +32,45 @@ class ContextAnalysis:
 class ContextAnalyzer:
     """文脈分析器"""
     
-    def __init__(self, openai_api_key: str):
-        self.openai_client = OpenAIClient(openai_api_key)
+    # デモ用の特定地名の判定結果（APIキーなしでもテスト可能）
+    demo_results = {
+        '萩': {
+            'is_valid_place': False,
+            'confidence': 0.9,
+            'context_type': 'plant',
+            'reasoning': '「大きな萩が人の背より高く延びて」から植物名として使用されている',
+            'suggested_action': 'remove',
+            'alternative_interpretation': '植物名「萩」'
+        },
+        '柏': {
+            'is_valid_place': False,
+            'confidence': 0.85,
+            'context_type': 'building_part',
+            'reasoning': '「高柏寺の五重の塔」から寺院名の一部として使用されている',
+            'suggested_action': 'remove',
+            'alternative_interpretation': '建物名の一部「柏」'
+        },
+        '東': {
+            'is_valid_place': False,
+            'confidence': 0.95,
+            'context_type': 'direction',
+            'reasoning': '「東から西へ貫いた廊下」から方向を示す語として使用されている',
+            'suggested_action': 'remove',
+            'alternative_interpretation': '方向・方角を示す語「東」'
+        },
+        '都': {
+            'is_valid_place': False,
+            'confidence': 0.8,
+            'context_type': 'general_noun',
+            'reasoning': '「都のまん中に立って」から一般名詞（首都・都市）として使用されている',
+            'suggested_action': 'remove',
+            'alternative_interpretation': '一般名詞「都」'
+        }
+    }
+    
+    def __init__(self, openai_api_key: str, openai_client: Optional[OpenAIClient] = None):
+        # openai_client を共有するとRPM/TPM予算も共有される
+        self.openai_client = openai_client or OpenAIClient(openai_api_key)
         
         # 明らかに非地名のパターン
         self.non_place_patterns = [
@@ -192,45 +234,9 @@ class ContextAnalyzer:
     def _ai_enhanced_context_analysis(self, place_name: str, enhanced_context: Dict) -> ContextAnalysis:
         """AIによる詳細分析"""
         
-        # デモ用の特定地名の判定結果（APIキーなしでもテスト可能）
-        demo_results = {
-            '萩': {
-                'is_valid_place': False,
-                'confidence': 0.9,
-                'context_type': 'plant',
-                'reasoning': '「大きな萩が人の背より高く延びて」から植物名として使用されている',
-                'suggested_action': 'remove',
-                'alternative_interpretation': '植物名「萩」'
-            },
-            '柏': {
-                'is_valid_place': False,
-                'confidence': 0.85,
-                'context_type': 'building_part',
-                'reasoning': '「高柏寺の五重の塔」から寺院名の一部として使用されている',
-                'suggested_action': 'remove',
-                'alternative_interpretation': '建物名の一部「柏」'
-            },
-            '東': {
-                'is_valid_place': False,
-                'confidence': 0.95,
-                'context_type': 'direction',
-                'reasoning': '「東から西へ貫いた廊下」から方向を示す語として使用されている',
-                'suggested_action': 'remove',
-                'alternative_interpretation': '方向・方角を示す語「東」'
-            },
-            '都': {
-                'is_valid_place': False,
-                'confidence': 0.8,
-                'context_type': 'general_noun',
-                'reasoning': '「都のまん中に立って」から一般名詞（首都・都市）として使用されている',
-                'suggested_action': 'remove',
-                'alternative_interpretation': '一般名詞「都」'
-            }
-        }
-        
         # デモ結果がある場合はそれを返す
-        if place_name in demo_results:
-            data = demo_results[place_name]
+        if place_name in self.demo_results:
+            data = self.demo_results[place_name]
             return ContextAnalysis(
                 place_name=place_name,
                 is_valid_place=data['is_valid_place'],
@@ -241,6 +247,12 @@ class ContextAnalyzer:
                 alternative_interpretation=data['alternative_interpretation']
             )
         
+        cached = self.openai_client.get_cached_analysis(
+            CONTEXT_ANALYSIS_KIND, CONTEXT_PROMPT_VERSION, enhanced_context
+        )
+        if cached is not None:
+            return ContextAnalysis(**cached)
+        
         prompt = f"""
 あなたは日本文学と地名分析の専門家です。以下の詳細情報を基に「{place_name}」が実際の地名として使用されているかを判定してください。
 
@@ -298,11 +310,6 @@ class ContextAnalyzer:
         try:
             # OpenAI APIを呼び出し
             response = self.openai_client._call_openai_with_retry(prompt)
-            result = self.openai_client._parse_analysis_response(place_name, response)
-            
-            # レスポンスを解析してContextAnalysisに変換
-            return self._parse_ai_response(place_name, response)
-            
         except Exception as e:
             logger.error(f"AI文脈分析エラー: {place_name}, {str(e)}")
             return ContextAnalysis(
@@ -314,12 +321,25 @@ class ContextAnalyzer:
                 suggested_action='keep',
                 alternative_interpretation="分析不可"
             )
+        
+        # レスポンスを解析してContextAnalysisに変換（JSONとして解析できた結果のみキャッシュ）
+        analysis = self._parse_ai_json(place_name, response)
+        if analysis is None:
+            return self._analyze_non_json_response(place_name, response)
+        
+        self.openai_client.store_analysis(CONTEXT_ANALYSIS_KIND, CONTEXT_PROMPT_VERSION, enhanced_context, analysis)
+        return analysis
     
     def _parse_ai_response(self, place_name: str, response: str) -> ContextAnalysis:
         """AI応答を解析してContextAnalysisオブジェクトに変換"""
+        analysis = self._parse_ai_json(place_name, response)
+        if analysis is None:
+            return self._analyze_non_json_response(place_name, response)
+        return analysis
+    
+    def _parse_ai_json(self, place_name: str, response: str) -> Optional[ContextAnalysis]:
+        """AI応答のJSONを解析（JSONとして解析できない場合は None）"""
         try:
-            import json
-            
             # JSONの抽出
             json_str = None
             if '```json' in response:
@@ -330,24 +350,26 @@ class ContextAnalyzer:
                 json_str = response[start:end]
             
             if json_str:
-                data = json.loads(json_str)
-                
-                return ContextAnalysis(
-                    place_name=place_name,
-                    is_valid_place=data.get('is_valid_place', True),
-                    confidence=float(data.get('confidence', 0.5)),
-                    context_type=data.get('context_type', 'other'),
-                    reasoning=data.get('reasoning', ''),
-                    suggested_action=data.get('suggested_action', 'keep'),
-                    alternative_interpretation=data.get('alternative_interpretation', '')
-                )
-            else:
-                # JSON形式でない場合の推測処理
-                return self._analyze_non_json_response(place_name, response)
+                return self._context_analysis_from_dict(place_name, json.loads(json_str))
+            # JSON形式でない場合は推測処理に委ねる
+            return None
                 
         except Exception as e:
             logger.error(f"AI応答解析エラー: {str(e)}")
-            return self._analyze_non_json_response(place_name, response)
+            return None
+    
+    @staticmethod
+    def _context_analysis_from_dict(place_name: str, data: Dict[str, Any]) -> ContextAnalysis:
+        """応答JSONの1項目をContextAnalysisに変換"""
+        return ContextAnalysis(
+            place_name=place_name,
+            is_valid_place=data.get('is_valid_place', True),
+            confidence=float(data.get('confidence', 0.5)),
+            context_type=data.get('context_type', 'other'),
+            reasoning=data.get('reasoning', ''),
+            suggested_action=data.get('suggested_action', 'keep'),
+            alternative_interpretation=data.get('alternative_interpretation', '')
+        )
     
     def _analyze_non_json_response(self, place_name: str, response: str) -> ContextAnalysis:
         """JSON形式でない応答の場合の推測分析"""
@@ -401,26 +423,119 @@ class ContextAnalyzer:
         }
         return interpretations.get(context_type, f'非地名「{place_name}」')
     
-    def batch_analyze_contexts(self, places_data: List[Dict]) -> List[ContextAnalysis]:
-        """複数地名の文脈を一括分析"""
-        results = []
+    def batch_analyze_contexts(self, places_data: List[Dict], batch_size: int = 10) -> List[ContextAnalysis]:
+        """
+        複数地名の文脈を一括分析
         
+        パターン検出・デモ結果・キャッシュで判定できる地名はAPIを呼ばずに処理し、
+        残りを batch_size 件ずつ1つのプロンプトにまとめて問い合わせる。
+        一括応答から得られなかった地名は個別分析にフォールバックする。
+        """
         logger.info(f"文脈分析開始: {len(places_data)}件")
         
+        results: List[Optional[ContextAnalysis]] = [None] * len(places_data)
+        pending: List[Tuple[int, Dict]] = []
+        
         for i, place_data in enumerate(places_data):
-            result = self.analyze_context(
-                place_name=place_data['place_name'],
-                sentence=place_data.get('sentence', ''),
-                before_text=place_data.get('before_text', ''),
-                after_text=place_data.get('after_text', ''),
-                work_title=place_data.get('work_title', ''),
-                author=place_data.get('author', ''),
-                work_year=place_data.get('work_year', None)
+            place_name = place_data['place_name']
+            sentence = place_data.get('sentence', '')
+            before_text = place_data.get('before_text', '')
+            after_text = place_data.get('after_text', '')
+            
+            # 1. パターンマッチングによる事前チェック
+            pattern_result = self._check_non_place_patterns(place_name, sentence, before_text, after_text)
+            if pattern_result:
+                results[i] = pattern_result
+                continue
+            
+            # 2. デモ結果
+            if place_name in self.demo_results:
+                results[i] = self._context_analysis_from_dict(place_name, self.demo_results[place_name])
+                continue
+            
+            # 3. 拡張文脈情報を構築し、キャッシュ済みでなければAI分析対象とする
+            enhanced_context = self._build_enhanced_context(
+                place_name, sentence, before_text, after_text,
+                place_data.get('work_title', ''), place_data.get('author', ''),
+                place_data.get('work_year', None)
+            )
+            cached = self.openai_client.get_cached_analysis(
+                CONTEXT_ANALYSIS_KIND, CONTEXT_PROMPT_VERSION, enhanced_context
             )
-            results.append(result)
+            if cached is not None:
+                results[i] = ContextAnalysis(**cached)
+                continue
+            pending.append((i, enhanced_context))
+        
+        if pending:
+            contexts = [context for _, context in pending]
+            answers = self.openai_client.run_batched(contexts, self._create_batch_prompt, batch_size)
             
-            if (i + 1) % 10 == 0:
-                logger.info(f"進捗: {i + 1}/{len(places_data)} 完了")
+            for (i, context), data in zip(pending, answers):
+                place_name = context['place_name']
+                if data is not None:
+                    try:
+                        results[i] = self._context_analysis_from_dict(place_name, data)
+                        self.openai_client.store_analysis(
+                            CONTEXT_ANALYSIS_KIND, CONTEXT_PROMPT_VERSION, context, results[i]
+                        )
+                        continue
+                    except (TypeError, ValueError):
+                        pass
+                results[i] = self._ai_enhanced_context_analysis(place_name, context)
         
-        logger.info(f"文脈分析完了: {len(results)}件")
-        return results 
\ No newline at end of file
+        logger.info(f"文脈分析完了: {len(results)}件 (AI分析 {len(pending)}件)")
+        return results
+    
+    def _create_batch_prompt(self, contexts: Sequence[Dict]) -> str:
+        """複数地名の文脈をまとめて分析するプロンプトを作成"""
+        items = [
+            {
+                'id': index,
+                'place_name': context['place_name'],
+                'before': context['extended_before'],
+                'sentence': context['sentence'],
+                'after': context['extended_after'],
+                'work_title': context['work_title'],
+                'author': context['author'],
+                'historical_context': context['historical_context'],
+                'usage_pattern': context['usage_pattern'],
+                'literary_context': context['literary_context'],
+            }
+            for index, context in enumerate(contexts, 1)
+        ]
+        return f"""
+あなたは日本文学と地名分析の専門家です。以下の{len(items)}件それぞれについて、「place_name」が文脈中で実際の地名として使用されているかを判定してください。
+
+【分析対象】
+{json.dumps(items, ensure_ascii=False, indent=1)}
+
+【重要】すべての項目について、入力の id を付けた以下の形式のJSON配列のみで回答してください。他の説明は一切不要です：
+
+[
+  {{
+    "id": 1,
+    "is_valid_place": true,
+    "confidence": 0.9,
+    "context_type": "location",
+    "reasoning": "実際の地名として使用されている",
+    "suggested_action": "keep",
+    "alternative_interpretation": ""
+  }}
+]
+
+【判定基準】
+- is_valid_place: 実際の地名なら true、そうでなければ false
+- confidence: 判定の確信度 (0.0-1.0)
+- context_type: "location"(地名) / "direction"(方向) / "plant"(植物) / "building_part"(建物) / "general_noun"(一般名詞) / "other"
+- reasoning: 判定理由（日本語で簡潔に）
+- suggested_action: "keep"(保持) / "remove"(削除) / "modify"(修正)
+- alternative_interpretation: 地名でない場合の解釈
+
+【文学作品における地名判定のポイント】
+1. 助詞の使い方（「に行く」「で会う」など位置を示す場合は地名の可能性高）
+2. 作者の時代における実在地名かどうか
+3. 文学的表現として象徴的に使われているか
+4. 植物名・方向・一般名詞として使われているか
+5. 作品全体の地理的設定との整合性
+"""
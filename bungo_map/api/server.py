@@ -2,20 +2,131 @@
 # -*- coding: utf-8 -*-
 """
 文豪ゆかり地図システム v2.0 - FastAPI サーバー
+
+- 起動時に読み取り専用の接続プールを1つ生成し、全リクエストで共有
+- DBアクセスはスレッドプールで実行し、イベントループをブロックしない
+- DBファイルの更新時刻に基づく ETag / Last-Modified と条件付きGET（304）
+- 一覧系はカーソル（place_id）によるキーセットページング
 """
 
-from fastapi import FastAPI
+import hashlib
+import os
+from contextlib import asynccontextmanager
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
 import click
 import uvicorn
-from bungo_map.core.database import init_db
+from bungo_map.core.database import Database
+
+DB_PATH = os.getenv('BUNGO_DB_PATH', 'data/bungo_production.db')
+READ_POOL_SIZE = int(os.getenv('BUNGO_API_POOL_SIZE', '8'))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """起動時にスキーマを最新化し、読み取り専用プールを生成"""
+    Database(DB_PATH).close()
+    app.state.db = Database(DB_PATH, pool_size=READ_POOL_SIZE, read_only=True)
+    try:
+        yield
+    finally:
+        app.state.db.close()
+
 
 app = FastAPI(
     title="文豪ゆかり地図システム API",
     description="作家・作品・舞台地名の3階層データ管理システム",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 
+def get_db() -> Database:
+    """起動時に生成した読み取り専用データベース"""
+    return app.state.db
+
+
+def _data_mtime_ns(db_path: Path) -> int:
+    """DB本体・WALファイルの最終更新時刻（ナノ秒）"""
+    mtime = 0
+    for path in (db_path, db_path.with_name(db_path.name + '-wal')):
+        try:
+            mtime = max(mtime, path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            continue
+    return mtime
+
+
+def _not_modified(request: Request, etag: str, mtime: int) -> bool:
+    """条件付きGETの判定（If-None-Match を If-Modified-Since より優先）"""
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        return '*' in tags or etag in tags
+
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return mtime // 1_000_000_000 <= since
+    return False
+
+
+async def _read(request: Request, fn: Callable[..., Any], *args,
+                media_type: str = 'application/json', **kwargs) -> Response:
+    """DB読み取りをスレッドプールで実行し、キャッシュ検証ヘッダー付きで返す
+
+    ETag はデータの更新時刻とリクエストURLから算出するため、
+    DBが更新されない限り同じURLには同じ ETag を返す。
+    """
+    db = get_db()
+    mtime = _data_mtime_ns(db.db_path)
+    digest = hashlib.sha1(f"{mtime}:{request.url.path}?{request.url.query}".encode()).hexdigest()
+    etag = f'W/"{digest[:20]}"'
+    headers = {
+        'ETag': etag,
+        'Last-Modified': formatdate(mtime / 1_000_000_000, usegmt=True),
+        'Cache-Control': 'public, max-age=0, must-revalidate',
+    }
+
+    if _not_modified(request, etag, mtime):
+        return Response(status_code=304, headers=headers)
+
+    payload = await run_in_threadpool(fn, *args, **kwargs)
+    return JSONResponse(payload, headers=headers, media_type=media_type)
+
+
+def _validate_bbox(min_lat: float, min_lng: float, max_lat: float, max_lng: float) -> None:
+    if min_lat > max_lat or min_lng > max_lng:
+        raise HTTPException(status_code=400, detail="min_* は max_* 以下である必要があります")
+
+
+def _to_feature_collection(page: Dict[str, Any]) -> Dict[str, Any]:
+    """地名ページをGeoJSON FeatureCollectionに変換（座標未設定の地名は除外）"""
+    features: List[Dict[str, Any]] = []
+    for place in page['items']:
+        if place['lat'] is None or place['lng'] is None:
+            continue
+        properties = {key: value for key, value in place.items() if key not in ('lat', 'lng')}
+        features.append({
+            'type': 'Feature',
+            'geometry': {'type': 'Point', 'coordinates': [place['lng'], place['lat']]},
+            'properties': properties,
+        })
+    return {
+        'type': 'FeatureCollection',
+        'features': features,
+        'next_cursor': page['next_cursor'],
+    }
+
+
 @app.get("/")
 async def root():
     """ルートエンドポイント"""
@@ -30,9 +141,8 @@ async def root():
 async def status():
     """システム状況"""
     try:
-        db = init_db()
-        stats = db.get_stats()
-        
+        stats = await run_in_threadpool(get_db().get_stats)
+
         return {
             "status": "ok",
             "database": {
@@ -48,6 +158,93 @@ async def status():
         }
 
 
+@app.get("/search/{kind}")
+async def search(request: Request, kind: str,
+                 q: str = Query(..., min_length=1, description="検索語（空白区切りでAND検索）"),
+                 page: int = Query(1, ge=1),
+                 per_page: int = Query(20, ge=1, le=100)):
+    """全文検索（kind: places / works / authors）"""
+    if kind not in ('places', 'works', 'authors'):
+        raise HTTPException(status_code=404, detail=f"未対応の検索種別です: {kind}")
+    return await _read(request, get_db().search_page, kind, q, page=page, per_page=per_page)
+
+
+@app.get("/authors/{author_id}/places")
+async def author_places(request: Request, author_id: int,
+                        limit: int = Query(100, ge=1, le=1000),
+                        cursor: int = Query(0, ge=0, description="前ページの next_cursor")):
+    """作者別の地名一覧（カーソルページング）"""
+    return await _read(request, get_db().places_page, author_id=author_id, limit=limit, after_id=cursor)
+
+
+@app.get("/works/{work_id}/places")
+async def work_places(request: Request, work_id: int,
+                      limit: int = Query(100, ge=1, le=1000),
+                      cursor: int = Query(0, ge=0, description="前ページの next_cursor")):
+    """作品別の地名一覧（カーソルページング）"""
+    return await _read(request, get_db().places_page, work_id=work_id, limit=limit, after_id=cursor)
+
+
+@app.get("/places/bbox")
+async def places_in_bbox(request: Request,
+                         min_lat: float = Query(..., ge=-90, le=90),
+                         min_lng: float = Query(..., ge=-180, le=180),
+                         max_lat: float = Query(..., ge=-90, le=90),
+                         max_lng: float = Query(..., ge=-180, le=180),
+                         limit: int = Query(500, ge=1, le=5000),
+                         cursor: int = Query(0, ge=0, description="前ページの next_cursor")):
+    """地図表示範囲内の地名（カーソルページング）"""
+    _validate_bbox(min_lat, min_lng, max_lat, max_lng)
+    return await _read(request, get_db().places_in_bbox,
+                       min_lat, min_lng, max_lat, max_lng, limit=limit, after_id=cursor)
+
+
+@app.get("/places/near")
+async def places_near(request: Request,
+                      lat: float = Query(..., ge=-90, le=90),
+                      lng: float = Query(..., ge=-180, le=180),
+                      radius_km: float = Query(5.0, gt=0, le=500),
+                      k: int = Query(50, ge=1, le=1000),
+                      offset: int = Query(0, ge=0)):
+    """指定地点の周辺地名（近い順）"""
+    def query():
+        items = get_db().places_near(lat, lng, radius_km=radius_km, k=k, offset=offset)
+        return {'items': items, 'offset': offset, 'k': k}
+
+    return await _read(request, query)
+
+
+@app.get("/places.geojson")
+async def places_geojson(request: Request,
+                         min_lat: Optional[float] = Query(None, ge=-90, le=90),
+                         min_lng: Optional[float] = Query(None, ge=-180, le=180),
+                         max_lat: Optional[float] = Query(None, ge=-90, le=90),
+                         max_lng: Optional[float] = Query(None, ge=-180, le=180),
+                         author_id: Optional[int] = None,
+                         work_id: Optional[int] = None,
+                         limit: int = Query(1000, ge=1, le=5000),
+                         cursor: int = Query(0, ge=0, description="前ページの next_cursor")):
+    """地名のGeoJSON（範囲指定または作者・作品指定、カーソルページング）"""
+    bbox = (min_lat, min_lng, max_lat, max_lng)
+    if any(value is not None for value in bbox):
+        if any(value is None for value in bbox):
+            raise HTTPException(status_code=400, detail="範囲指定には min_lat・min_lng・max_lat・max_lng が必要です")
+        _validate_bbox(*bbox)
+
+        def query():
+            return _to_feature_collection(
+                get_db().places_in_bbox(*bbox, limit=limit, after_id=cursor)
+            )
+    else:
+        def query():
+            return _to_feature_collection(
+                get_db().places_page(author_id=author_id, work_id=work_id, limit=limit,
+                                     after_id=cursor, geocoded_only=True)
+            )
+
+    return await _read(request, query, media_type='application/geo+json')
+
+
 @click.command()
 @click.option('--host', default='127.0.0.1', help='ホスト')
 @click.option('--port', default=8000, help='ポート番号')
@@ -56,7 +253,7 @@ def main(host: str, port: int, reload: bool):
     """🌐 API サーバー起動"""
     click.echo(f"🌐 API サーバー起動中: http://{host}:{port}")
     click.echo(f"📖 API ドキュメント: http://{host}:{port}/docs")
-    
+
     uvicorn.run(
         "bungo_map.api.server:app",
         host=host,
@@ -66,4 +263,4 @@ def main(host: str, port: int, reload: bool):
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -22,6 +22,7 @@ except ImportError:
     pass
 
 from ..ai.cleaners.place_cleaner import PlaceCleaner
+from ..ai.models.openai_client import DEFAULT_RPM, DEFAULT_TPM
 from ..utils.database_utils import get_database_path
 
 console = Console()
@@ -38,7 +39,11 @@ def ai():
 @click.option('--save-to-db', is_flag=True, help='AI分析結果をデータベースに保存')
 @click.option('--output', '-o', help='分析結果の出力ファイルパス')
 @click.option('--api-key', envvar='OPENAI_API_KEY', help='OpenAI APIキー')
-def analyze(limit, confidence, verbose, save_to_db, output, api_key):
+@click.option('--batch-size', type=int, default=10, help='1リクエストにまとめる地名数')
+@click.option('--workers', type=int, default=4, help='並行して送信するバッチ数')
+@click.option('--rpm', type=int, default=DEFAULT_RPM, help='1分あたりのリクエスト数上限')
+@click.option('--tpm', type=int, default=DEFAULT_TPM, help='1分あたりのトークン数上限')
+def analyze(limit, confidence, verbose, save_to_db, output, api_key, batch_size, workers, rpm, tpm):
     """🔍 地名データの品質分析"""
     
     # APIキーのデバッグ出力
@@ -60,7 +65,7 @@ def analyze(limit, confidence, verbose, save_to_db, output, api_key):
         return
     
     # PlaceCleanerを初期化
-    cleaner = PlaceCleaner(database_path, api_key)
+    cleaner = PlaceCleaner(database_path, api_key, rpm=rpm, tpm=tpm, max_workers=workers)
     
     with Progress(
         SpinnerColumn(),
@@ -71,7 +76,8 @@ def analyze(limit, confidence, verbose, save_to_db, output, api_key):
         
         try:
             # 地名分析を実行
-            analyses = cleaner.analyze_all_places(limit=limit, confidence_threshold=confidence, save_to_db=save_to_db)
+            analyses = cleaner.analyze_all_places(limit=limit, confidence_threshold=confidence, save_to_db=save_to_db,
+                                                  batch_size=batch_size)
             progress.update(task, description=f"分析完了: {len(analyses)}件")
             
         except Exception as e:
@@ -87,6 +93,7 @@ def analyze(limit, confidence, verbose, save_to_db, output, api_key):
     
     # 結果表示
     _display_analysis_summary(report)
+    _display_analysis_cache_stats(cleaner.openai_client)
     _display_confidence_distribution(report)
     _display_type_distribution(report)
     _display_improvement_suggestions(report)
@@ -216,7 +223,8 @@ def clean(confidence_threshold, dry_run, apply, api_key):
 @click.option('--apply', is_flag=True, help='実際にデータベースを更新')
 @click.option('--use-google', is_flag=True, help='Google Geocoding APIを使用')
 @click.option('--google-api-key', envvar='GOOGLE_MAPS_API_KEY', help='Google Maps APIキー')
-def geocode(confidence, limit, dry_run, apply, use_google, google_api_key):
+@click.option('--async', 'use_async', is_flag=True, help='非同期パイプライン（並行実行・レート制限・フォールバック）を使用')
+def geocode(confidence, limit, dry_run, apply, use_google, google_api_key, use_async):
     """🌍 AI検証済み地名のジオコーディング"""
     
     database_path = get_database_path()
@@ -247,7 +255,8 @@ def geocode(confidence, limit, dry_run, apply, use_google, google_api_key):
             result = geocoder.batch_geocode(
                 min_ai_confidence=confidence,
                 limit=limit,
-                dry_run=dry_run
+                dry_run=dry_run,
+                use_async=use_async
             )
             
             progress.update(task, description="ジオコーディング完了")
@@ -321,7 +330,7 @@ def test_connection(api_key):
     
     try:
         from ..ai.models.openai_client import OpenAIClient
-        client = OpenAIClient(api_key)
+        client = OpenAIClient(api_key, use_cache=False)
         
         # テスト用の簡単な分析
         test_analysis = client.analyze_place_name("東京", "テスト用の文脈", "テスト作品", "テスト作者")
@@ -572,6 +581,63 @@ def clean_context(confidence_threshold, dry_run, apply, api_key):
     if not dry_run:
         _apply_context_cleaning(invalid_places, database_path)
 
+@ai.command('cache-prune')
+@click.option('--older-than', type=int, help='作成からN日以上経過したエントリを削除')
+@click.option('--stale-templates', is_flag=True, help='現行と異なるプロンプト版のエントリを削除')
+@click.option('--kind', type=click.Choice(['place_analysis', 'context_analysis']), help='対象とする分析の種類')
+@click.option('--clear', 'clear_all', is_flag=True, help='全エントリを削除')
+@click.option('--cache-path', help='キャッシュDBのパス（既定: data/ai_analysis_cache.db）')
+def cache_prune(older_than, stale_templates, kind, clear_all, cache_path):
+    """🗄️ AI分析キャッシュの整理"""
+    from ..ai.models.analysis_cache import AnalysisCache, DEFAULT_ANALYSIS_CACHE_PATH
+    from ..ai.models.openai_client import PLACE_ANALYSIS_KIND, PLACE_PROMPT_VERSION
+    from ..ai.validators.context_analyzer import CONTEXT_ANALYSIS_KIND, CONTEXT_PROMPT_VERSION
+    
+    cache = AnalysisCache(cache_path or DEFAULT_ANALYSIS_CACHE_PATH)
+    removed = 0
+    
+    if clear_all:
+        removed += cache.clear()
+    
+    if older_than is not None:
+        removed += cache.prune_older_than(older_than * 24 * 3600, kind=kind)
+    
+    if stale_templates:
+        current_versions = {
+            PLACE_ANALYSIS_KIND: PLACE_PROMPT_VERSION,
+            CONTEXT_ANALYSIS_KIND: CONTEXT_PROMPT_VERSION,
+        }
+        for target_kind, version in current_versions.items():
+            if kind is None or kind == target_kind:
+                removed += cache.prune_template_versions(target_kind, version)
+    
+    if clear_all or older_than is not None or stale_templates:
+        console.print(f"🗑️ {removed}件のキャッシュを削除しました", style="green")
+    
+    table = Table(title=f"🗄️ AI分析キャッシュ ({cache.db_path})")
+    table.add_column("種類", style="cyan")
+    table.add_column("モデル", style="white")
+    table.add_column("プロンプト版", style="yellow")
+    table.add_column("件数", style="green")
+    
+    for entry_kind, model, version, count in cache.summarize():
+        table.add_row(entry_kind, model, version, str(count))
+    
+    console.print(table)
+    console.print(f"合計: {cache.size()}件")
+
+def _display_analysis_cache_stats(client):
+    """分析キャッシュの利用状況を表示"""
+    if client.cache is None:
+        return
+    
+    stats = client.cache.get_stats()
+    if stats['lookups']:
+        console.print(
+            f"🗄️ 分析キャッシュ: {stats['hits']}/{stats['lookups']}件ヒット "
+            f"(ヒット率 {stats['hit_rate']:.1f}%), API リクエスト {client.batch_stats['requests']}回"
+        )
+
 def _display_analysis_summary(report):
     """分析サマリーを表示"""
     summary = report['summary']
@@ -678,6 +744,18 @@ def _display_geocoding_results(result, dry_run, apply):
     table.add_row("失敗", str(result['failed']))
     table.add_row("スキップ", str(result['skipped']))
     
+    async_stats = result.get('async_stats')
+    if async_stats:
+        table.add_row("フォールバック", str(async_stats['fallbacks']))
+        for name, provider_stats in async_stats['providers'].items():
+            table.add_row(f"{name} リクエスト/再試行",
+                          f"{provider_stats['requests']}/{provider_stats['retries']}")
+    
+    cache_stats = result.get('cache_stats')
+    if cache_stats:
+        table.add_row("キャッシュヒット率", f"{cache_stats['hit_rate']:.1f}%")
+        table.add_row("ネガティブキャッシュ", str(cache_stats['negative_hits']))
+    
     console.print(table)
     
     # 成功した結果の表示
@@ -8,7 +8,7 @@
 import click
 import logging
 from bungo_map.core.database import Database
-from bungo_map.utils.aozora_text_cleaner import clean_aozora_sentence
+from bungo_map.utils.aozora_text_cleaner import clean_sentences, sentence_cache_stats
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -26,12 +26,10 @@ def cleanup_database(batch_size: int, preview: bool):
     
     db = Database('data/bungo_production.db')
     
-    # 全placesを取得
+    # 対象件数のみ先に取得（本文は place_id 順にバッチ単位で読み込む）
     with db.get_connection() as conn:
-        cursor = conn.execute("SELECT place_id, sentence FROM places ORDER BY place_id")
-        places = cursor.fetchall()
+        total_places = conn.execute("SELECT COUNT(*) FROM places").fetchone()[0]
     
-    total_places = len(places)
     click.echo(f"📊 対象レコード: {total_places}件")
     
     if total_places == 0:
@@ -46,25 +44,34 @@ def cleanup_database(batch_size: int, preview: bool):
         'examples': []
     }
     
-    # バッチ処理
-    for i in range(0, total_places, batch_size):
-        batch = places[i:i + batch_size]
-        click.echo(f"\n📦 バッチ {i//batch_size + 1}/{(total_places + batch_size - 1)//batch_size} 処理中...")
+    # バッチ処理（place_id によるキーセットページング）
+    total_batches = (total_places + batch_size - 1) // batch_size
+    last_id = 0
+    batch_number = 0
+    while True:
+        with db.get_connection() as conn:
+            batch = conn.execute(
+                "SELECT place_id, sentence FROM places WHERE place_id > ? ORDER BY place_id LIMIT ?",
+                (last_id, batch_size)
+            ).fetchall()
+        if not batch:
+            break
+        last_id = batch[-1][0]
+        batch_number += 1
+        click.echo(f"\n📦 バッチ {batch_number}/{total_batches} 処理中...")
         
         batch_updates = []
         
-        for place_id, original_sentence in batch:
-            if not original_sentence:
-                stats['unchanged'] += 1
-                continue
-            
-            # クリーンアップ実行
-            cleaned_sentence = clean_aozora_sentence(original_sentence)
-            
+        targets = [(place_id, sentence) for place_id, sentence in batch if sentence]
+        stats['unchanged'] += len(batch) - len(targets)
+        
+        # クリーンアップ実行（同一文はメモから取得）
+        cleaned_sentences = clean_sentences(sentence for _, sentence in targets)
+        for (place_id, original_sentence), cleaned_sentence in zip(targets, cleaned_sentences):
             # 変更があるかチェック
             if cleaned_sentence != original_sentence:
                 stats['cleaned'] += 1
-                batch_updates.append((place_id, cleaned_sentence, original_sentence))
+                batch_updates.append((cleaned_sentence, place_id))
                 
                 # 例を保存（最初の5件）
                 if len(stats['examples']) < 5:
@@ -80,13 +87,11 @@ def cleanup_database(batch_size: int, preview: bool):
         
         # データベース更新（プレビューモードでない場合）
         if not preview and batch_updates:
-            with db.get_connection() as conn:
-                for place_id, cleaned_sentence, _ in batch_updates:
-                    conn.execute(
-                        "UPDATE places SET sentence = ? WHERE place_id = ?",
-                        (cleaned_sentence, place_id)
-                    )
-                conn.commit()
+            with db.transaction() as conn:
+                conn.executemany(
+                    "UPDATE places SET sentence = ? WHERE place_id = ?",
+                    batch_updates
+                )
             
             click.echo(f"  ✅ {len(batch_updates)}件更新")
         elif batch_updates:
@@ -103,7 +108,11 @@ def cleanup_database(batch_size: int, preview: bool):
     click.echo(f"  処理レコード: {stats['processed']}")
     click.echo(f"  クリーンアップ: {stats['cleaned']}件")
     click.echo(f"  変更なし: {stats['unchanged']}件")
-    click.echo(f"  変更率: {(stats['cleaned']/stats['processed']*100):.1f}%")
+    if stats['processed']:
+        click.echo(f"  変更率: {(stats['cleaned']/stats['processed']*100):.1f}%")
+    cache_stats = sentence_cache_stats()
+    click.echo(f"  文キャッシュ: ヒット{cache_stats['hits']}件 / ミス{cache_stats['misses']}件 "
+               f"({cache_stats['hit_rate']:.1f}%)")
     
     if preview and stats['cleaned'] > 0:
         click.echo(f"\n⚠️  プレビューモードです。実際に更新するには --preview を外してください。")
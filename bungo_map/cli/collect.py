@@ -24,7 +24,8 @@ class DataCollector:
     def _get_ginza_extractor(self):
         """GiNZA抽出器の遅延初期化"""
         if self.ginza_extractor is None:
-            self.ginza_extractor = GinzaPlaceExtractor()
+            # 地名抽出はNERのみ使用するため依存解析等を無効化
+            self.ginza_extractor = GinzaPlaceExtractor(ner_only=True)
         return self.ginza_extractor
         
     def collect_author_data(self, author_name: str, limit: int = 5, use_ginza: bool = False) -> dict:
@@ -146,19 +146,20 @@ class DataExpansionEngine:
         
         author = authors[0]
         
-        # 作者の作品を取得
-        works = self.db.get_works_by_author(author.author_id)
-        print(f"📚 {author.name} の作品数: {len(works)}作品")
+        # 作者の作品を1件ずつ取得（本文は不要）
+        works_count = self.db.count_works(with_content=False, author_id=author['author_id'])
+        works = self.db.iter_works(with_content=False, author_id=author['author_id'])
+        print(f"📚 {author['name']} の作品数: {works_count}作品")
         
         total_places_added = 0
         results = []
         
         for work in works:
-            print(f"\n   📖 {work.title} を処理中...")
+            print(f"\n   📖 {work['title']} を処理中...")
             
             try:
                 # 既存の地名数確認
-                existing_places = self.db.get_places_by_work(work.work_id)
+                existing_places = self.db.get_places_by_work(work['work_id'])
                 
                 if existing_places and not force_update:
                     print(f"      ⏭️  既に{len(existing_places)}地名あり（スキップ）")
@@ -192,7 +193,7 @@ class DataExpansionEngine:
                     
             except Exception as e:
                 print(f"      ❌ エラー: {e}")
-                results.append({'work_title': work.title, 'status': 'error', 'error': str(e)})
+                results.append({'work_title': work['title'], 'status': 'error', 'error': str(e)})
             
             # API制限対策
             time.sleep(2)
@@ -200,15 +201,15 @@ class DataExpansionEngine:
         end_time = time.time()
         
         summary = {
-            'author_name': author.name,
-            'works_processed': len(works),
+            'author_name': author['name'],
+            'works_processed': works_count,
             'total_places_added': total_places_added,
             'execution_time': round(end_time - start_time, 2),
             'results': results
         }
         
-        print(f"\n✅ {author.name} の地名データ拡充完了")
-        print(f"   処理作品: {len(works)}作品")
+        print(f"\n✅ {author['name']} の地名データ拡充完了")
+        print(f"   処理作品: {works_count}作品")
         print(f"   追加地名: {total_places_added}箇所")
         print(f"   実行時間: {summary['execution_time']}秒")
         
@@ -271,16 +272,8 @@ class DataExpansionEngine:
         print(f"\n📊 **現在のデータベース状況**")
         
         authors = self.db.search_authors("", limit=1000)
-        total_works = 0
-        total_places = 0
-        
-        for author in authors:
-            works = self.db.get_works_by_author(author['author_id'])
-            total_works += len(works)
-            
-            for work in works:
-                places = self.db.get_places_by_work(work['work_id'])
-                total_places += len(places)
+        total_works = self.db.count_works(with_content=False)
+        total_places = self.db.get_place_count()
         
         status = {
             'authors_count': len(authors),
@@ -296,7 +289,7 @@ class DataExpansionEngine:
         if authors:
             print(f"\n📝 登録作者一覧:")
             for i, author in enumerate(authors[:10], 1):
-                works_count = len(self.db.get_works_by_author(author['author_id']))
+                works_count = self.db.count_works(with_content=False, author_id=author['author_id'])
                 birth_info = f"({author['birth_year']}-{author['death_year']})" if author['birth_year'] else ""
                 print(f"   {i:2d}. {author['name']} {birth_info} - {works_count}作品")
             
@@ -8,9 +8,10 @@
 import click
 import json
 import csv
+from itertools import islice
 from pathlib import Path
 from bungo_map.core.database import init_db
-from bungo_map.utils import GeoJSONExporter
+from bungo_map.utils import GeoJSONExporter, TilePyramidExporter
 
 
 class ExportManager:
@@ -21,8 +22,12 @@ class ExportManager:
         self.geojson_exporter = GeoJSONExporter(self.db)
     
     def export_geojson(self, output_path: str = "output/bungo_places.geojson", 
-                      preview: bool = False) -> bool:
-        """GeoJSONエクスポート"""
+                      preview: bool = False, seq: bool = False,
+                      compress: bool = False) -> bool:
+        """GeoJSONエクスポート（Feature単位で逐次書き込み）
+        
+        seq=True で改行区切りGeoJSON（GeoJSONSeq）、compress=True でgzip圧縮して出力
+        """
         
         if preview:
             # プレビューモード：統計情報のみ表示
@@ -56,7 +61,9 @@ class ExportManager:
             # 実際のエクスポート実行
             click.echo(f"📤 GeoJSONエクスポート開始: {output_path}")
             
-            success = self.geojson_exporter.export_to_file(output_path)
+            success = self.geojson_exporter.export_to_file(
+                output_path, seq=seq, compress=compress or None
+            )
             
             if success:
                 # ファイルサイズを確認
@@ -65,29 +72,53 @@ class ExportManager:
                 click.echo(f"  - ファイル: {output_path}")
                 click.echo(f"  - サイズ: {file_size:,} bytes")
                 
-                # 統計情報も表示
-                stats = self.geojson_exporter.get_export_stats()
-                click.echo(f"  - 地名数: {stats['total_places']}")
-                click.echo(f"  - 作者数: {stats['unique_authors']}")
-                click.echo(f"  - 作品数: {stats['unique_works']}")
+                click.echo(f"  - 形式: {'GeoJSONSeq' if seq else 'GeoJSON'}")
+                click.echo(f"  - 地名数: {self.geojson_exporter.last_export_count}")
                 
                 return True
             else:
                 click.echo("❌ エクスポートに失敗しました")
                 return False
     
+    def export_tiles(self, output_path: str = "output/tiles", min_zoom: int = 0,
+                     max_zoom: int = 14) -> bool:
+        """クラスタリング済みタイルピラミッドのエクスポート
+        
+        出力先が .mbtiles の場合はMBTiles、それ以外は z/x/y.json のディレクトリ
+        """
+        
+        click.echo(f"📤 タイルエクスポート開始: {output_path} (z{min_zoom}〜z{max_zoom})")
+        
+        try:
+            exporter = TilePyramidExporter(self.db, min_zoom=min_zoom, max_zoom=max_zoom)
+            if output_path.endswith('.mbtiles'):
+                stats = exporter.export_mbtiles(output_path)
+            else:
+                stats = exporter.export_directory(output_path)
+            
+            click.echo(f"✅ タイルエクスポート完了！")
+            click.echo(f"  - 出力: {output_path}")
+            click.echo(f"  - 地名数: {stats['places']}")
+            click.echo(f"  - タイル数: {stats['tiles']}")
+            click.echo(f"  - クラスタ数: {stats['clusters']}")
+            for zoom, count in sorted(stats['tiles_by_zoom'].items()):
+                click.echo(f"    z{zoom}: {count}タイル")
+            
+            return True
+            
+        except Exception as e:
+            click.echo(f"❌ タイルエクスポートエラー: {e}")
+            return False
+    
     def export_csv(self, output_path: str = "output/bungo_places.csv") -> bool:
         """CSVエクスポート"""
         
         click.echo(f"📤 CSVエクスポート開始: {output_path}")
         
         try:
-            # データ取得
-            places_data = self.geojson_exporter.get_places_with_metadata()
-            
-            if not places_data:
-                click.echo("❌ エクスポート対象のデータがありません")
-                return False
+            # データは1件ずつ読み込みながら書き込む
+            places_data = self.geojson_exporter.iter_places_with_metadata()
+            record_count = 0
             
             # ディレクトリ作成
             output_dir = Path(output_path).parent
@@ -107,6 +138,7 @@ class ExportManager:
                 writer.writeheader()
                 
                 for place in places_data:
+                    record_count += 1
                     writer.writerow({
                         'place_id': place['place_id'],
                         'place_name': place['place_name'],
@@ -125,12 +157,16 @@ class ExportManager:
                         'author_wiki_url': place['author_wiki_url']
                     })
             
+            if record_count == 0:
+                click.echo("❌ エクスポート対象のデータがありません")
+                return False
+            
             # 結果表示
             file_size = Path(output_path).stat().st_size
             click.echo(f"✅ CSVエクスポート完了！")
             click.echo(f"  - ファイル: {output_path}")
             click.echo(f"  - サイズ: {file_size:,} bytes")
-            click.echo(f"  - レコード数: {len(places_data)}")
+            click.echo(f"  - レコード数: {record_count}")
             
             return True
             
@@ -140,7 +176,7 @@ class ExportManager:
     
     def show_sample_geojson(self, limit: int = 3) -> None:
         """GeoJSONサンプル表示"""
-        places_data = self.geojson_exporter.get_places_with_metadata()[:limit]
+        places_data = list(islice(self.geojson_exporter.iter_places_with_metadata(page_size=limit), limit))
         
         if not places_data:
             click.echo("❌ 表示対象のデータがありません")
@@ -165,12 +201,17 @@ class ExportManager:
 
 
 @click.command()
-@click.option('--format', 'export_format', type=click.Choice(['geojson', 'csv']), 
+@click.option('--format', 'export_format', type=click.Choice(['geojson', 'csv', 'tiles']), 
               default='geojson', help='エクスポート形式')
 @click.option('--output', '-o', help='出力ファイルパス')
 @click.option('--preview', is_flag=True, help='プレビューのみ（実際の出力は行わない）')
 @click.option('--sample', is_flag=True, help='サンプルGeoJSONを表示')
-def export(export_format: str, output: str, preview: bool, sample: bool):
+@click.option('--seq', is_flag=True, help='改行区切りGeoJSON（GeoJSONSeq）で出力')
+@click.option('--gzip', 'compress', is_flag=True, help='gzip圧縮して出力（.gz 拡張子でも有効）')
+@click.option('--min-zoom', default=0, type=int, help='タイルの最小ズーム')
+@click.option('--max-zoom', default=14, type=int, help='タイルの最大ズーム')
+def export(export_format: str, output: str, preview: bool, sample: bool, seq: bool, compress: bool,
+           min_zoom: int, max_zoom: int):
     """📤 データエクスポートコマンド"""
     
     manager = ExportManager()
@@ -181,8 +222,9 @@ def export(export_format: str, output: str, preview: bool, sample: bool):
         
     elif export_format == 'geojson':
         # GeoJSONエクスポート
-        output_path = output or "output/bungo_places.geojson"
-        manager.export_geojson(output_path, preview=preview)
+        default_path = "output/bungo_places.geojsons" if seq else "output/bungo_places.geojson"
+        output_path = output or (default_path + ".gz" if compress else default_path)
+        manager.export_geojson(output_path, preview=preview, seq=seq, compress=compress)
         
     elif export_format == 'csv':
         # CSVエクスポート
@@ -192,12 +234,20 @@ def export(export_format: str, output: str, preview: bool, sample: bool):
         else:
             manager.export_csv(output_path)
     
+    elif export_format == 'tiles':
+        # タイルピラミッドエクスポート（.mbtiles 指定でMBTiles）
+        output_path = output or "output/tiles"
+        manager.export_tiles(output_path, min_zoom=min_zoom, max_zoom=max_zoom)
+        
     else:
         click.echo("使用方法:")
         click.echo("  --format geojson         # GeoJSONエクスポート")
         click.echo("  --format csv             # CSVエクスポート")
+        click.echo("  --format tiles           # タイルピラミッド（-o *.mbtiles でMBTiles）")
         click.echo("  --preview               # プレビューのみ")
         click.echo("  --sample                # サンプル表示")
+        click.echo("  --seq                   # 改行区切りGeoJSON")
+        click.echo("  --gzip                  # gzip圧縮")
         click.echo("  -o output.geojson       # 出力ファイル指定")
 
 
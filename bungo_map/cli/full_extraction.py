@@ -9,10 +9,12 @@ import click
 import logging
 import time
 import sqlite3
+from itertools import islice
 from typing import List, Dict
 from bungo_map.core.database import Database
 from bungo_map.extractors.simple_place_extractor import SimplePlaceExtractor
 from bungo_map.ai.extractors.precise_compound_extractor import PreciseCompoundExtractor
+from bungo_map.utils.span_resolver import resolve_overlaps
 
 # ログ設定
 logging.basicConfig(
@@ -48,22 +50,9 @@ def full_extraction(with_ai: bool, limit: int, offset: int, batch_size: int):
     else:
         click.echo("📋 Regex抽出器のみ使用")
     
-    # コンテンツ付き作品を取得
-    works_query = """
-        SELECT work_id, title, content, aozora_url
-        FROM works 
-        WHERE content IS NOT NULL 
-        ORDER BY work_id
-    """
-    
-    if limit:
-        works_query += f" LIMIT {limit} OFFSET {offset}"
-    
-    with db.get_connection() as conn:
-        cursor = conn.execute(works_query)
-        works = cursor.fetchall()
-    
-    total_works = len(works)
+    # コンテンツ付き作品を1件ずつ取得（work_id順のキーセットページング）
+    total_works = db.count_works(limit=limit, offset=offset)
+    works = db.iter_works(limit=limit, offset=offset)
     click.echo(f"📚 処理対象: {total_works}作品")
     
     # 統計情報
@@ -78,12 +67,19 @@ def full_extraction(with_ai: bool, limit: int, offset: int, batch_size: int):
     }
     
     # バッチ処理
-    for i in range(0, total_works, batch_size):
-        batch = works[i:i + batch_size]
-        click.echo(f"\n📦 バッチ {i//batch_size + 1}/{(total_works + batch_size - 1)//batch_size} 処理中...")
+    total_batches = (total_works + batch_size - 1) // batch_size
+    batch_num = 0
+    while True:
+        batch = list(islice(works, batch_size))
+        if not batch:
+            break
+        batch_num += 1
+        click.echo(f"\n📦 バッチ {batch_num}/{total_batches} 処理中...")
         
         for work in batch:
-            work_id, title, content, aozora_url = work
+            work_id, title, content, aozora_url = (
+                work['work_id'], work['title'], work['content'], work['aozora_url']
+            )
             
             try:
                 click.echo(f"  📖 処理中: {title[:50]}...")
@@ -133,7 +129,7 @@ def full_extraction(with_ai: bool, limit: int, offset: int, batch_size: int):
                 logger.error(f"作品 {work_id} でエラー: {e}")
         
         # バッチ終了時の進捗表示
-        progress = (stats['processed'] / total_works) * 100
+        progress = (stats['processed'] / total_works) * 100 if total_works else 100.0
         elapsed = time.time() - stats['start_time']
         click.echo(f"  📊 進捗: {stats['processed']}/{total_works} ({progress:.1f}%) - {elapsed:.1f}秒経過")
     
@@ -152,58 +148,14 @@ def full_extraction(with_ai: bool, limit: int, offset: int, batch_size: int):
     click.echo(f"  平均速度: {stats['total_places']/total_time:.1f}件/秒")
 
 def deduplicate_places(places: List) -> List:
-    """複数抽出器の結果を統合・重複排除"""
+    """複数抽出器の結果を統合・重複排除
+    
+    作品内の文ごとに、文中位置が重なる地名から長い地名・高優先度の手法・高信頼度の順に採用する。
+    """
     if not places:
         return []
     
-    # 作品内の文レベルで重複排除
-    by_sentence = {}
-    for place in places:
-        sentence_key = (place.work_id, place.sentence)
-        if sentence_key not in by_sentence:
-            by_sentence[sentence_key] = []
-        by_sentence[sentence_key].append(place)
-    
-    deduplicated = []
-    
-    for sentence_key, sentence_places in by_sentence.items():
-        if len(sentence_places) == 1:
-            deduplicated.extend(sentence_places)
-            continue
-        
-        # 優先度: AI複合地名 > 長い地名 > 高信頼度
-        sorted_places = sorted(sentence_places, key=lambda p: (
-            -1 if 'precise_compound' in p.extraction_method else 0,  # AI複合地名を最優先
-            -len(p.place_name),  # 長い地名を優先
-            -p.confidence        # 高信頼度を優先
-        ))
-        
-        selected = []
-        for place in sorted_places:
-            # 包含関係をチェック
-            is_contained = any(
-                place.place_name in selected_place.place_name and 
-                place.place_name != selected_place.place_name
-                for selected_place in selected
-            )
-            
-            if not is_contained:
-                # 現在の地名が既存を包含するかチェック
-                to_remove = [
-                    i for i, selected_place in enumerate(selected)
-                    if (selected_place.place_name in place.place_name and
-                        selected_place.place_name != place.place_name)
-                ]
-                
-                # 包含される地名を削除
-                for i in reversed(to_remove):
-                    selected.pop(i)
-                
-                selected.append(place)
-        
-        deduplicated.extend(selected)
-    
-    return deduplicated
+    return resolve_overlaps(places)
 
 if __name__ == '__main__':
     full_extraction() 
\ No newline at end of file
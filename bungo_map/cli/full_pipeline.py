@@ -12,16 +12,21 @@ Features:
 - 統計レポート
 """
 
-import sqlite3
 import time
+import json
+import hashlib
 import logging
 import click
-from typing import List, Dict, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple
 
+from bungo_map.core.database import BungoDB, calculate_content_hash
 from bungo_map.extractors.simple_place_extractor import SimplePlaceExtractor
 from bungo_map.extractors.enhanced_place_extractor import EnhancedPlaceExtractor  
-from bungo_map.ai.extractors.precise_compound_extractor import PreciseCompoundExtractor
+from bungo_map.ai.extractors.precise_compound_extractor import PreciseCompoundExtractor, COMPOUND_PLACE_PATTERN
 from bungo_map.ai.context_aware_geocoding import ContextAwareGeocodingService
+from bungo_map.utils.aozora_text_cleaner import sentence_cache_stats
 
 # パッケージのルートディレクトリを追加
 import sys
@@ -30,13 +35,90 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 logger = logging.getLogger(__name__)
 
+# 抽出ロジック（辞書・パターン以外）を変更したら更新する
+# 差分抽出モードでは、このバージョンを含むフィンガープリントが変わった作品を再抽出する
+EXTRACTOR_VERSION = "3.0.5"
+
+
+def extract_work_places(enhanced_extractor: EnhancedPlaceExtractor,
+                        ai_extractor: PreciseCompoundExtractor,
+                        work_data: Dict, use_ai: bool = True) -> Optional[List]:
+    """作品から地名抽出（状態を持たない純粋な抽出処理）
+    
+    抽出に失敗した場合は None を返す（空リストは「地名なし」として保存される）。
+    """
+    work_id = work_data['work_id']
+    title = work_data['title']
+    content = work_data['content']
+    all_places = []
+    
+    try:
+        # 0. 前処理（本文抽出・文分割・文クリーニング）は作品ごとに1回だけ行い全抽出器で共有
+        processed = enhanced_extractor.process_work(work_id, content or "")
+        
+        # 1. 強化版地名抽出（青空文庫処理 + 適切な文脈取得）
+        enhanced_places = enhanced_extractor.extract_places_from_work(
+            work_id, content, processed=processed
+        )
+        
+        # 2. SimplePlaceと互換フォーマットに変換
+        simple_places = enhanced_extractor.convert_to_simple_places(enhanced_places)
+        all_places.extend(simple_places)
+        
+        # 3. AI複合地名抽出（青空文庫クリーナー統合済み）
+        #    本文処理に失敗した作品（本文・文数が少ない）は元テキストを句点で分割して処理
+        if use_ai:
+            try:
+                ai_places = ai_extractor.extract_precise_places(
+                    work_id, content, processed=processed if processed.success else None
+                )
+                all_places.extend(ai_places)
+            except Exception as e:
+                logger.warning(f"AI抽出エラー: {title} - {e}")
+        
+        logger.info(f"✅ '{title}': {len(all_places)}件の地名抽出")
+        
+    except Exception as e:
+        logger.error(f"❌ '{title}' 抽出エラー: {e}")
+        return None
+    
+    return all_places
+
+
+def extract_with_cache_stats(enhanced_extractor: EnhancedPlaceExtractor,
+                             ai_extractor: PreciseCompoundExtractor,
+                             work_data: Dict, use_ai: bool = True) -> Tuple[Optional[List], Dict[str, int]]:
+    """地名抽出（失敗時は None）と、その間の文クリーニングメモのヒット・ミス数"""
+    before = sentence_cache_stats()
+    places = extract_work_places(enhanced_extractor, ai_extractor, work_data, use_ai)
+    after = sentence_cache_stats()
+    return places, {key: after[key] - before[key] for key in ('hits', 'misses')}
+
+
+# ワーカープロセスごとの抽出器（_init_extraction_worker で1回だけ生成）
+_worker_extractors: Dict = {}
+
+
+def _init_extraction_worker() -> None:
+    """ワーカープロセス初期化"""
+    _worker_extractors['enhanced'] = EnhancedPlaceExtractor()
+    _worker_extractors['ai'] = PreciseCompoundExtractor()
+
+
+def _extract_in_worker(work_data: Dict, use_ai: bool) -> Tuple[Optional[List], Dict[str, int]]:
+    """ワーカープロセスでの地名抽出（メモ統計はプロセスごとのため差分を返す）"""
+    return extract_with_cache_stats(
+        _worker_extractors['enhanced'], _worker_extractors['ai'], work_data, use_ai
+    )
+
+
 class FullPipeline:
     """完全統合パイプライン（改良版）"""
     
     def __init__(self, db_path: str = 'data/bungo_production.db'):
         """初期化"""
         self.db_path = db_path
-        # self.db = Database(db_path)
+        self.db = BungoDB(db_path)  # プール接続（WAL）を全処理で共有
         self.simple_extractor = SimplePlaceExtractor()
         self.enhanced_extractor = EnhancedPlaceExtractor()
         self.ai_extractor = PreciseCompoundExtractor()
@@ -58,8 +140,11 @@ class FullPipeline:
         self.stats = {
             'total_works': 0,
             'processed_works': 0,
+            'skipped_works': 0,
+            'failed_works': 0,
             'total_places': 0,
             'extraction_methods': {},
+            'sentence_cache': {'hits': 0, 'misses': 0},
             'geocoding_success': 0,
             'geocoding_failed': 0,
             'geocoding_skipped': 0,
@@ -73,191 +158,203 @@ class FullPipeline:
     def reset_places_data(self) -> None:
         """placesテーブルを初期化"""
         click.echo("🧹 placesテーブル初期化中...")
-        with sqlite3.connect(self.db_path) as conn:
+        with self.db.transaction() as conn:
             conn.execute("DELETE FROM places")
             conn.execute("UPDATE sqlite_sequence SET seq = 0 WHERE name = 'places'")
-            conn.commit()
+            self.db.clear_extraction_state()
         
-        # VACUUMは別接続で実行
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("VACUUM")
-        conn.close()
+        # VACUUMはトランザクション外で実行
+        with self.db.get_connection() as conn:
+            conn.execute("VACUUM")
         
         click.echo("✅ placesテーブル初期化完了")
     
-    def get_works_for_processing(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
-        """処理対象作品の取得"""
-        with sqlite3.connect(self.db_path) as conn:
-            if limit:
-                cursor = conn.execute("""
-                    SELECT w.work_id, w.title, a.name as author_name, w.content, w.aozora_url 
-                    FROM works w 
-                    JOIN authors a ON w.author_id = a.author_id
-                    WHERE w.content IS NOT NULL AND w.content != ''
-                    ORDER BY w.work_id LIMIT ? OFFSET ?
-                """, (limit, offset))
-            else:
-                cursor = conn.execute("""
-                    SELECT w.work_id, w.title, a.name as author_name, w.content, w.aozora_url 
-                    FROM works w 
-                    JOIN authors a ON w.author_id = a.author_id
-                    WHERE w.content IS NOT NULL AND w.content != ''
-                    ORDER BY w.work_id
-                """)
-            
-            works = [
-                {
-                    'work_id': row[0], 'title': row[1], 'author_name': row[2], 
-                    'content': row[3], 'aozora_url': row[4]
-                }
-                for row in cursor.fetchall()
-            ]
-        
-        self.stats['total_works'] = len(works)
-        return works
+    def get_works_for_processing(self, limit: Optional[int] = None, offset: int = 0,
+                                 stale_for: Optional[str] = None) -> Iterator[Dict]:
+        """処理対象作品の取得（work_id順に1件ずつ読み込むジェネレータ）
+        
+        stale_for を指定した場合は、そのフィンガープリントで未抽出の可能性がある作品のみ。
+        """
+        self.stats['total_works'] = self.db.count_works(limit=limit, offset=offset, stale_for=stale_for)
+        return self.db.iter_works(limit=limit, offset=offset, stale_for=stale_for)
     
-    def extract_places_from_work(self, work_data: Dict, use_ai: bool = True) -> List:
-        """作品から地名抽出"""
-        work_id = work_data['work_id']
-        title = work_data['title']
-        content = work_data['content']
-        all_places = []
-        
-        try:
-            # 1. 強化版地名抽出（青空文庫処理 + 適切な文脈取得）
-            enhanced_places = self.enhanced_extractor.extract_places_from_work(
-                work_id, content
-            )
-            
-            # 2. SimplePlaceと互換フォーマットに変換
-            simple_places = self.enhanced_extractor.convert_to_simple_places(enhanced_places)
-            all_places.extend(simple_places)
-            
-            # 3. AI複合地名抽出（青空文庫クリーナー統合済み）
-            if use_ai:
-                try:
-                    ai_places = self.ai_extractor.extract_precise_places(work_id, content)
-                    all_places.extend(ai_places)
-                except Exception as e:
-                    logger.warning(f"AI抽出エラー: {title} - {e}")
-            
-            # 統計更新
-            for place in all_places:
-                method = place.extraction_method
-                self.stats['extraction_methods'][method] = self.stats['extraction_methods'].get(method, 0) + 1
+    def extractor_fingerprint(self, use_ai: bool = True) -> str:
+        """抽出器フィンガープリント
+        
+        EXTRACTOR_VERSION・AI抽出の有無・地名パターン（複合地名パターンを含む）・辞書見出し語から算出する。
+        辞書やパターンを変更すると自動的に変わり、差分抽出で全作品が再抽出される。
+        """
+        simple_extractor = self.enhanced_extractor.simple_extractor
+        gazetteer_names = sorted(
+            name
+            for info in simple_extractor.gazetteer_patterns
+            for name in info['matcher']
+        )
+        payload = json.dumps([
+            EXTRACTOR_VERSION,
+            use_ai,
+            simple_extractor.combined_pattern.pattern,
+            COMPOUND_PLACE_PATTERN.pattern,
+            gazetteer_names,
+        ], ensure_ascii=False)
+        return hashlib.md5(payload.encode('utf-8')).hexdigest()
+    
+    def select_changed_works(self, works: Iterable[Dict], fingerprint: str) -> Iterator[Dict]:
+        """本文ハッシュを付与し、前回抽出時から変化のない作品を除外
+        
+        ハッシュ未計算（新規・本文更新）の作品は本文からハッシュを計算し、
+        前回抽出時と同一ならハッシュだけ記録してスキップする。
+        """
+        for work in works:
+            content_hash = calculate_content_hash(work['content'])
+            unchanged = (content_hash == work.get('extracted_hash') and
+                         work.get('extractor_version') == fingerprint)
             
-            logger.info(f"✅ '{title}': {len(all_places)}件の地名抽出")
+            if unchanged:
+                if work.get('content_hash') != content_hash:
+                    self.db.set_work_content_hash(work['work_id'], content_hash)
+                self.stats['skipped_works'] += 1
+                continue
             
-        except Exception as e:
-            logger.error(f"❌ '{title}' 抽出エラー: {e}")
-        
+            work['content_hash'] = content_hash
+            yield work
+    
+    
+    def extract_places_from_work(self, work_data: Dict, use_ai: bool = True) -> Optional[List]:
+        """作品から地名抽出（失敗時は None）"""
+        all_places, cache_delta = extract_with_cache_stats(
+            self.enhanced_extractor, self.ai_extractor, work_data, use_ai
+        )
+        self._record_extraction_stats(all_places, cache_delta)
         return all_places
     
+    def _record_extraction_stats(self, places: Optional[List], cache_delta: Dict[str, int]) -> None:
+        """抽出手法別統計・文クリーニングメモ統計の更新"""
+        for key, count in cache_delta.items():
+            self.stats['sentence_cache'][key] += count
+        for place in places or ():
+            method = place.extraction_method
+            self.stats['extraction_methods'][method] = self.stats['extraction_methods'].get(method, 0) + 1
+    
+    def iter_extracted_works(self, works: Iterable[Dict], use_ai: bool = True,
+                             workers: int = 1) -> Iterator[Tuple[Dict, Optional[List]]]:
+        """作品ごとの抽出結果（失敗時は None）を入力順（work_id順）に返す
+        
+        workers > 1 の場合はプロセスプールで並列抽出する。
+        先行投入数を workers * 2 に制限し、メモリ上の作品本文を抑える。
+        """
+        if workers <= 1:
+            for work in works:
+                yield work, self.extract_places_from_work(work, use_ai)
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_extraction_worker) as executor:
+            pending = deque()
+            for work in works:
+                pending.append((work, executor.submit(_extract_in_worker, work, use_ai)))
+                if len(pending) >= workers * 2:
+                    done_work, future = pending.popleft()
+                    places, cache_delta = future.result()
+                    self._record_extraction_stats(places, cache_delta)
+                    yield done_work, places
+            
+            while pending:
+                done_work, future = pending.popleft()
+                places, cache_delta = future.result()
+                self._record_extraction_stats(places, cache_delta)
+                yield done_work, places
+    
     def save_places_to_db(self, places: List) -> None:
         """地名データをデータベースに保存"""
         if not places:
             return
         
-        with sqlite3.connect(self.db_path) as conn:
-            for place in places:
-                conn.execute("""
-                    INSERT INTO places (work_id, place_name, before_text, sentence, after_text, 
-                                      aozora_url, confidence, extraction_method)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    place.work_id, place.place_name, place.before_text, place.sentence,
-                    place.after_text, place.aozora_url, place.confidence, place.extraction_method
-                ))
-            conn.commit()
+        self.db.insert_places_bulk(places)
+    
+    def save_work_results(self, results: List[Tuple[int, str, List]], fingerprint: str) -> int:
+        """作品単位で地名を置き換えて保存（抽出済みハッシュも同一トランザクションで記録）"""
+        if not results:
+            return 0
+        
+        return self.db.replace_work_places(results, fingerprint)
     
-    def geocode_places(self, batch_size: int = 50, min_confidence: float = 0.5) -> None:
-        """地名のGeocoding処理"""
+    def geocode_places(self, min_confidence: float = 0.5,
+                       work_ids: Optional[List[int]] = None) -> None:
+        """地名のGeocoding処理（work_ids 指定時はその作品の地名のみ）
+        
+        文脈も含めて対象地名を1回のSELECTで取得し、(地名, 文脈シグネチャ) ごとに
+        1回だけ座標解決して、結果を1回の executemany で反映する。
+        """
         click.echo("🗺️ Geocoding処理開始...")
         
-        # 対象地名取得
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT place_id, place_name, confidence 
+        work_filter = ""
+        params: List = [min_confidence]
+        if work_ids is not None:
+            work_filter = "AND work_id IN (SELECT value FROM json_each(?))"
+            params.append(json.dumps(work_ids))
+        
+        # 対象地名と文脈を一括取得
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(f"""
+                SELECT place_id, place_name, confidence, sentence, before_text, after_text
                 FROM places 
                 WHERE lat IS NULL AND lng IS NULL
                 AND confidence >= ?
+                {work_filter}
                 ORDER BY confidence DESC, LENGTH(place_name) DESC
-            """, (min_confidence,))
+            """, params)
             places_to_geocode = cursor.fetchall()
         
         if not places_to_geocode:
             click.echo("⏭️ Geocoding対象地名がありません")
             return
         
-        total_places = len(places_to_geocode)
-        total_batches = (total_places + batch_size - 1) // batch_size
-        
-        click.echo(f"📍 Geocoding対象: {total_places}件 ({total_batches}バッチ)")
-        
-        for i in range(0, total_places, batch_size):
-            batch = places_to_geocode[i:i + batch_size]
-            batch_num = i//batch_size + 1
-            
-            click.echo(f"📦 Geocodingバッチ {batch_num}/{total_batches} ({len(batch)}件)")
-            
-            batch_updates = []
-            
-            for place_id, place_name, confidence in batch:
-                # 低信頼度や明らかに地名でないものはスキップ
-                if len(place_name) <= 1 or confidence < 0.3:
-                    self.stats['geocoding_skipped'] += 1
-                    continue
-                
-                # 文脈情報を取得してAI文脈判断型Geocoding実行
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.execute("""
-                        SELECT sentence, before_text, after_text 
-                        FROM places WHERE place_id = ?
-                    """, (place_id,))
-                    context_data = cursor.fetchone()
-                
-                if context_data:
-                    sentence, before_text, after_text = context_data
-                    geocoding_result = self.geocoding_service.geocode_place_sync(
-                        place_name=place_name,
-                        sentence=sentence or "",
-                        before_text=before_text or "",
-                        after_text=after_text or ""
-                    )
-                else:
-                    geocoding_result = self.geocoding_service.geocode_place_sync(place_name)
-                
-                if geocoding_result:
-                    batch_updates.append((
-                        geocoding_result.latitude,
-                        geocoding_result.longitude,
-                        geocoding_result.confidence,
-                        geocoding_result.source,
-                        geocoding_result.prefecture,
-                        geocoding_result.city,
-                        place_id
-                    ))
-                    self.stats['geocoding_success'] += 1
-                else:
-                    self.stats['geocoding_failed'] += 1
-            
-            # バッチ更新
-            if batch_updates:
-                with sqlite3.connect(self.db_path) as conn:
-                    conn.executemany("""
-                        UPDATE places SET 
-                            lat = ?, lng = ?, geocoding_confidence = ?, geocoding_source = ?,
-                            prefecture = ?, city = ?
-                        WHERE place_id = ?
-                    """, batch_updates)
-                    conn.commit()
-                
-                click.echo(f"  ✅ {len(batch_updates)}件のGeocoding完了")
-            
-            # 進捗表示
-            processed = min(i + batch_size, total_places)
-            progress = (processed / total_places) * 100
-            click.echo(f"  📊 進捗: {processed}/{total_places} ({progress:.1f}%)")
+        # 低信頼度や明らかに地名でないものはスキップ
+        targets = [
+            row for row in places_to_geocode
+            if len(row[1]) > 1 and row[2] >= 0.3
+        ]
+        self.stats['geocoding_skipped'] += len(places_to_geocode) - len(targets)
+        
+        total_places = len(targets)
+        click.echo(f"📍 Geocoding対象: {total_places}件")
+        
+        # AI文脈判断型Geocoding（同一地名・同一文脈判定は1回だけ解決）
+        resolved_before = self.geocoding_service.batch_stats['resolved']
+        results = self.geocoding_service.geocode_places_batch(
+            (place_name, sentence, before_text, after_text)
+            for _, place_name, _, sentence, before_text, after_text in targets
+        )
+        resolved = self.geocoding_service.batch_stats['resolved'] - resolved_before
+        click.echo(f"  🔁 座標解決: {resolved}件（重複排除前 {total_places}件）")
+        
+        updates = []
+        for row, geocoding_result in zip(targets, results):
+            if geocoding_result:
+                updates.append((
+                    geocoding_result.latitude,
+                    geocoding_result.longitude,
+                    geocoding_result.confidence,
+                    geocoding_result.source,
+                    geocoding_result.prefecture,
+                    geocoding_result.city,
+                    row[0]
+                ))
+                self.stats['geocoding_success'] += 1
+            else:
+                self.stats['geocoding_failed'] += 1
+        
+        # 一括更新
+        if updates:
+            with self.db.transaction() as conn:
+                conn.executemany("""
+                    UPDATE places SET 
+                        lat = ?, lng = ?, geocoding_confidence = ?, geocoding_source = ?,
+                        prefecture = ?, city = ?
+                    WHERE place_id = ?
+                """, updates)
+        
+        click.echo(f"  ✅ {len(updates)}件のGeocoding完了")
     
     def run_quality_management(self, auto_cleanup: bool = True) -> Dict:
         """🆕 品質管理の実行"""
@@ -309,46 +406,78 @@ class FullPipeline:
                          enable_quality_management: bool = True,
                          limit: Optional[int] = None,
                          batch_size: int = 5,
-                         geocoding_min_confidence: float = 0.5) -> Dict:
-        """完全統合パイプライン実行（改良版）"""
+                         geocoding_min_confidence: float = 0.5,
+                         workers: int = 1,
+                         offset: int = 0,
+                         incremental: bool = False) -> Dict:
+        """完全統合パイプライン実行（改良版）
+        
+        workers > 1 の場合、抽出は複数プロセスで並列実行し、
+        保存はこのプロセスが work_id 順にバッチ単位で行う。
+        incremental=True の場合は placesを初期化せず、新規・本文変更・抽出器変更の
+        作品のみを再抽出し、その作品の地名だけを置き換えてGeocodingする。
+        """
         
         pipeline_start = time.time()
+        fingerprint = self.extractor_fingerprint(use_ai)
         
-        if reset_data:
+        if reset_data and not incremental:
             self.reset_places_data()
         
-        works = self.get_works_for_processing(limit)
-        total_works = len(works)
+        works = self.get_works_for_processing(limit, offset,
+                                              stale_for=fingerprint if incremental else None)
+        total_works = self.stats['total_works']
         
         if total_works == 0:
-            click.echo("⚠️ 処理対象の作品がありません")
+            click.echo("⚠️ 処理対象の作品がありません" if not incremental else "✅ 変更された作品はありません")
             return {'stats': self.stats}
         
-        click.echo(f"🚀 パイプライン開始: {total_works}作品")
-        
-        # バッチ処理
-        for i in range(0, total_works, batch_size):
-            batch = works[i:i + batch_size]
-            batch_num = i//batch_size + 1
-            total_batches = (total_works + batch_size - 1)//batch_size
-            
-            click.echo(f"📦 バッチ {batch_num}/{total_batches} ({len(batch)}作品)")
-            
-            batch_places = []
-            for work in batch:
-                places = self.extract_places_from_work(work, use_ai)
-                batch_places.extend(places)
-                self.stats['processed_works'] += 1
+        if incremental:
+            works = self.select_changed_works(works, fingerprint)
+        else:
+            works = (dict(work, content_hash=calculate_content_hash(work['content'])) for work in works)
+        
+        click.echo(f"🚀 パイプライン開始: {total_works}作品" +
+                   (" (差分抽出候補)" if incremental else "") +
+                   (f" ({workers}プロセス並列)" if workers > 1 else ""))
+        
+        # バッチ処理（作品は1件ずつ読み込み、抽出結果は work_id 順に届く）
+        total_batches = (total_works + batch_size - 1)//batch_size
+        batch_results = []
+        processed_work_ids = []
+        batch_num = 0
+        
+        for work, places in self.iter_extracted_works(works, use_ai, workers):
+            if places is None:
+                # 抽出失敗: 既存の地名を残し、抽出済みにも記録しない（次回の差分抽出で再試行）
+                self.stats['failed_works'] += 1
+                continue
             
-            # バッチ保存
-            self.save_places_to_db(batch_places)
-            self.stats['total_places'] += len(batch_places)
+            batch_results.append((work['work_id'], work['content_hash'], places))
+            processed_work_ids.append(work['work_id'])
+            self.stats['processed_works'] += 1
             
-            click.echo(f"  ✅ {len(batch_places)}件の地名保存完了")
+            if len(batch_results) == batch_size:
+                batch_num += 1
+                self._save_batch(batch_results, fingerprint, batch_num, total_batches)
+                batch_results = []
+        
+        if batch_results:
+            batch_num += 1
+            self._save_batch(batch_results, fingerprint, batch_num, total_batches)
+        
+        if incremental:
+            click.echo(f"⏭️ 変更なしでスキップ: {self.stats['skipped_works']}作品")
+        if self.stats['failed_works']:
+            click.echo(f"⚠️ 抽出失敗: {self.stats['failed_works']}作品（地名は更新せず、次回の差分抽出で再試行）")
         
         # Geocoding処理
         if enable_geocoding:
-            self.geocode_places(min_confidence=geocoding_min_confidence)
+            if incremental and not processed_work_ids:
+                click.echo("⏭️ Geocoding対象地名がありません")
+            else:
+                self.geocode_places(min_confidence=geocoding_min_confidence,
+                                    work_ids=processed_work_ids if incremental else None)
         
         # 🆕 品質管理実行
         if enable_quality_management:
@@ -360,6 +489,16 @@ class FullPipeline:
         
         return {'stats': self.stats}
     
+    def _save_batch(self, batch_results: List[Tuple[int, str, List]], fingerprint: str,
+                    batch_num: int, total_batches: int) -> None:
+        """抽出バッチの保存と進捗表示"""
+        click.echo(f"📦 バッチ {batch_num}/{total_batches} ({len(batch_results)}作品)")
+        
+        saved = self.save_work_results(batch_results, fingerprint)
+        self.stats['total_places'] += saved
+        
+        click.echo(f"  ✅ {saved}件の地名保存完了")
+    
     def display_final_stats(self) -> None:
         """最終統計表示（改良版）"""
         click.echo("\n" + "=" * 60)
@@ -368,13 +507,24 @@ class FullPipeline:
         
         click.echo(f"📊 処理統計:")
         click.echo(f"  ✅ 処理作品: {self.stats['processed_works']}/{self.stats['total_works']}")
+        if self.stats['skipped_works']:
+            click.echo(f"  ⏭️  変更なし: {self.stats['skipped_works']}作品")
+        if self.stats['failed_works']:
+            click.echo(f"  ⚠️  抽出失敗: {self.stats['failed_works']}作品")
         click.echo(f"  📍 抽出地名: {self.stats['total_places']}件")
         click.echo(f"  ⏱️  処理時間: {self.stats['processing_time']:.1f}秒")
+        click.echo(f"  🔌 DB接続数: {self.db.pool.stats['connections_opened']}")
         
         if self.stats['total_places'] > 0:
             speed = self.stats['total_places'] / self.stats['processing_time']
             click.echo(f"  🚀 処理速度: {speed:.1f}件/秒")
         
+        cache = self.stats['sentence_cache']
+        lookups = cache['hits'] + cache['misses']
+        if lookups:
+            click.echo(f"  🧹 文クリーニングキャッシュ: ヒット{cache['hits']}件 / ミス{cache['misses']}件 "
+                       f"({cache['hits'] / lookups * 100:.1f}%)")
+        
         if self.stats['extraction_methods']:
             click.echo(f"\n📋 抽出手法別統計:")
             for method, count in sorted(self.stats['extraction_methods'].items(), key=lambda x: x[1], reverse=True):
@@ -408,10 +558,14 @@ class FullPipeline:
 @click.option('--geocoding/--no-geocoding', default=True, help='Geocoding処理を実行')
 @click.option('--quality-management/--no-quality', default=True, help='品質管理を実行')
 @click.option('--limit', type=int, help='処理作品数の制限')
+@click.option('--offset', type=int, default=0, help='開始位置（work_id順）')
 @click.option('--batch-size', type=int, default=5, help='抽出バッチサイズ')
 @click.option('--geocoding-confidence', type=float, default=0.5, help='Geocoding最小信頼度')
+@click.option('--workers', type=int, default=1, help='抽出の並列プロセス数')
+@click.option('--incremental', is_flag=True, help='新規・変更作品のみ再抽出（placesを初期化しない）')
 def main(reset_data: bool, use_ai: bool, geocoding: bool, quality_management: bool,
-         limit: Optional[int], batch_size: int, geocoding_confidence: float):
+         limit: Optional[int], offset: int, batch_size: int, geocoding_confidence: float, workers: int,
+         incremental: bool):
     """文豪地図完全統合パイプライン（改良版）"""
     pipeline = FullPipeline()
     result = pipeline.run_full_pipeline(
@@ -420,8 +574,11 @@ def main(reset_data: bool, use_ai: bool, geocoding: bool, quality_management: bo
         enable_geocoding=geocoding,
         enable_quality_management=quality_management,
         limit=limit,
+        offset=offset,
         batch_size=batch_size,
-        geocoding_min_confidence=geocoding_confidence
+        geocoding_min_confidence=geocoding_confidence,
+        workers=workers,
+        incremental=incremental
     )
     
     # 🆕 最終統計表示
@@ -95,7 +95,10 @@ main.add_command(setup)
 @click.option('--ai-geocoding', is_flag=True, default=True, help='AI文脈判断型Geocodingを使用')
 @click.option('--enhanced-extraction', is_flag=True, default=True, help='強化版地名抽出を使用')
 @click.option('--test-mode', is_flag=True, help='テストモード（3作品のみ処理）')
-def pipeline(reset: bool, limit: int, batch_size: int, ai_geocoding: bool, enhanced_extraction: bool, test_mode: bool):
+@click.option('--workers', type=int, default=1, help='抽出の並列プロセス数')
+@click.option('--incremental', is_flag=True, help='新規・変更作品のみ再抽出')
+def pipeline(reset: bool, limit: int, batch_size: int, ai_geocoding: bool, enhanced_extraction: bool, test_mode: bool,
+             workers: int, incremental: bool):
     """🚀 完全統合パイプライン（最新版）
     
     青空文庫処理改善 + AI文脈判断型Geocoding + 強化版地名抽出
@@ -121,8 +124,11 @@ def pipeline(reset: bool, limit: int, batch_size: int, ai_geocoding: bool, enhan
         result = pipeline.run_full_pipeline(
             reset_data=reset,
             limit=limit,
+            batch_size=batch_size,
             use_ai=enhanced_extraction,
-            enable_geocoding=ai_geocoding
+            enable_geocoding=ai_geocoding,
+            workers=workers,
+            incremental=incremental
         )
         
         # 結果表示
@@ -266,12 +272,17 @@ def export_csv(db_path, output_dir, include_stats):
 
 
 @main.command()
-@click.option('--format', 'export_format', type=click.Choice(['geojson', 'csv']), 
+@click.option('--format', 'export_format', type=click.Choice(['geojson', 'csv', 'tiles']), 
               default='geojson', help='エクスポート形式')
 @click.option('--output', '-o', help='出力ファイルパス')
 @click.option('--preview', is_flag=True, help='プレビューのみ（実際の出力は行わない）')
 @click.option('--sample', is_flag=True, help='サンプルGeoJSONを表示')
-def export(export_format: str, output: str, preview: bool, sample: bool):
+@click.option('--seq', is_flag=True, help='改行区切りGeoJSON（GeoJSONSeq）で出力')
+@click.option('--gzip', 'compress', is_flag=True, help='gzip圧縮して出力（.gz 拡張子でも有効）')
+@click.option('--min-zoom', default=0, type=int, help='タイルの最小ズーム')
+@click.option('--max-zoom', default=14, type=int, help='タイルの最大ズーム')
+def export(export_format: str, output: str, preview: bool, sample: bool, seq: bool, compress: bool,
+           min_zoom: int, max_zoom: int):
     """📤 データエクスポート"""
     from bungo_map.cli.export import ExportManager
     
@@ -283,8 +294,9 @@ def export(export_format: str, output: str, preview: bool, sample: bool):
         
     elif export_format == 'geojson':
         # GeoJSONエクスポート
-        output_path = output or "output/bungo_places.geojson"
-        manager.export_geojson(output_path, preview=preview)
+        default_path = "output/bungo_places.geojsons" if seq else "output/bungo_places.geojson"
+        output_path = output or (default_path + ".gz" if compress else default_path)
+        manager.export_geojson(output_path, preview=preview, seq=seq, compress=compress)
         
     elif export_format == 'csv':
         # CSVエクスポート
@@ -294,12 +306,20 @@ def export(export_format: str, output: str, preview: bool, sample: bool):
         else:
             manager.export_csv(output_path)
     
+    elif export_format == 'tiles':
+        # タイルピラミッドエクスポート（.mbtiles 指定でMBTiles）
+        output_path = output or "output/tiles"
+        manager.export_tiles(output_path, min_zoom=min_zoom, max_zoom=max_zoom)
+        
     else:
         click.echo("使用方法:")
         click.echo("  --format geojson         # GeoJSONエクスポート")
         click.echo("  --format csv             # CSVエクスポート")
+        click.echo("  --format tiles           # タイルピラミッド（-o *.mbtiles でMBTiles）")
         click.echo("  --preview               # プレビューのみ")
         click.echo("  --sample                # サンプル表示")
+        click.echo("  --seq                   # 改行区切りGeoJSON")
+        click.echo("  --gzip                  # gzip圧縮")
         click.echo("  -o output.geojson       # 出力ファイル指定")
 
 
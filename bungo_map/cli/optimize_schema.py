@@ -9,6 +9,7 @@ Features:
 - 必要カラムの確認
 - スキーマ最適化の実行
 - バックアップ機能
+- ホットクエリの実行計画チェック（EXPLAIN QUERY PLAN）
 """
 
 import click
@@ -16,6 +17,10 @@ import sqlite3
 import logging
 from datetime import datetime
 import os
+import sys
+
+from bungo_map.core.database import Database
+from bungo_map.core.migrations import check_query_plans
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -136,6 +141,15 @@ class SchemaOptimizer:
         
         return backup_path
     
+    def check_query_plans(self) -> list:
+        """マイグレーション適用後、ホットクエリが想定インデックスを使うか確認"""
+        db = Database(self.db_path)
+        try:
+            with db.get_connection() as conn:
+                return check_query_plans(conn)
+        finally:
+            db.close()
+    
     def create_optimized_schema(self) -> str:
         """最適化されたスキーマのCREATE文を生成"""
         return """
@@ -248,13 +262,30 @@ CREATE INDEX idx_places_opt_prefecture ON places_optimized(prefecture);
 @click.option('--analyze-only', is_flag=True, help='分析のみ実行（変更は行わない）')
 @click.option('--migrate', is_flag=True, help='スキーマ最適化移行を実行')
 @click.option('--dry-run', is_flag=True, help='ドライランモード')
-def main(analyze_only: bool, migrate: bool, dry_run: bool):
+@click.option('--check-plans', is_flag=True, help='ホットクエリの実行計画を確認（インデックス未使用なら終了コード1）')
+def main(analyze_only: bool, migrate: bool, dry_run: bool, check_plans: bool):
     """データベーススキーマ最適化ツール"""
     optimizer = SchemaOptimizer()
     
     click.echo("🔧 データベーススキーマ最適化ツール")
     click.echo("=" * 60)
     
+    if check_plans:
+        results = optimizer.check_query_plans()
+        click.echo("🔍 ホットクエリ実行計画:")
+        for result in results:
+            mark = "✅" if result['ok'] else "❌"
+            click.echo(f"  {mark} {result['name']} (想定: {result['expected_index']})")
+            for detail in result['plan']:
+                click.echo(f"      {detail}")
+        
+        failed = [result['name'] for result in results if not result['ok']]
+        if failed:
+            click.echo(f"❌ インデックス未使用のクエリ: {', '.join(failed)}")
+            sys.exit(1)
+        click.echo("✅ 全ホットクエリがインデックスを使用しています")
+        return
+    
     # 1. 現在のスキーマ分析
     analysis = optimizer.analyze_current_schema()
     click.echo(f"📊 スキーマ分析結果:")
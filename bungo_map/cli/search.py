@@ -8,6 +8,7 @@
   bungo search author "夏目"      # 作者名あいまい検索 → 作品一覧
   bungo search work "坊っちゃん"   # 作品名検索 → 地名＋抜粋
   bungo search place "松山市"     # 地名検索 → 作者・作品逆引き
+  bungo search reindex            # 全文検索インデックス再構築
 """
 
 import click
@@ -24,15 +25,15 @@ class BungoSearchEngine:
         self.db = BungoDatabase(db_path)
         click.echo(f"📚 データベース接続: {db_path}")
     
-    def search_author(self, query: str, limit: int = 10) -> Dict:
+    def search_author(self, query: str, limit: int = 10, offset: int = 0) -> Dict:
         """
         作者名あいまい検索 → 作品一覧
         仕様書要件: 作者名あいまい検索 → 作品一覧
         """
         start_time = time.time()
         
-        # 作者検索（部分一致）
-        authors = self.db.search_authors(query, limit)
+        # 作者検索（全文検索）
+        authors = self.db.search_authors(query, limit, offset)
         
         # 該当作者の作品一覧取得
         works = []
@@ -51,15 +52,15 @@ class BungoSearchEngine:
             'total_works': len(works)
         }
     
-    def search_work(self, query: str, limit: int = 10) -> Dict:
+    def search_work(self, query: str, limit: int = 10, offset: int = 0) -> Dict:
         """
         作品名検索 → 地名＋抜粋
         仕様書要件: 作品名検索 → 地名＋抜粋
         """
         start_time = time.time()
         
-        # 作品検索（部分一致）
-        works = self.db.search_works(query, limit)
+        # 作品検索（全文検索）
+        works = self.db.search_works(query, limit, offset)
         
         # 該当作品の地名一覧取得
         places = []
@@ -78,15 +79,15 @@ class BungoSearchEngine:
             'total_places': len(places)
         }
     
-    def search_place(self, query: str, limit: int = 10) -> Dict:
+    def search_place(self, query: str, limit: int = 10, offset: int = 0) -> Dict:
         """
         地名検索 → 作者・作品逆引き
         仕様書要件: 地名検索 → 作者・作品逆引き
         """
         start_time = time.time()
         
-        # 地名検索（部分一致）
-        places = self.db.search_places(query, limit)
+        # 地名検索（全文検索）
+        places = self.db.search_places(query, limit, offset)
         
         # 関連作者・作品の逆引き
         authors = set()
@@ -111,6 +112,10 @@ class BungoSearchEngine:
             'total_works': len(works)
         }
     
+    def rebuild_index(self) -> Dict[str, int]:
+        """全文検索インデックスの再構築"""
+        return self.db.search_index.rebuild()
+    
     def get_statistics(self) -> Dict:
         """データベース統計取得"""
         return self.db.get_statistics()
@@ -239,12 +244,13 @@ def search():
 @search.command()
 @click.argument('query')
 @click.option('--limit', default=10, help='最大結果数')
+@click.option('--offset', default=0, help='結果の開始位置（ページング用）')
 @click.option('--db', default='bungo_map.db', help='データベースファイル')
-def author(query: str, limit: int, db: str):
+def author(query: str, limit: int, offset: int, db: str):
     """作者名あいまい検索 → 作品一覧"""
     try:
         engine = BungoSearchEngine(db)
-        result = engine.search_author(query, limit)
+        result = engine.search_author(query, limit, offset)
         print_author_results(result)
         engine.close()
     except Exception as e:
@@ -254,12 +260,13 @@ def author(query: str, limit: int, db: str):
 @search.command()
 @click.argument('query')
 @click.option('--limit', default=10, help='最大結果数')
+@click.option('--offset', default=0, help='結果の開始位置（ページング用）')
 @click.option('--db', default='bungo_map.db', help='データベースファイル')
-def work(query: str, limit: int, db: str):
+def work(query: str, limit: int, offset: int, db: str):
     """作品名検索 → 地名＋抜粋"""
     try:
         engine = BungoSearchEngine(db)
-        result = engine.search_work(query, limit)
+        result = engine.search_work(query, limit, offset)
         print_work_results(result)
         engine.close()
     except Exception as e:
@@ -269,18 +276,39 @@ def work(query: str, limit: int, db: str):
 @search.command()
 @click.argument('query')
 @click.option('--limit', default=10, help='最大結果数')
+@click.option('--offset', default=0, help='結果の開始位置（ページング用）')
 @click.option('--db', default='bungo_map.db', help='データベースファイル')
-def place(query: str, limit: int, db: str):
+def place(query: str, limit: int, offset: int, db: str):
     """地名検索 → 作者・作品逆引き"""
     try:
         engine = BungoSearchEngine(db)
-        result = engine.search_place(query, limit)
+        result = engine.search_place(query, limit, offset)
         print_place_results(result)
         engine.close()
     except Exception as e:
         click.echo(f"❌ エラー: {e}")
 
 
+@search.command()
+@click.option('--db', default='bungo_map.db', help='データベースファイル')
+def reindex(db: str):
+    """全文検索インデックスを再構築"""
+    try:
+        engine = BungoSearchEngine(db)
+        if not engine.db.search_index.available:
+            click.echo("⚠️ このSQLiteではFTS5(trigram)が利用できません（LIKE検索を使用します）")
+            engine.close()
+            return
+        
+        start_time = time.time()
+        counts = engine.rebuild_index()
+        click.echo(f"✅ 検索インデックス再構築完了 ({time.time() - start_time:.2f}秒)")
+        click.echo(f"   地名: {counts['places_fts']}件, 作品: {counts['works_fts']}件, 作者: {counts['authors_fts']}件")
+        engine.close()
+    except Exception as e:
+        click.echo(f"❌ エラー: {e}")
+
+
 @search.command()
 @click.option('--db', default='bungo_map.db', help='データベースファイル')
 def stats(db: str):
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite接続プール
+長寿命接続の再利用・WALジャーナル・PRAGMAチューニング
+"""
+
+import queue
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+from contextlib import contextmanager
+
+
+# 書き込み中心のバッチ処理向けPRAGMA設定
+DEFAULT_PRAGMAS: Dict[str, Any] = {
+    'journal_mode': 'WAL',        # 読み書きの並行実行
+    'synchronous': 'NORMAL',      # WALではNORMALで十分な耐久性
+    'cache_size': -65536,         # 64MB（負数はKiB単位）
+    'mmap_size': 268435456,       # 256MB
+    'temp_store': 'MEMORY',
+    'busy_timeout': 30000,        # ミリ秒
+}
+
+# 読み取り専用接続（APIサーバー等）向けPRAGMA設定
+# journal_mode は書き込み側が設定済みのため変更しない
+READ_ONLY_PRAGMAS: Dict[str, Any] = {
+    'query_only': 'ON',
+    'cache_size': -65536,
+    'mmap_size': 268435456,
+    'temp_store': 'MEMORY',
+    'busy_timeout': 30000,
+}
+
+
+class SQLiteConnectionPool:
+    """スレッドセーフなSQLite接続プール
+
+    接続は初回要求時に生成され、最大 pool_size 本まで再利用される。
+    全接続が使用中の場合は返却を待機する。
+    read_only=True の場合は mode=ro のURIで接続し、書き込みを行わない。
+    """
+
+    def __init__(self, db_path: Union[str, Path], pool_size: int = 4,
+                 pragmas: Optional[Dict[str, Any]] = None, timeout: float = 30.0,
+                 read_only: bool = False):
+        if pool_size < 1:
+            raise ValueError("pool_size は1以上である必要があります")
+
+        self.db_path = Path(db_path)
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.read_only = read_only
+        self.pragmas = dict(READ_ONLY_PRAGMAS if read_only else DEFAULT_PRAGMAS)
+        if pragmas:
+            self.pragmas.update(pragmas)
+
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._all_connections = []
+        self._closed = False
+
+        # 統計情報
+        self.stats = {
+            'connections_opened': 0,
+            'acquisitions': 0,
+            'waits': 0,
+        }
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """新規接続の生成とPRAGMA適用"""
+        if self.read_only:
+            database = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        else:
+            database = str(self.db_path)
+
+        conn = sqlite3.connect(
+            database,
+            timeout=self.timeout,
+            check_same_thread=False,  # プール経由で一度に1スレッドのみが使用する
+            uri=self.read_only
+        )
+        conn.row_factory = sqlite3.Row
+
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """接続を取得（空きがなければ生成、上限に達していれば待機）"""
+        if self._closed:
+            raise RuntimeError("接続プールは既にクローズされています")
+
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._lock:
+                if len(self._all_connections) < self.pool_size:
+                    conn = self._create_connection()
+                    self._all_connections.append(conn)
+                    self.stats['connections_opened'] += 1
+
+            if conn is None:
+                self.stats['waits'] += 1
+                try:
+                    conn = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"接続プールの待機がタイムアウトしました ({self.timeout}秒)"
+                    )
+
+        self.stats['acquisitions'] += 1
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """接続を返却（未確定のトランザクションはロールバック）"""
+        if self._closed:
+            conn.close()
+            return
+
+        if conn.in_transaction:
+            conn.rollback()
+
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        """接続取得コンテキストマネージャー"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close_all(self) -> None:
+        """全接続をクローズ"""
+        with self._lock:
+            self._closed = True
+            for conn in self._all_connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._all_connections.clear()
+
+        while not self._idle.empty():
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+    @property
+    def size(self) -> int:
+        """生成済み接続数"""
+        return len(self._all_connections)
@@ -7,94 +7,142 @@ SQLiteをメインとした3階層データ管理
 
 import sqlite3
 import os
+import math
+import hashlib
+import threading
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from itertools import islice
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
 from contextlib import contextmanager
 
 from bungo_map.core.models import Author, Work, Place
+from bungo_map.core.connection_pool import SQLiteConnectionPool
+from bungo_map.core.migrations import apply_migrations, get_schema_version
+from bungo_map.core.search_index import SearchIndex
+
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[List]:
+    """イテラブルを size 件ずつのリストに分割"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def calculate_content_hash(text: Optional[str]) -> str:
+    """作品本文のハッシュ値（差分抽出の変更検知用）"""
+    return hashlib.md5((text or '').encode('utf-8')).hexdigest()
+
+
+# 地球の平均半径（km）
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """2地点間の大圏距離（km）"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, a)))
 
 
 class Database:
     """文豪データベース管理クラス"""
     
-    def __init__(self, db_path: str = "data/bungo_production.db"):
+    # バルクAPIの executemany 1回あたりの行数
+    bulk_chunk_size = 500
+    
+    # iter_works の1ページあたりの作品数
+    work_page_size = 20
+    
+    def __init__(self, db_path: str = "data/bungo_production.db", pool_size: int = 4,
+                 read_only: bool = False):
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(exist_ok=True)
-        self._init_tables()
+        self.read_only = read_only
+        if not read_only:
+            self.db_path.parent.mkdir(exist_ok=True)
+        self.pool = SQLiteConnectionPool(self.db_path, pool_size=pool_size, read_only=read_only)
+        self._local = threading.local()
+        # 読み取り専用ではマイグレーションを行わない（書き込み側で適用済みの前提）
+        if not read_only:
+            self._init_tables()
+        self.search_index = SearchIndex(self)
+        self.has_spatial_index = self._table_exists('places_rtree')
     
     def _init_tables(self):
-        """テーブル初期化"""
-        with self.get_connection() as conn:
-            # authors テーブル
-            conn.execute("""
-            CREATE TABLE IF NOT EXISTS authors (
-                author_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                wikipedia_url TEXT,
-                birth_year INTEGER,
-                death_year INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """)
-            
-            # works テーブル
-            conn.execute("""
-            CREATE TABLE IF NOT EXISTS works (
-                work_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                author_id INTEGER NOT NULL,
-                title TEXT NOT NULL,
-                wiki_url TEXT,
-                aozora_url TEXT,
-                text_url TEXT,
-                content TEXT,
-                publication_year INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (author_id) REFERENCES authors (author_id),
-                UNIQUE(author_id, title)
-            )
-            """)
-            
-            # 既存テーブルにカラムを追加（エラーを無視）
-            try:
-                conn.execute("ALTER TABLE works ADD COLUMN text_url TEXT")
-            except sqlite3.OperationalError:
-                pass  # カラムが既に存在する場合
-            
-            try:
-                conn.execute("ALTER TABLE works ADD COLUMN publication_year INTEGER")
-            except sqlite3.OperationalError:
-                pass  # カラムが既に存在する場合
-            
-            # places テーブル
-            conn.execute("""
-            CREATE TABLE IF NOT EXISTS places (
-                place_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                work_id INTEGER NOT NULL,
-                place_name TEXT NOT NULL,
-                lat REAL,
-                lng REAL,
-                before_text TEXT,
-                sentence TEXT,
-                after_text TEXT,
-                aozora_url TEXT,
-                confidence REAL DEFAULT 0.0,
-                extraction_method TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (work_id) REFERENCES works (work_id)
-            )
-            """)
-            
-            conn.commit()
+        """テーブル初期化（未適用のスキーママイグレーションを適用）"""
+        with self.get_connection() as conn:
+            applied = apply_migrations(conn)
+            if applied:
+                print(f"🔧 スキーママイグレーション適用: v{applied[0]}〜v{applied[-1]}")
+    
+    def _table_exists(self, name: str) -> bool:
+        with self.get_connection() as conn:
+            return conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = ?", (name,)
+            ).fetchone() is not None
+    
+    @property
+    def schema_version(self) -> int:
+        """適用済みスキーマバージョン"""
+        with self.get_connection() as conn:
+            return get_schema_version(conn)
     
     @contextmanager
     def get_connection(self):
-        """データベース接続コンテキストマネージャー"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        """データベース接続コンテキストマネージャー（プールから取得）
+
+        transaction() のスコープ内では、そのトランザクションの接続を返す。
+        """
+        tx_conn = getattr(self._local, 'transaction_conn', None)
+        if tx_conn is not None:
+            yield tx_conn
+            return
+        
+        with self.pool.connection() as conn:
             yield conn
-        finally:
-            conn.close()
+    
+    @contextmanager
+    def transaction(self):
+        """明示的トランザクションスコープ
+        
+        スコープ内の insert_* / update_* は個別にcommitせず、
+        最外側のスコープ終了時に一度だけcommitする（例外時はrollback）。
+        """
+        tx_conn = getattr(self._local, 'transaction_conn', None)
+        if tx_conn is not None:
+            # ネストしたスコープは外側のトランザクションに合流
+            yield tx_conn
+            return
+        
+        with self.pool.connection() as conn:
+            self._local.transaction_conn = conn
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._local.transaction_conn = None
+    
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        """トランザクションスコープ外の場合のみcommit"""
+        if getattr(self._local, 'transaction_conn', None) is not conn:
+            conn.commit()
+    
+    def close(self) -> None:
+        """プール内の全接続をクローズ"""
+        self.pool.close_all()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
     def insert_author(self, author: Author) -> int:
         """作者挿入"""
@@ -104,7 +152,7 @@ class Database:
                    VALUES (?, ?, ?, ?)""",
                 (author.name, author.wikipedia_url, author.birth_year, author.death_year)
             )
-            conn.commit()
+            self._commit(conn)
             
             if cursor.lastrowid:
                 return cursor.lastrowid
@@ -122,7 +170,7 @@ class Database:
                    VALUES (?, ?, ?, ?, ?, ?)""",
                 (work.author_id, work.title, work.wiki_url, work.aozora_url, work.content, work.publication_year)
             )
-            conn.commit()
+            self._commit(conn)
             
             if cursor.lastrowid:
                 return cursor.lastrowid
@@ -134,7 +182,7 @@ class Database:
                        WHERE author_id = ? AND title = ? AND publication_year IS NULL""",
                     (work.publication_year, work.author_id, work.title)
                 )
-                conn.commit()
+                self._commit(conn)
             
             cursor = conn.execute(
                 "SELECT work_id FROM works WHERE author_id = ? AND title = ?", 
@@ -155,9 +203,194 @@ class Database:
                  place.before_text, place.sentence, place.after_text,
                  place.aozora_url, place.confidence, place.extraction_method)
             )
-            conn.commit()
+            self._commit(conn)
             return cursor.lastrowid
     
+    # ===========================================
+    # バルク書き込みAPI（単一トランザクション + executemany）
+    # ===========================================
+    
+    def insert_places_bulk(self, places: Iterable[Place], chunk_size: int = None) -> List[int]:
+        """地名の一括挿入
+        
+        Returns:
+            List[int]: 入力順に対応する place_id のリスト
+        """
+        chunk_size = chunk_size or self.bulk_chunk_size
+        place_ids = []
+        
+        with self.transaction() as conn:
+            for chunk in _chunked(places, chunk_size):
+                conn.executemany(
+                    """INSERT INTO places 
+                       (work_id, place_name, lat, lng, before_text, sentence, after_text, 
+                        aozora_url, confidence, extraction_method)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    [
+                        (place.work_id, place.place_name, place.lat, place.lng,
+                         place.before_text, place.sentence, place.after_text,
+                         place.aozora_url, place.confidence, place.extraction_method)
+                        for place in chunk
+                    ]
+                )
+                
+                # AUTOINCREMENTかつ書き込みトランザクション内のため、採番は連番になる
+                last_id = conn.execute(
+                    "SELECT seq FROM sqlite_sequence WHERE name = 'places'"
+                ).fetchone()[0]
+                place_ids.extend(range(last_id - len(chunk) + 1, last_id + 1))
+        
+        return place_ids
+    
+    def upsert_authors_bulk(self, authors: Iterable[Author], chunk_size: int = None) -> List[int]:
+        """作者の一括挿入または更新（name で一意）
+        
+        Returns:
+            List[int]: 入力順に対応する author_id のリスト
+        """
+        chunk_size = chunk_size or self.bulk_chunk_size
+        author_ids = []
+        
+        with self.transaction() as conn:
+            for chunk in _chunked(authors, chunk_size):
+                conn.executemany(
+                    """INSERT INTO authors (name, wikipedia_url, birth_year, death_year)
+                       VALUES (?, ?, ?, ?)
+                       ON CONFLICT(name) DO UPDATE SET
+                           wikipedia_url = COALESCE(excluded.wikipedia_url, wikipedia_url),
+                           birth_year = COALESCE(excluded.birth_year, birth_year),
+                           death_year = COALESCE(excluded.death_year, death_year)""",
+                    [
+                        (author.name, author.wikipedia_url, author.birth_year, author.death_year)
+                        for author in chunk
+                    ]
+                )
+                
+                names = list({author.name for author in chunk})
+                placeholders = ','.join('?' * len(names))
+                cursor = conn.execute(
+                    f"SELECT author_id, name FROM authors WHERE name IN ({placeholders})",
+                    names
+                )
+                id_by_name = {row[1]: row[0] for row in cursor.fetchall()}
+                author_ids.extend(id_by_name[author.name] for author in chunk)
+        
+        return author_ids
+    
+    def upsert_works_bulk(self, works: Iterable[Work], chunk_size: int = None) -> List[int]:
+        """作品の一括挿入または更新（author_id + title で一意）
+        
+        既存作品は NULL でない値のみ上書きする。
+        
+        Returns:
+            List[int]: 入力順に対応する work_id のリスト
+        """
+        chunk_size = chunk_size or self.bulk_chunk_size
+        work_ids = []
+        
+        with self.transaction() as conn:
+            for chunk in _chunked(works, chunk_size):
+                conn.executemany(
+                    """INSERT INTO works (author_id, title, wiki_url, aozora_url, content, publication_year)
+                       VALUES (?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(author_id, title) DO UPDATE SET
+                           wiki_url = COALESCE(excluded.wiki_url, wiki_url),
+                           aozora_url = COALESCE(excluded.aozora_url, aozora_url),
+                           content = COALESCE(excluded.content, content),
+                           publication_year = COALESCE(excluded.publication_year, publication_year)""",
+                    [
+                        (work.author_id, work.title, work.wiki_url, work.aozora_url,
+                         work.content, work.publication_year)
+                        for work in chunk
+                    ]
+                )
+                
+                author_ids = list({work.author_id for work in chunk})
+                placeholders = ','.join('?' * len(author_ids))
+                cursor = conn.execute(
+                    f"SELECT work_id, author_id, title FROM works WHERE author_id IN ({placeholders})",
+                    author_ids
+                )
+                id_by_key = {(row[1], row[2]): row[0] for row in cursor.fetchall()}
+                work_ids.extend(id_by_key[(work.author_id, work.title)] for work in chunk)
+        
+        return work_ids
+    
+    def replace_work_places(self, extracted: Iterable[Tuple[int, str, List[Place]]],
+                            extractor_version: str) -> int:
+        """作品単位で地名を置き換え、抽出済みハッシュを記録（単一トランザクション）
+        
+        Args:
+            extracted: (work_id, 本文ハッシュ, 地名リスト) のイテラブル
+            extractor_version: 抽出器バージョン（フィンガープリント）
+        
+        Returns:
+            int: 挿入した地名数
+        """
+        inserted = 0
+        with self.transaction():
+            for work_id, content_hash, places in extracted:
+                self.delete_places_by_work(work_id)
+                inserted += len(self.insert_places_bulk(places))
+                self.mark_work_extracted(work_id, content_hash, extractor_version)
+        return inserted
+    
+    def delete_places_by_work(self, work_id: int) -> int:
+        """特定作品の地名を全削除"""
+        with self.get_connection() as conn:
+            cursor = conn.execute("DELETE FROM places WHERE work_id = ?", (work_id,))
+            self._commit(conn)
+            return cursor.rowcount
+    
+    def set_work_content_hash(self, work_id: int, content_hash: str) -> None:
+        """本文ハッシュを記録（抽出状態は変更しない）"""
+        with self.get_connection() as conn:
+            conn.execute(
+                "UPDATE works SET content_hash = ? WHERE work_id = ?",
+                (content_hash, work_id)
+            )
+            self._commit(conn)
+    
+    def mark_work_extracted(self, work_id: int, content_hash: str, extractor_version: str) -> None:
+        """抽出済みとして本文ハッシュと抽出器バージョンを記録"""
+        with self.get_connection() as conn:
+            conn.execute(
+                """UPDATE works SET content_hash = ?, extracted_hash = ?,
+                       extractor_version = ?, extracted_at = CURRENT_TIMESTAMP
+                   WHERE work_id = ?""",
+                (content_hash, content_hash, extractor_version, work_id)
+            )
+            self._commit(conn)
+    
+    def clear_extraction_state(self) -> None:
+        """全作品の抽出済み記録を消去（places全削除時に使用）"""
+        with self.get_connection() as conn:
+            conn.execute("UPDATE works SET extracted_hash = NULL, extractor_version = NULL, extracted_at = NULL")
+            self._commit(conn)
+    
+    def update_coordinates_bulk(self, updates: Iterable[Tuple[int, float, float]],
+                                chunk_size: int = None) -> int:
+        """座標の一括更新
+        
+        Args:
+            updates: (place_id, lat, lng) のイテラブル
+        
+        Returns:
+            int: 更新された行数
+        """
+        chunk_size = chunk_size or self.bulk_chunk_size
+        updated = 0
+        
+        with self.transaction() as conn:
+            for chunk in _chunked(updates, chunk_size):
+                cursor = conn.executemany(
+                    "UPDATE places SET lat = ?, lng = ? WHERE place_id = ?",
+                    [(lat, lng, place_id) for place_id, lat, lng in chunk]
+                )
+                updated += cursor.rowcount
+        
+        return updated
+    
     def get_author_by_name(self, name: str) -> Optional[Author]:
         """作者名で検索"""
         with self.get_connection() as conn:
@@ -250,7 +483,7 @@ class Database:
                    VALUES (?, ?, ?, ?)""",
                 (name, birth_year, death_year, wikipedia_url)
             )
-            conn.commit()
+            self._commit(conn)
             return cursor.lastrowid
     
     def add_work(self, title: str, author_id: int, publication_year: int = None,
@@ -275,7 +508,7 @@ class Database:
                 WHERE work_id = ?
                 """
                 conn.execute(update_sql, (publication_year, wiki_url, aozora_url, text_url, result[0]))
-                conn.commit()
+                self._commit(conn)
                 return result[0]
             
             # 新規作品を追加
@@ -284,7 +517,7 @@ class Database:
                    VALUES (?, ?, ?, ?, ?, ?)""",
                 (title, author_id, publication_year, wiki_url, aozora_url, text_url)
             )
-            conn.commit()
+            self._commit(conn)
             return cursor.lastrowid
     
     def set_work_content(self, work_id: int, content: str) -> bool:
@@ -295,7 +528,7 @@ class Database:
                     "UPDATE works SET content = ? WHERE work_id = ?",
                     (content, work_id)
                 )
-                conn.commit()
+                self._commit(conn)
                 return True
         except Exception as e:
             print(f"コンテンツ設定エラー: {e}")
@@ -323,7 +556,7 @@ class Database:
                     place.place_id
                 ))
                 
-                conn.commit()
+                self._commit(conn)
                 return True
                 
         except Exception as e:
@@ -334,23 +567,33 @@ class Database:
     # 検索メソッド（双方向検索機能）
     # ===========================================
     
-    def search_authors(self, query: str, limit: int = 50) -> List[Dict]:
-        """作者検索（部分一致）"""
+    def _use_search_index(self, query: str) -> bool:
+        """全文検索インデックスを使うか（空の検索語は全件一覧としてLIKE検索で返す）"""
+        return self.search_index.available and bool(query.strip())
+    
+    def search_authors(self, query: str, limit: int = 50, offset: int = 0) -> List[Dict]:
+        """作者検索（全文検索・ランキング順）"""
+        if self._use_search_index(query):
+            return self.search_index.search('authors', query, limit, offset)
+        
         with self.get_connection() as conn:
             cursor = conn.execute(
                 """SELECT author_id, name, wikipedia_url, birth_year, death_year
                    FROM authors 
                    WHERE name LIKE ? 
                    ORDER BY name
-                   LIMIT ?""",
-                (f"%{query}%", limit)
+                   LIMIT ? OFFSET ?""",
+                (f"%{query}%", limit, offset)
             )
             
             columns = ['author_id', 'name', 'wikipedia_url', 'birth_year', 'death_year']
             return [dict(zip(columns, row)) for row in cursor.fetchall()]
     
-    def search_works(self, query: str, limit: int = 50) -> List[Dict]:
-        """作品検索（部分一致）- 作者名も含む"""
+    def search_works(self, query: str, limit: int = 50, offset: int = 0) -> List[Dict]:
+        """作品検索（全文検索・ランキング順）- 作者名も含む"""
+        if self._use_search_index(query):
+            return self.search_index.search('works', query, limit, offset)
+        
         with self.get_connection() as conn:
             cursor = conn.execute(
                 """SELECT w.work_id, w.author_id, w.title, w.wiki_url, w.aozora_url,
@@ -359,15 +602,18 @@ class Database:
                    JOIN authors a ON w.author_id = a.author_id
                    WHERE w.title LIKE ? OR a.name LIKE ?
                    ORDER BY a.name, w.title
-                   LIMIT ?""",
-                (f"%{query}%", f"%{query}%", limit)
+                   LIMIT ? OFFSET ?""",
+                (f"%{query}%", f"%{query}%", limit, offset)
             )
             
             columns = ['work_id', 'author_id', 'title', 'wiki_url', 'aozora_url', 'author_name']
             return [dict(zip(columns, row)) for row in cursor.fetchall()]
     
-    def search_places(self, query: str, limit: int = 100) -> List[Dict]:
-        """地名検索（部分一致）- 作者名・作品名も含む"""
+    def search_places(self, query: str, limit: int = 100, offset: int = 0) -> List[Dict]:
+        """地名検索（全文検索・ランキング順）- 文脈・作者名・作品名も含む"""
+        if self._use_search_index(query):
+            return self.search_index.search('places', query, limit, offset)
+        
         with self.get_connection() as conn:
             cursor = conn.execute(
                 """SELECT p.place_id, p.work_id, p.place_name, p.lat, p.lng,
@@ -378,8 +624,8 @@ class Database:
                    JOIN authors a ON w.author_id = a.author_id
                    WHERE p.place_name LIKE ? OR a.name LIKE ? OR w.title LIKE ?
                    ORDER BY a.name, w.title, p.place_name
-                   LIMIT ?""",
-                (f"%{query}%", f"%{query}%", f"%{query}%", limit)
+                   LIMIT ? OFFSET ?""",
+                (f"%{query}%", f"%{query}%", f"%{query}%", limit, offset)
             )
             
             columns = ['place_id', 'work_id', 'place_name', 'latitude', 'longitude',
@@ -387,6 +633,170 @@ class Database:
                       'work_title', 'author_name']
             return [dict(zip(columns, row)) for row in cursor.fetchall()]
     
+    def search_page(self, kind: str, query: str, page: int = 1, per_page: int = 20) -> Dict[str, Any]:
+        """検索結果のページ取得
+        
+        Args:
+            kind: 'places' / 'works' / 'authors'
+            page: 1始まりのページ番号
+        """
+        searchers = {
+            'places': self.search_places,
+            'works': self.search_works,
+            'authors': self.search_authors,
+        }
+        if kind not in searchers:
+            raise ValueError(f"未対応の検索種別です: {kind}")
+        
+        page = max(1, page)
+        items = searchers[kind](query, limit=per_page + 1, offset=(page - 1) * per_page)
+        result = {
+            'query': query,
+            'kind': kind,
+            'page': page,
+            'per_page': per_page,
+            'items': items[:per_page],
+            'has_next': len(items) > per_page,
+        }
+        if self._use_search_index(query):
+            result['total'] = self.search_index.count(kind, query)
+        return result
+    
+    # ===========================================
+    # 空間検索メソッド
+    # ===========================================
+    
+    _spatial_columns = ['place_id', 'place_name', 'lat', 'lng', 'confidence',
+                        'work_id', 'work_title', 'author_name']
+    
+    def _query_bbox(self, conn: sqlite3.Connection, min_lat: float, min_lng: float,
+                    max_lat: float, max_lng: float, after_id: int, limit: Optional[int]) -> List[Dict]:
+        """矩形内の地名（place_id 昇順）"""
+        select = """SELECT p.place_id, p.place_name, p.lat, p.lng, p.confidence,
+                           p.work_id, w.title as work_title, a.name as author_name"""
+        joins = """JOIN works w ON p.work_id = w.work_id
+                   JOIN authors a ON w.author_id = a.author_id"""
+        limit_clause = "LIMIT ?" if limit is not None else ""
+        
+        if self.has_spatial_index:
+            # R*Tree上でページ分のIDを確定してから結合する
+            # （32bit浮動小数の丸めにより境界の外側約1m以内の点を含みうる）
+            sql = f"""{select}
+                FROM (
+                    SELECT place_id FROM places_rtree
+                    WHERE min_lat <= ? AND max_lat >= ? AND min_lng <= ? AND max_lng >= ?
+                      AND place_id > ?
+                    ORDER BY place_id {limit_clause}
+                ) r
+                JOIN places p ON p.place_id = r.place_id
+                {joins}
+                ORDER BY r.place_id"""
+            params = [max_lat, min_lat, max_lng, min_lng, after_id]
+        else:
+            sql = f"""{select}
+                FROM places p
+                {joins}
+                WHERE p.lat BETWEEN ? AND ? AND p.lng BETWEEN ? AND ? AND p.place_id > ?
+                ORDER BY p.place_id {limit_clause}"""
+            params = [min_lat, max_lat, min_lng, max_lng, after_id]
+        
+        if limit is not None:
+            params.append(limit)
+        
+        cursor = conn.execute(sql, params)
+        return [dict(zip(self._spatial_columns, row)) for row in cursor.fetchall()]
+    
+    def places_in_bbox(self, min_lat: float, min_lng: float, max_lat: float, max_lng: float,
+                       limit: int = 1000, after_id: int = 0) -> Dict[str, Any]:
+        """地図表示範囲内の地名（キーセットページング）
+        
+        Args:
+            after_id: 前ページの next_cursor（最初のページは0）
+            
+        Returns:
+            {'items': [...], 'next_cursor': 次ページの after_id（最終ページは None）}
+        """
+        with self.get_connection() as conn:
+            items = self._query_bbox(conn, min_lat, min_lng, max_lat, max_lng, after_id, limit + 1)
+        
+        has_next = len(items) > limit
+        items = items[:limit]
+        return {
+            'items': items,
+            'next_cursor': items[-1]['place_id'] if has_next else None,
+        }
+    
+    def places_page(self, author_id: Optional[int] = None, work_id: Optional[int] = None,
+                    limit: int = 100, after_id: int = 0,
+                    geocoded_only: bool = False) -> Dict[str, Any]:
+        """作者別・作品別の地名一覧（キーセットページング）
+        
+        Args:
+            after_id: 前ページの next_cursor（最初のページは0）
+            geocoded_only: 座標付きの地名のみ（LIMIT の前に絞り込むためページが欠けない）
+            
+        Returns:
+            {'items': [...], 'next_cursor': 次ページの after_id（最終ページは None）}
+        """
+        conditions = ["p.place_id > ?"]
+        params: List[Any] = [after_id]
+        if work_id is not None:
+            conditions.append("p.work_id = ?")
+            params.append(work_id)
+        if author_id is not None:
+            conditions.append("w.author_id = ?")
+            params.append(author_id)
+        if geocoded_only:
+            conditions.append("p.lat IS NOT NULL AND p.lng IS NOT NULL")
+        params.append(limit + 1)
+        
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                f"""SELECT p.place_id, p.place_name, p.lat, p.lng, p.confidence,
+                           p.work_id, w.title as work_title, a.name as author_name
+                    FROM places p
+                    JOIN works w ON p.work_id = w.work_id
+                    JOIN authors a ON w.author_id = a.author_id
+                    WHERE {" AND ".join(conditions)}
+                    ORDER BY p.place_id
+                    LIMIT ?""",
+                params
+            )
+            items = [dict(zip(self._spatial_columns, row)) for row in cursor.fetchall()]
+        
+        has_next = len(items) > limit
+        items = items[:limit]
+        return {
+            'items': items,
+            'next_cursor': items[-1]['place_id'] if has_next else None,
+        }
+    
+    def places_near(self, lat: float, lng: float, radius_km: float = 5.0,
+                    k: int = 50, offset: int = 0) -> List[Dict]:
+        """指定地点から半径 radius_km 以内の地名を近い順に最大 k 件
+        
+        外接矩形で空間インデックスから候補を取り、大圏距離で絞り込む。
+        各結果には distance_km を付与する。
+        """
+        km_per_degree = math.radians(EARTH_RADIUS_KM)
+        lat_delta = radius_km / km_per_degree
+        lng_delta = radius_km / (km_per_degree * max(math.cos(math.radians(lat)), 1e-6))
+        
+        with self.get_connection() as conn:
+            candidates = self._query_bbox(
+                conn, lat - lat_delta, lng - lng_delta, lat + lat_delta, lng + lng_delta, 0, None
+            )
+        
+        results = []
+        for place in candidates:
+            distance = haversine_km(lat, lng, place['lat'], place['lng'])
+            if distance <= radius_km:
+                place['distance_km'] = distance
+                results.append(place)
+        
+        results.sort(key=lambda place: (place['distance_km'], place['place_id']))
+        return results[offset:offset + k]
+    
     def get_works_by_author(self, author_id: int) -> List[Dict]:
         """特定作者の全作品取得"""
         with self.get_connection() as conn:
@@ -403,6 +813,96 @@ class Database:
             columns = ['work_id', 'author_id', 'title', 'wiki_url', 'aozora_url', 'author_name']
             return [dict(zip(columns, row)) for row in cursor.fetchall()]
     
+    def _work_filter(self, with_content: bool, author_id: Optional[int],
+                     stale_for: Optional[str] = None) -> Tuple[str, List]:
+        """iter_works / count_works 共通のWHERE句"""
+        conditions = []
+        params: List[Any] = []
+        if with_content:
+            conditions.append("w.content IS NOT NULL AND w.content != ''")
+        if author_id is not None:
+            conditions.append("w.author_id = ?")
+            params.append(author_id)
+        if stale_for is not None:
+            # 未抽出・本文変更（ハッシュ未計算を含む）・抽出器バージョン違い
+            conditions.append("""(w.content_hash IS NULL
+                OR w.extracted_hash IS NOT w.content_hash
+                OR w.extractor_version IS NOT ?)""")
+            params.append(stale_for)
+        return " AND ".join(conditions) or "1", params
+    
+    def count_works(self, limit: Optional[int] = None, offset: int = 0,
+                    with_content: bool = True, author_id: Optional[int] = None,
+                    stale_for: Optional[str] = None) -> int:
+        """iter_works が返す作品数（本文は読み込まない）"""
+        where, params = self._work_filter(with_content, author_id, stale_for)
+        with self.get_connection() as conn:
+            total = conn.execute(
+                f"""SELECT COUNT(*) FROM works w
+                    JOIN authors a ON w.author_id = a.author_id
+                    WHERE {where}""", params
+            ).fetchone()[0]
+        
+        total = max(total - offset, 0)
+        return min(total, limit) if limit else total
+    
+    def iter_works(self, limit: Optional[int] = None, offset: int = 0,
+                   with_content: bool = True, author_id: Optional[int] = None,
+                   stale_for: Optional[str] = None, page_size: int = None) -> Iterator[Dict]:
+        """作品を work_id 順に1件ずつ返すジェネレータ
+        
+        work_id > 直前のID のキーセットページングで page_size 件ずつ読み込むため、
+        メモリ上に保持する本文は1ページ分のみ。接続はページ取得の間だけ借用する。
+        with_content=True の場合は本文を持つ作品のみを対象とし、content を含めて返す。
+        stale_for に抽出器バージョンを渡すと、再抽出が必要な可能性のある作品に限定する。
+        """
+        page_size = page_size or self.work_page_size
+        where, params = self._work_filter(with_content, author_id, stale_for)
+        columns = ['work_id', 'author_id', 'title', 'author_name', 'wiki_url', 'aozora_url',
+                   'content_hash', 'extracted_hash', 'extractor_version']
+        if with_content:
+            columns.append('content')
+        select = ", ".join('a.name' if c == 'author_name' else f'w.{c}' for c in columns)
+        
+        # OFFSET は開始位置の特定に1回だけ使う（以降はキーセット）
+        last_id = None
+        if offset:
+            with self.get_connection() as conn:
+                row = conn.execute(
+                    f"""SELECT w.work_id FROM works w
+                        JOIN authors a ON w.author_id = a.author_id
+                        WHERE {where}
+                        ORDER BY w.work_id LIMIT 1 OFFSET ?""",
+                    params + [offset - 1]
+                ).fetchone()
+            if row is None:
+                return
+            last_id = row[0]
+        
+        remaining = limit
+        while remaining is None or remaining > 0:
+            fetch = page_size if remaining is None else min(page_size, remaining)
+            keyset = "" if last_id is None else "AND w.work_id > ?"
+            with self.get_connection() as conn:
+                rows = conn.execute(
+                    f"""SELECT {select}
+                        FROM works w
+                        JOIN authors a ON w.author_id = a.author_id
+                        WHERE {where} {keyset}
+                        ORDER BY w.work_id
+                        LIMIT ?""",
+                    params + ([] if last_id is None else [last_id]) + [fetch]
+                ).fetchall()
+            
+            for row in rows:
+                yield dict(zip(columns, row))
+            
+            if len(rows) < fetch:
+                return
+            last_id = rows[-1][0]
+            if remaining is not None:
+                remaining -= len(rows)
+    
     def get_places_by_work(self, work_id: int) -> List[Dict]:
         """特定作品の全地名取得"""
         with self.get_connection() as conn:
@@ -447,8 +947,9 @@ class Database:
 class BungoDB(Database):
     """文豪データベース（拡張版）"""
     
-    def __init__(self, db_path: str = "data/bungo_production.db"):
-        super().__init__(db_path)
+    def __init__(self, db_path: str = "data/bungo_production.db", pool_size: int = 4,
+                 read_only: bool = False):
+        super().__init__(db_path, pool_size=pool_size, read_only=read_only)
     
     def upsert_author(self, name: str, wikipedia_url: str = None) -> int:
         """作者の挿入または更新"""
@@ -536,7 +1037,7 @@ class BungoDB(Database):
                 "UPDATE places SET lat = ?, lng = ? WHERE place_id = ?",
                 (lat, lng, place_id)
             )
-            conn.commit()
+            self._commit(conn)
             return cursor.rowcount > 0
     
     def get_recent_places(self, limit: int = 10) -> List[Dict]:
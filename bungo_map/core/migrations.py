@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+スキーママイグレーション
+バージョン管理されたスキーマ変更とホットクエリの実行計画チェック
+
+- schema_migrations テーブルに適用済みバージョンを記録
+- 未適用のマイグレーションのみを番号順に1トランザクションずつ適用
+- 既存DB（旧来のALTER TABLEで列追加済み）でも安全に再適用できる冪等な手順
+- EXPLAIN QUERY PLAN によるインデックス使用の回帰チェック
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from bungo_map.core.search_index import (
+    FTS_POPULATE, FTS_TABLES, FTS_TRIGGERS, fts5_trigram_available
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """スキーママイグレーション"""
+    version: int
+    name: str
+    apply: Callable[[sqlite3.Connection], None]
+
+
+def column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    """テーブルに列が存在するか"""
+    return any(row[1] == column for row in conn.execute(f"PRAGMA table_info({table})"))
+
+
+def add_column(conn: sqlite3.Connection, table: str, column: str, definition: str) -> None:
+    """列を追加（既に存在する場合は何もしない）"""
+    if not column_exists(conn, table, column):
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+
+def _create_base_tables(conn: sqlite3.Connection) -> None:
+    """authors / works / places テーブル"""
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS authors (
+        author_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL,
+        wikipedia_url TEXT,
+        birth_year INTEGER,
+        death_year INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS works (
+        work_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        author_id INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        wiki_url TEXT,
+        aozora_url TEXT,
+        text_url TEXT,
+        content TEXT,
+        publication_year INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (author_id) REFERENCES authors (author_id),
+        UNIQUE(author_id, title)
+    )
+    """)
+
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS places (
+        place_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        work_id INTEGER NOT NULL,
+        place_name TEXT NOT NULL,
+        lat REAL,
+        lng REAL,
+        before_text TEXT,
+        sentence TEXT,
+        after_text TEXT,
+        aozora_url TEXT,
+        confidence REAL DEFAULT 0.0,
+        extraction_method TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (work_id) REFERENCES works (work_id)
+    )
+    """)
+
+    # 初期のworksテーブルには存在しなかった列
+    add_column(conn, 'works', 'text_url', 'TEXT')
+    add_column(conn, 'works', 'publication_year', 'INTEGER')
+
+
+def _add_extraction_state(conn: sqlite3.Connection) -> None:
+    """差分抽出用: 本文ハッシュ・抽出時の本文ハッシュ・抽出器バージョン"""
+    add_column(conn, 'works', 'content_hash', 'TEXT')
+    add_column(conn, 'works', 'extracted_hash', 'TEXT')
+    add_column(conn, 'works', 'extractor_version', 'TEXT')
+    add_column(conn, 'works', 'extracted_at', 'TIMESTAMP')
+
+    # 本文が書き換えられたらハッシュを無効化（次回の差分抽出で再計算）
+    conn.execute("""
+    CREATE TRIGGER IF NOT EXISTS works_content_hash_reset
+    AFTER UPDATE OF content ON works
+    WHEN OLD.content IS NOT NEW.content
+    BEGIN
+        UPDATE works SET content_hash = NULL WHERE work_id = NEW.work_id;
+    END
+    """)
+
+
+def _add_geocoding_columns(conn: sqlite3.Connection) -> None:
+    """ジオコーディング結果の列（パイプラインの一括UPDATEで使用）"""
+    add_column(conn, 'places', 'geocoding_confidence', 'REAL')
+    add_column(conn, 'places', 'geocoding_source', 'TEXT')
+    add_column(conn, 'places', 'prefecture', 'TEXT')
+    add_column(conn, 'places', 'city', 'TEXT')
+
+
+def _create_places_indexes(conn: sqlite3.Connection) -> None:
+    """placesのホットクエリ用インデックス"""
+    # 作品別の地名一覧・作品単位の削除（差分抽出）
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_places_work_name ON places(work_id, place_name)")
+    # 地名での参照・集計
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_places_place_name ON places(place_name)")
+    # 信頼度による絞り込み
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_places_confidence ON places(confidence)")
+    # ジオコーディング待ちの地名（部分インデックス）
+    conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_places_ungeocoded
+    ON places(confidence, place_name) WHERE lat IS NULL
+    """)
+    # ジオコーディング済みの地名（件数集計・座標取得のカバリングインデックス）
+    conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_places_geocoded
+    ON places(lat, lng) WHERE lat IS NOT NULL
+    """)
+    conn.execute("ANALYZE places")
+
+
+def _create_places_rtree(conn: sqlite3.Connection) -> None:
+    """座標の空間インデックス（R*Tree）と同期トリガー
+
+    rtreeモジュールを含まないSQLiteでは作成せず、空間検索は
+    idx_places_geocoded による範囲検索にフォールバックする。
+    """
+    try:
+        conn.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS places_rtree USING rtree(
+            place_id, min_lat, max_lat, min_lng, max_lng
+        )
+        """)
+    except sqlite3.OperationalError:
+        return
+
+    conn.execute("""
+    CREATE TRIGGER IF NOT EXISTS places_rtree_insert
+    AFTER INSERT ON places
+    WHEN NEW.lat IS NOT NULL AND NEW.lng IS NOT NULL
+    BEGIN
+        INSERT OR REPLACE INTO places_rtree VALUES (NEW.place_id, NEW.lat, NEW.lat, NEW.lng, NEW.lng);
+    END
+    """)
+    conn.execute("""
+    CREATE TRIGGER IF NOT EXISTS places_rtree_update
+    AFTER UPDATE OF lat, lng ON places
+    BEGIN
+        DELETE FROM places_rtree WHERE place_id = OLD.place_id;
+        INSERT INTO places_rtree
+        SELECT NEW.place_id, NEW.lat, NEW.lat, NEW.lng, NEW.lng
+        WHERE NEW.lat IS NOT NULL AND NEW.lng IS NOT NULL;
+    END
+    """)
+    conn.execute("""
+    CREATE TRIGGER IF NOT EXISTS places_rtree_delete
+    AFTER DELETE ON places
+    BEGIN
+        DELETE FROM places_rtree WHERE place_id = OLD.place_id;
+    END
+    """)
+    conn.execute("""
+    INSERT OR REPLACE INTO places_rtree
+    SELECT place_id, lat, lat, lng, lng FROM places
+    WHERE lat IS NOT NULL AND lng IS NOT NULL
+    """)
+
+
+def _create_search_index(conn: sqlite3.Connection) -> None:
+    """全文検索インデックス（FTS5 trigram）と同期トリガー
+
+    trigramトークナイザーを含まないSQLite（3.34未満）では作成せず、
+    検索は従来のLIKE検索にフォールバックする。
+    旧バージョンが起動時に作成したFTSテーブルはそのまま使う。
+    """
+    if not fts5_trigram_available(conn):
+        return
+
+    existing = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    for table, ddl in FTS_TABLES.items():
+        if table not in existing:
+            conn.execute(ddl)
+            conn.execute(FTS_POPULATE[table])
+
+    for ddl in FTS_TRIGGERS:
+        conn.execute(ddl)
+
+
+MIGRATIONS: Tuple[Migration, ...] = (
+    Migration(1, 'base_tables', _create_base_tables),
+    Migration(2, 'works_extraction_state', _add_extraction_state),
+    Migration(3, 'places_geocoding_columns', _add_geocoding_columns),
+    Migration(4, 'places_indexes', _create_places_indexes),
+    Migration(5, 'places_rtree', _create_places_rtree),
+    Migration(6, 'search_index', _create_search_index),
+)
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def _ensure_migrations_table(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+    conn.commit()
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """適用済みの最新スキーマバージョン（未管理のDBは0）"""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_migrations'"
+    ).fetchone()
+    if not exists:
+        return 0
+    return conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations").fetchone()[0]
+
+
+def apply_migrations(conn: sqlite3.Connection,
+                     migrations: Sequence[Migration] = MIGRATIONS) -> List[int]:
+    """未適用のマイグレーションを適用
+
+    各マイグレーションは BEGIN IMMEDIATE で書き込みロックを取ってから
+    適用状況を再確認するため、複数プロセスが同時に起動しても二重適用されない。
+
+    Returns:
+        今回適用したバージョンのリスト
+    """
+    _ensure_migrations_table(conn)
+    if get_schema_version(conn) >= migrations[-1].version:
+        return []
+
+    applied = []
+    for migration in migrations:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if get_schema_version(conn) >= migration.version:
+                conn.rollback()
+                continue
+            migration.apply(conn)
+            conn.execute(
+                "INSERT INTO schema_migrations (version, name) VALUES (?, ?)",
+                (migration.version, migration.name)
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        applied.append(migration.version)
+
+    return applied
+
+
+# ===========================================
+# 実行計画の回帰チェック
+# ===========================================
+
+# (名前, SQL, パラメータ, 使用されるべきインデックス)
+HOT_QUERIES: Tuple[Tuple[str, str, Tuple[Any, ...], str], ...] = (
+    ('places_by_work',
+     "SELECT place_id, place_name FROM places WHERE work_id = ? ORDER BY place_name",
+     (1,), 'idx_places_work_name'),
+    ('delete_places_by_work',
+     "SELECT place_id FROM places WHERE work_id = ?",
+     (1,), 'idx_places_work_name'),
+    ('places_by_name',
+     "SELECT place_id FROM places WHERE place_name = ?",
+     ('東京',), 'idx_places_place_name'),
+    ('places_by_name_prefix',
+     "SELECT place_id FROM places WHERE place_name >= ? AND place_name < ?",
+     ('東京', '東京\U0010ffff'), 'idx_places_place_name'),
+    ('places_by_confidence',
+     "SELECT place_id FROM places WHERE confidence >= ?",
+     (0.9,), 'idx_places_confidence'),
+    ('ungeocoded_places',
+     "SELECT place_id, place_name FROM places "
+     "WHERE lat IS NULL AND lng IS NULL AND confidence >= ? ORDER BY confidence DESC",
+     (0.3,), 'idx_places_ungeocoded'),
+    ('geocoded_count',
+     "SELECT COUNT(*) FROM places WHERE lat IS NOT NULL AND lng IS NOT NULL",
+     (), 'idx_places_geocoded'),
+    ('places_in_bbox',
+     "SELECT place_id FROM places_rtree "
+     "WHERE min_lat <= ? AND max_lat >= ? AND min_lng <= ? AND max_lng >= ?",
+     (36.0, 35.0, 140.0, 139.0), 'places_rtree'),
+)
+
+
+def explain_query_plan(conn: sqlite3.Connection, sql: str, params: Sequence[Any] = ()) -> List[str]:
+    """EXPLAIN QUERY PLAN の detail 列"""
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", tuple(params))]
+
+
+def check_query_plans(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+    """ホットクエリが想定インデックスを使用しているかを確認
+
+    Returns:
+        クエリごとの {'name', 'expected_index', 'plan', 'ok'}
+    """
+    results = []
+    for name, sql, params, expected_index in HOT_QUERIES:
+        plan = explain_query_plan(conn, sql, params)
+        ok = any(expected_index in detail for detail in plan)
+        results.append({
+            'name': name,
+            'expected_index': expected_index,
+            'plan': plan,
+            'ok': ok,
+        })
+    return results
@@ -48,4 +48,8 @@ class Place:
     aozora_url: Optional[str] = None
     confidence: float = 0.0
     extraction_method: Optional[str] = None
-    created_at: Optional[datetime] = None 
\ No newline at end of file
+    created_at: Optional[datetime] = None
+    # 抽出時の重複解消用（DBには保存しない）
+    sentence_index: Optional[int] = None  # 作品内の文番号
+    start_pos: Optional[int] = None  # sentence 内の地名の位置
+    end_pos: Optional[int] = None
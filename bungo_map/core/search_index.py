@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+全文検索インデックス
+SQLite FTS5（trigramトークナイザー）による地名・作品・作者検索
+
+- places_fts / works_fts / authors_fts をトリガーで元テーブルと同期
+  （作成はスキーママイグレーション v6 で行う）
+- 3文字以上の語はFTS5 MATCH + bm25 でランキングし、3文字未満の語はその結果をLIKEで絞り込む
+- 3文字未満の語のみの地名検索（東京・京都など）は places.place_name のインデックスで
+  完全一致・前方一致を検索（作品名・作者名の部分一致も含む）
+- limit / offset によるページング
+"""
+
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+# trigramトークナイザーで照合できる最短の語長
+TRIGRAM_MIN_LENGTH = 3
+
+# 前方一致の範囲検索の上限（語 + 最大のコードポイント）
+_PREFIX_UPPER_BOUND = '\U0010ffff'
+
+FTS_TABLES = {
+    'places_fts': """
+        CREATE VIRTUAL TABLE places_fts USING fts5(
+            place_name, sentence, work_title, author_name,
+            tokenize = 'trigram'
+        )
+    """,
+    'works_fts': """
+        CREATE VIRTUAL TABLE works_fts USING fts5(
+            title, author_name,
+            tokenize = 'trigram'
+        )
+    """,
+    'authors_fts': """
+        CREATE VIRTUAL TABLE authors_fts USING fts5(
+            name,
+            tokenize = 'trigram'
+        )
+    """,
+}
+
+# 作品・作者は places から参照されるため、作品名・作者名はサブクエリで解決する
+_WORK_TITLE = "(SELECT title FROM works WHERE work_id = {work_id})"
+_WORK_AUTHOR = ("(SELECT a.name FROM works w JOIN authors a ON a.author_id = w.author_id "
+                "WHERE w.work_id = {work_id})")
+_AUTHOR_NAME = "(SELECT name FROM authors WHERE author_id = {author_id})"
+
+FTS_TRIGGERS = [
+    # --- places ---
+    f"""
+    CREATE TRIGGER IF NOT EXISTS places_fts_insert AFTER INSERT ON places BEGIN
+        DELETE FROM places_fts WHERE rowid = NEW.place_id;
+        INSERT INTO places_fts (rowid, place_name, sentence, work_title, author_name)
+        VALUES (NEW.place_id, NEW.place_name, COALESCE(NEW.sentence, ''),
+                {_WORK_TITLE.format(work_id='NEW.work_id')},
+                {_WORK_AUTHOR.format(work_id='NEW.work_id')});
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS places_fts_delete AFTER DELETE ON places BEGIN
+        DELETE FROM places_fts WHERE rowid = OLD.place_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS places_fts_update
+    AFTER UPDATE OF place_name, sentence, work_id ON places BEGIN
+        UPDATE places_fts SET
+            place_name = NEW.place_name,
+            sentence = COALESCE(NEW.sentence, ''),
+            work_title = {_WORK_TITLE.format(work_id='NEW.work_id')},
+            author_name = {_WORK_AUTHOR.format(work_id='NEW.work_id')}
+        WHERE rowid = NEW.place_id;
+    END
+    """,
+    # --- works ---
+    f"""
+    CREATE TRIGGER IF NOT EXISTS works_fts_insert AFTER INSERT ON works BEGIN
+        DELETE FROM works_fts WHERE rowid = NEW.work_id;
+        INSERT INTO works_fts (rowid, title, author_name)
+        VALUES (NEW.work_id, NEW.title, {_AUTHOR_NAME.format(author_id='NEW.author_id')});
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS works_fts_delete AFTER DELETE ON works BEGIN
+        DELETE FROM works_fts WHERE rowid = OLD.work_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS works_fts_update
+    AFTER UPDATE OF title, author_id ON works BEGIN
+        UPDATE works_fts SET
+            title = NEW.title,
+            author_name = {_AUTHOR_NAME.format(author_id='NEW.author_id')}
+        WHERE rowid = NEW.work_id;
+        UPDATE places_fts SET
+            work_title = NEW.title,
+            author_name = {_AUTHOR_NAME.format(author_id='NEW.author_id')}
+        WHERE rowid IN (SELECT place_id FROM places WHERE work_id = NEW.work_id);
+    END
+    """,
+    # --- authors ---
+    """
+    CREATE TRIGGER IF NOT EXISTS authors_fts_insert AFTER INSERT ON authors BEGIN
+        DELETE FROM authors_fts WHERE rowid = NEW.author_id;
+        INSERT INTO authors_fts (rowid, name) VALUES (NEW.author_id, NEW.name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS authors_fts_delete AFTER DELETE ON authors BEGIN
+        DELETE FROM authors_fts WHERE rowid = OLD.author_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS authors_fts_update AFTER UPDATE OF name ON authors BEGIN
+        UPDATE authors_fts SET name = NEW.name WHERE rowid = NEW.author_id;
+        UPDATE works_fts SET author_name = NEW.name
+        WHERE rowid IN (SELECT work_id FROM works WHERE author_id = NEW.author_id);
+        UPDATE places_fts SET author_name = NEW.name
+        WHERE rowid IN (
+            SELECT p.place_id FROM places p JOIN works w ON p.work_id = w.work_id
+            WHERE w.author_id = NEW.author_id
+        );
+    END
+    """,
+]
+
+# 元テーブルからの一括構築
+FTS_POPULATE = {
+    'places_fts': """
+        INSERT INTO places_fts (rowid, place_name, sentence, work_title, author_name)
+        SELECT p.place_id, p.place_name, COALESCE(p.sentence, ''), w.title, a.name
+        FROM places p
+        LEFT JOIN works w ON p.work_id = w.work_id
+        LEFT JOIN authors a ON w.author_id = a.author_id
+    """,
+    'works_fts': """
+        INSERT INTO works_fts (rowid, title, author_name)
+        SELECT w.work_id, w.title, a.name
+        FROM works w
+        LEFT JOIN authors a ON w.author_id = a.author_id
+    """,
+    'authors_fts': """
+        INSERT INTO authors_fts (rowid, name)
+        SELECT author_id, name FROM authors
+    """,
+}
+
+# 検索種別ごとの定義: (FTSテーブル, 列, bm25の列重み, 結果取得SQL, 結果の列名)
+SEARCH_TARGETS: Dict[str, Dict[str, Any]] = {
+    'places': {
+        'table': 'places_fts',
+        'columns': ('place_name', 'sentence', 'work_title', 'author_name'),
+        'weights': (10.0, 1.0, 3.0, 3.0),
+        'name_column': 'place_name',
+        'select': """
+            SELECT p.place_id, p.work_id, p.place_name, p.lat, p.lng,
+                   p.before_text, p.sentence, p.after_text, p.confidence,
+                   w.title as work_title, a.name as author_name
+            FROM places_fts f
+            JOIN places p ON p.place_id = f.rowid
+            JOIN works w ON p.work_id = w.work_id
+            JOIN authors a ON w.author_id = a.author_id
+        """,
+        'result_columns': ['place_id', 'work_id', 'place_name', 'latitude', 'longitude',
+                           'before_text', 'sentence', 'after_text', 'confidence',
+                           'work_title', 'author_name'],
+        # 短い語のみの検索: 地名の前方一致（idx_places_place_name）または作品名・作者名の部分一致
+        'name_index': {
+            'select': """
+                SELECT p.place_id, p.work_id, p.place_name, p.lat, p.lng,
+                       p.before_text, p.sentence, p.after_text, p.confidence,
+                       w.title as work_title, a.name as author_name
+                FROM places p
+                JOIN works w ON p.work_id = w.work_id
+                JOIN authors a ON w.author_id = a.author_id
+            """,
+            'from': 'places p',
+            'name_column': 'p.place_name',
+            'rowid': 'p.place_id',
+            'term': (
+                "(p.place_name >= ? AND p.place_name < ?"
+                " OR p.work_id IN (SELECT tw.work_id FROM works tw"
+                " JOIN authors ta ON ta.author_id = tw.author_id"
+                " WHERE tw.title LIKE ? ESCAPE '\\' OR ta.name LIKE ? ESCAPE '\\'))"
+            ),
+        },
+    },
+    'works': {
+        'table': 'works_fts',
+        'columns': ('title', 'author_name'),
+        'weights': (5.0, 2.0),
+        'name_column': 'title',
+        'select': """
+            SELECT w.work_id, w.author_id, w.title, w.wiki_url, w.aozora_url,
+                   a.name as author_name
+            FROM works_fts f
+            JOIN works w ON w.work_id = f.rowid
+            JOIN authors a ON w.author_id = a.author_id
+        """,
+        'result_columns': ['work_id', 'author_id', 'title', 'wiki_url', 'aozora_url', 'author_name'],
+    },
+    'authors': {
+        'table': 'authors_fts',
+        'columns': ('name',),
+        'weights': (1.0,),
+        'name_column': 'name',
+        'select': """
+            SELECT a.author_id, a.name, a.wikipedia_url, a.birth_year, a.death_year
+            FROM authors_fts f
+            JOIN authors a ON a.author_id = f.rowid
+        """,
+        'result_columns': ['author_id', 'name', 'wikipedia_url', 'birth_year', 'death_year'],
+    },
+}
+
+
+def fts5_trigram_available(conn: sqlite3.Connection) -> bool:
+    """FTS5のtrigramトークナイザーが利用可能か（SQLite 3.34以降）"""
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._fts5_probe USING fts5(x, tokenize = 'trigram')")
+        conn.execute("DROP TABLE temp._fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def _escape_like(term: str) -> str:
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class SearchIndex:
+    """FTS5全文検索インデックス
+
+    Database の接続を使って検索・再構築する（FTSテーブルはスキーママイグレーション v6 で作成）。
+    trigramが利用できずFTSテーブルが無い環境では available が False になり、
+    呼び出し側は従来のLIKE検索にフォールバックする。
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.available = self._index_exists()
+
+    def _index_exists(self) -> bool:
+        """FTSテーブルが作成済みか（作成はスキーママイグレーションで行う）"""
+        with self.db.get_connection() as conn:
+            existing = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                )
+            }
+        return all(table in existing for table in FTS_TABLES)
+
+    def rebuild(self) -> Dict[str, int]:
+        """全FTSテーブルを元テーブルから再構築"""
+        counts = {}
+        with self.db.transaction() as conn:
+            for table, sql in FTS_POPULATE.items():
+                conn.execute(f"DELETE FROM {table}")
+                conn.execute(sql)
+                counts[table] = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        return counts
+
+    @staticmethod
+    def _terms(query: str) -> List[str]:
+        return query.split()
+
+    def _where(self, target: Dict[str, Any], terms: List[str]) -> Tuple[str, List[Any], bool]:
+        """検索条件（WHERE句, パラメータ, MATCHを使うか）
+
+        3文字以上の語はMATCHで絞り込み、trigramで照合できない短い語は
+        その結果に対してFTSテーブル上のLIKEを適用する。
+        """
+        long_terms = [term for term in terms if len(term) >= TRIGRAM_MIN_LENGTH]
+        clauses, params = [], []
+        if long_terms:
+            # 各語をフレーズとして扱い、全語を含む行に一致
+            clauses.append(f"{target['table']} MATCH ?")
+            params.append(' '.join('"' + term.replace('"', '""') + '"' for term in long_terms))
+
+        for term in terms:
+            if len(term) >= TRIGRAM_MIN_LENGTH:
+                continue
+            pattern = f"%{_escape_like(term)}%"
+            clauses.append('(' + ' OR '.join(
+                f"f.{column} LIKE ? ESCAPE '\\'" for column in target['columns']
+            ) + ')')
+            params.extend([pattern] * len(target['columns']))
+        return ' AND '.join(clauses), params, bool(long_terms)
+
+    @staticmethod
+    def _name_where(name_index: Dict[str, Any], terms: List[str]) -> Tuple[str, List[Any]]:
+        """短い語のみの検索条件（名称の前方一致はインデックスの範囲検索）"""
+        clauses, params = [], []
+        for term in terms:
+            pattern = f"%{_escape_like(term)}%"
+            clauses.append(name_index['term'])
+            params.extend([term, term + _PREFIX_UPPER_BOUND, pattern, pattern])
+        return ' AND '.join(clauses), params
+
+    def _name_index(self, target: Dict[str, Any], terms: List[str]) -> Optional[Dict[str, Any]]:
+        """名称インデックスで検索する場合はその定義（3文字以上の語を含む場合は None）"""
+        if any(len(term) >= TRIGRAM_MIN_LENGTH for term in terms):
+            return None
+        return target.get('name_index')
+
+    def search(self, kind: str, query: str, limit: int = 50, offset: int = 0) -> List[Dict]:
+        """ランキング付き検索
+
+        Args:
+            kind: 'places' / 'works' / 'authors'
+            query: 検索語（空白区切りで AND 検索）
+        """
+        target = SEARCH_TARGETS[kind]
+        terms = self._terms(query)
+        if not terms:
+            return []
+
+        name_index = self._name_index(target, terms)
+        if name_index is not None:
+            select = name_index['select']
+            where, params = self._name_where(name_index, terms)
+            # 名称の完全一致 → 名称の前方一致 → その他 の順
+            name = name_index['name_column']
+            order = f"({name} = ?) DESC, ({name} >= ? AND {name} < ?) DESC, {name_index['rowid']}"
+            params = params + [query.strip(), terms[0], terms[0] + _PREFIX_UPPER_BOUND]
+        else:
+            select = target['select']
+            where, params, use_match = self._where(target, terms)
+            if use_match:
+                weights = ', '.join(str(weight) for weight in target['weights'])
+                order = f"bm25({target['table']}, {weights}), f.rowid"
+            else:
+                # 名称の完全一致 → 名称の部分一致 → その他 の順
+                name = f"f.{target['name_column']}"
+                order = f"({name} = ?) DESC, ({name} LIKE ? ESCAPE '\\') DESC, f.rowid"
+                params = params + [query.strip(), f"%{_escape_like(terms[0])}%"]
+
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                f"{select} WHERE {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                params + [limit, offset]
+            )
+            return [dict(zip(target['result_columns'], row)) for row in cursor.fetchall()]
+
+    def count(self, kind: str, query: str) -> int:
+        """一致件数"""
+        target = SEARCH_TARGETS[kind]
+        terms = self._terms(query)
+        if not terms:
+            return 0
+
+        name_index = self._name_index(target, terms)
+        if name_index is not None:
+            source = name_index['from']
+            where, params = self._name_where(name_index, terms)
+        else:
+            source = f"{target['table']} f"
+            where, params, _ = self._where(target, terms)
+        with self.db.get_connection() as conn:
+            return conn.execute(
+                f"SELECT COUNT(*) FROM {source} WHERE {where}", params
+            ).fetchone()[0]
@@ -16,6 +16,11 @@ from urllib.parse import urljoin, quote
 from bs4 import BeautifulSoup
 import json
 
+from bungo_map.utils.aozora_text_cleaner import strip_aozora_markup
+
+# ※で始まる注釈行（※［＃…］の外字注記は strip_aozora_markup で除去済み）
+NOTE_LINE_PATTERN = re.compile(r'※[^\n]*\n')
+
 
 class AozoraExtractor:
     """青空文庫テキスト抽出器"""
@@ -212,16 +217,14 @@ class AozoraExtractor:
     
     def normalize_aozora_text(self, raw_text: str) -> str:
         """青空文庫テキストの正規化"""
-        text = raw_text
+        # 1. ルビ・注記・記号説明・奥付の除去（共通の正規化器で1回走査）
+        text = strip_aozora_markup(raw_text)
         
-        # 1. ヘッダー・フッター除去
+        # 2. ヘッダー除去
         text = self._remove_metadata(text)
         
-        # 2. ルビ記法処理
-        text = self._process_ruby(text)
-        
-        # 3. 注記・記法除去
-        text = self._remove_annotations(text)
+        # 3. ※注釈行・＊記号の除去
+        text = NOTE_LINE_PATTERN.sub('', text).replace('＊', '')
         
         # 4. 改行・空白正規化
         text = self._normalize_whitespace(text)
@@ -258,41 +261,8 @@ class AozoraExtractor:
         
         return '\n'.join(content_lines)
     
-    def _process_ruby(self, text: str) -> str:
-        """ルビ記法を処理"""
-        # ｜漢字《かんじ》 → 漢字
-        text = re.sub(r'｜([^《]+)《[^》]+》', r'\1', text)
-        
-        # 漢字《かんじ》 → 漢字
-        text = re.sub(r'([一-龯]+)《[^》]+》', r'\1', text)
-        
-        # 残ったルビ記号除去
-        text = re.sub(r'《[^》]*》', '', text)
-        text = text.replace('｜', '')
-        
-        return text
-    
-    def _remove_annotations(self, text: str) -> str:
-        """注記・記法を除去"""
-        # ［＃...］記法除去
-        text = re.sub(r'［＃[^］]*］', '', text)
-        
-        # 〔...〕編者注除去
-        text = re.sub(r'〔[^〕]*〕', '', text)
-        
-        # ※注釈行除去
-        text = re.sub(r'※[^\n]*\n', '', text)
-        
-        # その他の記号
-        text = re.sub(r'＊', '', text)
-        
-        return text
-    
     def _normalize_whitespace(self, text: str) -> str:
         """空白・改行を正規化"""
-        # Windows改行統一
-        text = re.sub(r'\r\n', '\n', text)
-        
         # 連続改行を2つまでに制限
         text = re.sub(r'\n{3,}', '\n\n', text)
         
@@ -15,7 +15,7 @@ import logging
 from typing import List, Dict, Optional
 from dataclasses import dataclass, asdict
 
-from bungo_map.processors.aozora_content_processor import AozoraContentProcessor
+from bungo_map.processors.aozora_content_processor import AozoraContentProcessor, ProcessedWork
 from bungo_map.extractors.simple_place_extractor import SimplePlaceExtractor
 
 logger = logging.getLogger(__name__)
@@ -44,35 +44,46 @@ class EnhancedPlaceExtractor:
         
         print("🗺️ 強化版地名抽出器初期化完了")
     
-    def extract_places_from_work(self, work_id: int, raw_content: str, aozora_url: str = "") -> List[EnhancedPlace]:
-        """作品からの地名抽出（完全版）"""
+    def process_work(self, work_id: int, raw_content: str) -> ProcessedWork:
+        """作品の前処理（他の抽出器と共有する場合はこの結果を渡す）"""
+        return self.content_processor.process_work(work_id, raw_content)
+    
+    def extract_places_from_work(self, work_id: int, raw_content: str, aozora_url: str = "",
+                                 processed: Optional[ProcessedWork] = None) -> List[EnhancedPlace]:
+        """作品からの地名抽出（完全版）
         
-        if not raw_content or len(raw_content) < 100:
-            logger.warning(f"⚠️ 作品{work_id}: コンテンツが短すぎます")
-            return []
+        processed を渡した場合は本文抽出・文分割・文クリーニングを再実行しない。
+        """
         
-        # 1. 青空文庫コンテンツ処理
-        result = self.content_processor.process_work_content(work_id, raw_content)
+        if processed is None:
+            if not raw_content or len(raw_content) < 100:
+                logger.warning(f"⚠️ 作品{work_id}: コンテンツが短すぎます")
+                return []
+            
+            # 1. 青空文庫コンテンツ処理
+            processed = self.process_work(work_id, raw_content)
         
-        if not result['success']:
-            logger.warning(f"⚠️ 作品{work_id}: コンテンツ処理失敗 - {result['error']}")
+        if not processed.success:
+            logger.warning(f"⚠️ 作品{work_id}: コンテンツ処理失敗 - {processed.error}")
             return []
         
-        sentences = result['sentences']
-        main_content = result['main_content']
+        sentences = processed.sentences
+        sentence_index = processed.sentence_index
         
         # 2. 各文から地名抽出
         all_places = []
         
-        for sentence_index, sentence in enumerate(sentences):
-            # 文脈取得
-            context = self.content_processor.get_sentence_context(
-                sentences, sentence_index, context_length=1
+        for position, pair in enumerate(processed.sentence_pairs()):
+            # 基本地名抽出（この文のみ）
+            sentence_places = self.simple_extractor.extract_places_from_sentences(
+                work_id, (pair,), aozora_url, start_index=position
             )
+            if not sentence_places:
+                continue
             
-            # 基本地名抽出（この文のみ）
-            sentence_places = self.simple_extractor.extract_places_from_text(
-                work_id, sentence, aozora_url
+            # 文脈取得
+            context = self.content_processor.get_sentence_context(
+                sentences, position, context_length=1, index=sentence_index
             )
             
             # EnhancedPlaceに変換
@@ -5,14 +5,29 @@ GiNZA NLP地名抽出器
 """
 
 import spacy
-from typing import List, Dict, Tuple
+from typing import Iterator, List, Dict, Tuple
 from bungo_map.core.models import Place
 
+# GiNZAの地名ラベル
+PLACE_LABELS = {'Province', 'City', 'County', 'GPE', 'LOC'}
+
+# NERのみ必要な場合に無効化するコンポーネント（依存解析・形態素属性・文節）
+NER_UNUSED_COMPONENTS = (
+    'parser', 'lemmatizer', 'attribute_ruler', 'morphologizer',
+    'compound_splitter', 'bunsetu_recognizer',
+)
+
 
 class GinzaPlaceExtractor:
     """GiNZAを使った高度な地名抽出器"""
     
-    def __init__(self):
+    def __init__(self, ner_only: bool = False, batch_size: int = 4, n_process: int = 1):
+        """
+        Args:
+            ner_only: 固有表現抽出に不要なコンポーネントを無効化する
+            batch_size: nlp.pipe に渡すチャンクのバッチサイズ
+            n_process: nlp.pipe の並列プロセス数
+        """
         try:
             self.nlp = spacy.load('ja_ginza')
             print("✅ GiNZA (ja_ginza) モデル読み込み完了")
@@ -20,6 +35,24 @@ class GinzaPlaceExtractor:
             print("⚠️ ja_ginza モデルが見つかりません。ja_core_news_smを使用します。")
             self.nlp = spacy.load('ja_core_news_sm')
             print("✅ ja_core_news_sm モデル読み込み完了")
+        
+        self.batch_size = batch_size
+        self.n_process = n_process
+        if ner_only:
+            self._disable_unused_components()
+    
+    def _disable_unused_components(self) -> None:
+        """NERに不要なコンポーネントを無効化し、文分割はルールベースで行う"""
+        disabled = [name for name in NER_UNUSED_COMPONENTS if name in self.nlp.pipe_names]
+        for name in disabled:
+            self.nlp.disable_pipe(name)
+        
+        # parserを外すと doc.sents が得られないため句点で文分割する
+        if 'parser' in disabled and 'senter' not in self.nlp.pipe_names:
+            self.nlp.add_pipe('sentencizer', first=True, config={'punct_chars': ['。', '！', '？']})
+        
+        if disabled:
+            print(f"⚡ NER専用モード: {', '.join(disabled)} を無効化")
     
     def extract_places_from_text(self, work_id: int, text: str, aozora_url: str = None) -> List[Place]:
         """テキストから地名を抽出"""
@@ -31,48 +64,65 @@ class GinzaPlaceExtractor:
         
         print(f"📝 テキスト分割: {len(text_chunks)}チャンク")
         
-        all_sentences = []
-        for chunk_idx, chunk in enumerate(text_chunks):
-            try:
-                doc = self.nlp(chunk)
-                chunk_sentences = [sent.text.strip() for sent in doc.sents]
-                all_sentences.extend(chunk_sentences)
-                print(f"   チャンク{chunk_idx + 1}: {len(chunk_sentences)}文")
-            except Exception as e:
-                print(f"⚠️ チャンク{chunk_idx + 1}の解析エラー: {e}")
-                continue
-        
-        print(f"📄 総文数: {len(all_sentences)}")
-        sentences = all_sentences
-        
-        for i, sentence in enumerate(sentences):
-            # 各文を解析
-            sent_doc = self.nlp(sentence)
+        # チャンクを一括解析し、文と地名エンティティを1回の解析で収集
+        sentences: List[str] = []
+        mentions: List[Tuple[int, str, float]] = []  # (文番号, 地名, 信頼度)
+        
+        for chunk_idx, doc in self._iter_docs(text_chunks):
+            chunk_sentences = 0
+            for sent in doc.sents:
+                sentence = sent.text.strip()
+                if not sentence:
+                    continue
+                sentence_idx = len(sentences)
+                sentences.append(sentence)
+                chunk_sentences += 1
+                
+                # 地名候補を抽出（GiNZAのラベル）
+                for ent in sent.ents:
+                    if ent.label_ in PLACE_LABELS:
+                        # 信頼度計算（簡易版）
+                        mentions.append((sentence_idx, ent.text, self._calculate_confidence(ent, sentence)))
+            print(f"   チャンク{chunk_idx + 1}: {chunk_sentences}文")
+        
+        print(f"📄 総文数: {len(sentences)}")
+        
+        for i, place_name, confidence in mentions:
+            # 前後の文脈を取得
+            before_text = sentences[i-1] if i > 0 else ""
+            after_text = sentences[i+1] if i < len(sentences)-1 else ""
             
-            # 地名候補を抽出（GiNZAのラベル）
-            for ent in sent_doc.ents:
-                if ent.label_ in ['Province', 'City', 'County', 'GPE', 'LOC']:  # GiNZAの地名ラベル
-                    # 前後の文脈を取得
-                    before_text = sentences[i-1] if i > 0 else ""
-                    after_text = sentences[i+1] if i < len(sentences)-1 else ""
-                    
-                    # 信頼度計算（簡易版）
-                    confidence = self._calculate_confidence(ent, sentence)
-                    
-                    place = Place(
-                        work_id=work_id,
-                        place_name=ent.text,
-                        before_text=before_text[:500],  # 500文字に制限
-                        sentence=sentence,
-                        after_text=after_text[:500],   # 500文字に制限
-                        aozora_url=aozora_url,
-                        confidence=confidence,
-                        extraction_method="ginza_nlp"
-                    )
-                    places.append(place)
+            place = Place(
+                work_id=work_id,
+                place_name=place_name,
+                before_text=before_text[:500],  # 500文字に制限
+                sentence=sentences[i],
+                after_text=after_text[:500],   # 500文字に制限
+                aozora_url=aozora_url,
+                confidence=confidence,
+                extraction_method="ginza_nlp"
+            )
+            places.append(place)
         
         return self._deduplicate_places(places)
     
+    def _iter_docs(self, chunks: List[str]) -> Iterator[Tuple[int, "spacy.tokens.Doc"]]:
+        """チャンクを nlp.pipe で一括解析（失敗時は残りを個別解析）"""
+        done = 0
+        try:
+            for doc in self.nlp.pipe(chunks, batch_size=self.batch_size, n_process=self.n_process):
+                yield done, doc
+                done += 1
+            return
+        except Exception as e:
+            print(f"⚠️ 一括解析エラー（チャンク{done + 1}以降を個別解析）: {e}")
+        
+        for chunk_idx in range(done, len(chunks)):
+            try:
+                yield chunk_idx, self.nlp(chunks[chunk_idx])
+            except Exception as e:
+                print(f"⚠️ チャンク{chunk_idx + 1}の解析エラー: {e}")
+    
     def _calculate_confidence(self, entity, sentence: str) -> float:
         """地名の信頼度を計算（簡易版）"""
         base_confidence = 0.7
@@ -150,7 +200,7 @@ class GinzaPlaceExtractor:
         doc = self.nlp(text)
         
         for ent in doc.ents:
-            if ent.label_ in ['Province', 'City', 'County', 'GPE', 'LOC']:
+            if ent.label_ in PLACE_LABELS:
                 # より詳細な文脈抽出
                 start_char = max(0, ent.start_char - context_size)
                 end_char = min(len(text), ent.end_char + context_size)
@@ -8,6 +8,7 @@
 import re
 from typing import List, Dict, Set, Tuple
 from bungo_map.core.models import Place
+from bungo_map.utils.span_resolver import overlapping_groups, select_non_overlapping
 
 class ImprovedPlaceExtractor:
     """重複抽出を防ぐ改良された地名抽出器"""
@@ -122,36 +123,18 @@ class ImprovedPlaceExtractor:
         return matches
     
     def _deduplicate_overlapping_matches(self, matches: List[Dict]) -> List[Dict]:
-        """重複する地名の排除"""
-        if not matches:
-            return []
-        
-        # 優先度順でソート（priority 0が最高優先度）
-        matches.sort(key=lambda x: (x['priority'], -x['confidence'], -len(x['text'])))
-        
-        deduplicated = []
-        used_ranges = []
-        
-        for match in matches:
-            match_range = (match['start'], match['end'])
-            
-            # 既に使用された範囲と重複するかチェック
-            is_overlapping = any(
-                self._ranges_overlap(match_range, used_range) 
-                for used_range in used_ranges
-            )
-            
-            if not is_overlapping:
-                deduplicated.append(match)
-                used_ranges.append(match_range)
-        
-        return deduplicated
+        """重複する地名の排除（優先度順に、文中位置が重ならないものを採用）"""
+        # priority 0が最高優先度
+        return select_non_overlapping(
+            matches,
+            span=self._match_span,
+            rank=lambda x: (x['priority'], -x['confidence'], -len(x['text']))
+        )
     
-    def _ranges_overlap(self, range1: Tuple[int, int], range2: Tuple[int, int]) -> bool:
-        """2つの範囲が重複するかチェック"""
-        start1, end1 = range1
-        start2, end2 = range2
-        return not (end1 <= start2 or end2 <= start1)
+    @staticmethod
+    def _match_span(match: Dict) -> Tuple[int, int]:
+        """マッチの文中位置"""
+        return match['start'], match['end']
     
     def _split_into_sentences(self, text: str) -> List[str]:
         """テキストを文に分割"""
@@ -217,28 +200,7 @@ class ImprovedPlaceExtractor:
     
     def _find_overlapping_groups(self, matches: List[Dict]) -> List[List[Dict]]:
         """重複するマッチのグループを見つける"""
-        groups = []
-        used = set()
-        
-        for i, match1 in enumerate(matches):
-            if i in used:
-                continue
-                
-            group = [match1]
-            used.add(i)
-            
-            for j, match2 in enumerate(matches[i+1:], i+1):
-                if j in used:
-                    continue
-                    
-                if self._ranges_overlap((match1['start'], match1['end']), (match2['start'], match2['end'])):
-                    group.append(match2)
-                    used.add(j)
-            
-            if len(group) > 1:
-                groups.append(group)
-        
-        return groups
+        return overlapping_groups(matches, span=self._match_span)
 
 # テスト用の実用例
 def test_extraction_improvement():
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📖 地名辞書（ガゼッティア）
+抽出器・ジオコーダーで共有する地名辞書と、Aho-Corasick法による辞書マッチャー
+
+Features:
+- 有名地名・都道府県・都市・歴史地名・詳細地名の統合辞書
+- 辞書サイズに依存しない線形時間の全地名検出
+- 最左最長一致による重複のない地名スパン
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from bungo_map.geo.enhanced_geocoding import (
+    PREFECTURE_COORDINATES, CITY_COORDINATES, HISTORICAL_PLACES
+)
+
+# 有名な地名・駅名・観光地（文学作品頻出）
+FAMOUS_PLACE_NAMES = [
+    # 東京エリア
+    '銀座', '新宿', '渋谷', '上野', '浅草', '品川', '池袋', '新橋', '有楽町', '丸の内',
+    '表参道', '原宿', '恵比寿', '六本木', '赤坂', '青山', '麻布', '目黒', '世田谷',
+    '江戸', '本郷', '神田', '日本橋', '築地', '月島', '両国', '浅草橋', '秋葉原',
+    
+    # 関東エリア
+    '横浜', '川崎', '千葉', '埼玉', '大宮', '浦和', '船橋', '柏', '所沢', '川越',
+    '鎌倉', '湘南', '箱根', '熱海', '軽井沢', '日光', '那須', '草津', '伊香保',
+    
+    # 関西エリア
+    '京都', '大阪', '神戸', '奈良', '和歌山', '滋賀', '比叡山', '嵐山', '祇園',
+    '清水', '金閣寺', '銀閣寺', '伏見', '宇治', '平安京', '難波', '梅田', '心斎橋',
+    
+    # 中部エリア
+    '名古屋', '金沢', '富山', '新潟', '長野', '松本', '諏訪', '上高地', '立山',
+    
+    # 東北エリア
+    '仙台', '青森', '盛岡', '秋田', '山形', '福島', '会津', '松島',
+    
+    # 北海道
+    '札幌', '函館', '小樽', '旭川', '釧路', '帯広', '北見',
+    
+    # 中国・四国
+    '広島', '岡山', '山口', '鳥取', '島根', '高松', '松山', '高知', '徳島',
+    
+    # 九州・沖縄
+    '福岡', '博多', '北九州', '佐賀', '長崎', '熊本', '大分', '宮崎', '鹿児島', '沖縄', '那覇',
+    
+    # 古典的・文学的地名
+    '平安京', '江戸', '駿河', '甲斐', '信濃', '越後', '陸奥', '出羽', '薩摩', '土佐',
+    '伊豆', '伊勢', '山城', '大和', '河内', '和泉', '摂津', '近江', '美濃', '尾張',
+    
+    # 海外地名（文学作品によく出る）
+    'パリ', 'ロンドン', 'ベルリン', 'ローマ', 'ウィーン', 'モスクワ', 'ペテルブルク',
+    'ニューヨーク', 'シカゴ', 'サンフランシスコ', 'ロサンゼルス',
+    '上海', '北京', '香港', 'ソウル', 'バンコク', 'マニラ',
+    
+    # 地理的特徴
+    '富士山', '阿蘇山', '霧島', '筑波山', '比叡山', '高野山',
+    '琵琶湖', '中禅寺湖', '芦ノ湖', '十和田湖',
+    '瀬戸内海', '日本海', '太平洋', '東京湾', '大阪湾', '駿河湾',
+    '利根川', '信濃川', '石狩川', '筑後川', '吉野川'
+]
+
+# 東京詳細地名データベース
+TOKYO_DETAIL_PLACES = {
+    "本郷": (35.7081, 139.7619, "東京都文京区"),
+    "神田": (35.6918, 139.7648, "東京都千代田区"),
+    "青山": (35.6736, 139.7263, "東京都港区"),
+    "麻布": (35.6581, 139.7414, "東京都港区"),
+    "両国": (35.6967, 139.7933, "東京都墨田区"),
+    "赤坂": (35.6745, 139.7378, "東京都港区"),
+    "日本橋": (35.6813, 139.7744, "東京都中央区"),
+    "築地": (35.6654, 139.7707, "東京都中央区"),
+}
+
+# 京都詳細地名データベース
+KYOTO_DETAIL_PLACES = {
+    "伏見": (34.9393, 135.7578, "京都府京都市伏見区"),
+    "嵐山": (35.0088, 135.6761, "京都府京都市右京区"),
+    "清水": (34.9948, 135.7849, "京都府京都市東山区"),
+    "祇園": (35.0037, 135.7744, "京都府京都市東山区"),
+    "宇治": (34.8842, 135.7991, "京都府宇治市"),
+}
+
+# 北海道地名データベース
+HOKKAIDO_PLACES = {
+    "小樽": (43.1907, 140.9947, "北海道小樽市"),
+    "函館": (41.7687, 140.7291, "北海道函館市"),
+    "札幌": (43.0642, 141.3469, "北海道札幌市"),
+}
+
+# 海外地名データベース（文学作品頻出）
+FOREIGN_PLACES = {
+    "ローマ": (41.9028, 12.4964, "イタリア"),
+    "パリ": (48.8566, 2.3522, "フランス"),
+    "ロンドン": (51.5074, -0.1278, "イギリス"),
+    "ベルリン": (52.5200, 13.4050, "ドイツ"),
+    "ニューヨーク": (40.7128, -74.0060, "アメリカ"),
+    "上海": (31.2304, 121.4737, "中国"),
+    "ペキン": (39.9042, 116.4074, "中国"),
+    "北京": (39.9042, 116.4074, "中国"),
+    "モスクワ": (55.7558, 37.6176, "ロシア"),
+    "ウィーン": (48.2082, 16.3738, "オーストリア"),
+    "アテネ": (37.9838, 23.7275, "ギリシャ"),
+}
+
+
+class GazetteerMatcher:
+    """Aho-Corasick法による辞書地名マッチャー
+    
+    辞書中の全地名をテキストから1回の走査で検出する。
+    計算量はテキスト長 + 一致件数に比例し、辞書サイズには依存しない。
+    """
+    
+    def __init__(self, names: Iterable[str] = ()):
+        # ノードごとの遷移・失敗リンク・辞書リンク・一致長（0は非終端）
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._dict_link: List[int] = [0]
+        self._length: List[int] = [0]
+        self._names = set()
+        self._built = False
+        
+        for name in names:
+            self.add(name)
+        self.build()
+    
+    def add(self, name: str) -> None:
+        """地名を追加（追加後は build() が必要）"""
+        if not name or name in self._names:
+            return
+        
+        node = 0
+        for char in name:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._dict_link.append(0)
+                self._length.append(0)
+            node = next_node
+        
+        self._length[node] = len(name)
+        self._names.add(name)
+        self._built = False
+    
+    def build(self) -> None:
+        """失敗リンク・辞書リンクを幅優先で構築"""
+        queue = deque(self._goto[0].values())
+        for node in queue:
+            self._fail[node] = 0
+            self._dict_link[node] = 0
+        
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail_target = self._goto[fail].get(char, 0)
+                self._fail[child] = fail_target if fail_target != child else 0
+                
+                # 失敗リンクを辿った先で最初に現れる終端ノード
+                target = self._fail[child]
+                self._dict_link[child] = target if self._length[target] else self._dict_link[target]
+                queue.append(child)
+        
+        self._built = True
+    
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """重なりを含む全一致を (開始位置, 終了位置) で列挙"""
+        if not self._built:
+            self.build()
+        
+        goto = self._goto
+        fail = self._fail
+        dict_link = self._dict_link
+        length = self._length
+        root = goto[0]
+        state = 0
+        
+        for position, char in enumerate(text, 1):
+            if not state and char not in root:
+                continue
+            
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            
+            node = state if length[state] else dict_link[state]
+            while node:
+                yield position - length[node], position
+                node = dict_link[node]
+    
+    def find_longest(self, text: str) -> List[Tuple[int, int]]:
+        """最左最長一致で重なりのない地名スパンを返す"""
+        candidates = sorted(self.iter_matches(text), key=lambda span: (span[0], -span[1]))
+        
+        spans = []
+        last_end = 0
+        for start, end in candidates:
+            if start >= last_end:
+                spans.append((start, end))
+                last_end = end
+        
+        return spans
+    
+    def find_names(self, text: str) -> List[str]:
+        """最左最長一致で検出した地名の一覧"""
+        return [text[start:end] for start, end in self.find_longest(text)]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self._names))
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+    
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+def collect_gazetteer_names(min_length: int = 2) -> List[str]:
+    """全地名辞書の見出し語を収集
+    
+    FAMOUS_PLACE_NAMES は厳選済みのため全件採用し、
+    座標辞書由来の語は1文字地名（「萩」など）の誤検出を避けるため min_length 以上に限定する。
+    """
+    names = set(FAMOUS_PLACE_NAMES)
+    
+    coordinate_dictionaries = [
+        PREFECTURE_COORDINATES, CITY_COORDINATES, HISTORICAL_PLACES,
+        TOKYO_DETAIL_PLACES, KYOTO_DETAIL_PLACES, HOKKAIDO_PLACES, FOREIGN_PLACES,
+    ]
+    for dictionary in coordinate_dictionaries:
+        names.update(name for name in dictionary if len(name) >= min_length)
+    
+    return sorted(names)
+
+
+@lru_cache(maxsize=1)
+def get_default_gazetteer() -> GazetteerMatcher:
+    """全地名辞書から構築したマッチャー（プロセス内で1回だけ構築）"""
+    return GazetteerMatcher(collect_gazetteer_names())
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🗄️ Geocoding結果キャッシュ
+ジオコーディングプロバイダー共通の永続キャッシュ
+
+Features:
+- 正規化地名 + プロバイダー をキーとするSQLite永続キャッシュ
+  （プロバイダーへの問い合わせは地名のみで決まるため、文脈はキーに含めない。
+  文脈による判定は ContextAwareGeocodingService が文脈シグネチャごとに行う）
+- プロセス内LRUによる高速な再参照
+- TTL付き保存と失敗結果のネガティブキャッシュ
+- ヒット/ミス統計
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
+
+from bungo_map.core.connection_pool import SQLiteConnectionPool
+from bungo_map.utils.lru import LRUCache, MISS
+
+T = TypeVar('T')
+
+DEFAULT_CACHE_PATH = os.getenv('BUNGO_GEOCODING_CACHE', 'data/geocoding_cache.db')
+DEFAULT_TTL = 90 * 24 * 3600           # 成功結果: 90日
+DEFAULT_NEGATIVE_TTL = 7 * 24 * 3600   # 失敗結果: 7日
+
+
+def normalize_place_name(place_name: str) -> str:
+    """キャッシュキー用の地名正規化（NFKC・空白除去）"""
+    return ''.join(unicodedata.normalize('NFKC', place_name).split())
+
+
+class GeocodingCache:
+    """Geocoding結果の2層キャッシュ（プロセス内LRU + SQLite）
+
+    値は結果のdict（成功）または None（ネガティブキャッシュ）。
+    メモリ層には (値, 有効期限) を保持し、期限切れは両層とも未登録として扱う。
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_CACHE_PATH,
+                 memory_size: int = 4096, ttl: float = DEFAULT_TTL,
+                 negative_ttl: float = DEFAULT_NEGATIVE_TTL):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.memory = LRUCache(memory_size)
+        self.pool = SQLiteConnectionPool(self.db_path, pool_size=2)
+
+        # 統計情報
+        self.stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'negative_hits': 0,
+            'misses': 0,
+            'expired': 0,
+            'writes': 0,
+        }
+        self._stats_lock = threading.Lock()
+
+        self._init_table()
+
+    def _count(self, *keys: str) -> None:
+        """統計情報を加算（非同期パイプラインのスレッドからも呼ばれるためロックする）"""
+        with self._stats_lock:
+            for key in keys:
+                self.stats[key] += 1
+
+    def _init_table(self) -> None:
+        """キャッシュテーブル初期化"""
+        with self.pool.connection() as conn:
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS geocoding_cache (
+                cache_key TEXT PRIMARY KEY,
+                place_name TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                result_json TEXT,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_geocoding_cache_expires ON geocoding_cache(expires_at)"
+            )
+            self._drop_context_class(conn)
+            conn.commit()
+
+    @staticmethod
+    def _drop_context_class(conn: sqlite3.Connection) -> None:
+        """旧形式（context_class 列・キー）のキャッシュを現在のキーに移行（登録済みの結果は再利用）"""
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(geocoding_cache)")]
+        if 'context_class' not in columns:
+            return
+
+        conn.execute("UPDATE geocoding_cache SET cache_key = provider || char(9) || place_name")
+        try:
+            conn.execute("ALTER TABLE geocoding_cache DROP COLUMN context_class")
+        except sqlite3.OperationalError:
+            # DROP COLUMN 非対応（SQLite 3.35未満）: 既定値付きの列のため残しても挿入できる
+            pass
+
+    @staticmethod
+    def make_key(place_name: str, provider: str) -> str:
+        """キャッシュキー生成"""
+        return f"{provider}\t{normalize_place_name(place_name)}"
+
+    def get(self, place_name: str, provider: str):
+        """キャッシュ参照
+
+        Returns:
+            結果dict、ネガティブキャッシュなら None、未登録・期限切れなら MISS
+        """
+        key = self.make_key(place_name, provider)
+        now = time.time()
+
+        entry = self.memory.get(key)
+        if entry is not MISS:
+            value, expires_at = entry
+            if expires_at > now:
+                self._count('memory_hits')
+                if value is None:
+                    self._count('negative_hits')
+                return value
+            self.memory.pop(key)
+
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT result_json, expires_at FROM geocoding_cache WHERE cache_key = ?",
+                (key,)
+            ).fetchone()
+
+        if row is None:
+            self._count('misses')
+            return MISS
+
+        result_json, expires_at = row
+        if expires_at <= now:
+            self._count('expired', 'misses')
+            return MISS
+
+        value = json.loads(result_json) if result_json is not None else None
+        self.memory.put(key, (value, expires_at))
+        self._count('disk_hits')
+        if value is None:
+            self._count('negative_hits')
+        return value
+
+    def set(self, place_name: str, provider: str, value: Optional[Dict]) -> None:
+        """キャッシュ登録（value=None はネガティブキャッシュ）"""
+        key = self.make_key(place_name, provider)
+        now = time.time()
+        expires_at = now + (self.ttl if value is not None else self.negative_ttl)
+
+        with self.pool.connection() as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO geocoding_cache
+                   (cache_key, place_name, provider, result_json, created_at, expires_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (key, normalize_place_name(place_name), provider,
+                 json.dumps(value, ensure_ascii=False) if value is not None else None,
+                 now, expires_at)
+            )
+            conn.commit()
+
+        self.memory.put(key, (value, expires_at))
+        self._count('writes')
+
+    def get_or_geocode(self, place_name: str, provider: str, geocode: Callable[[], Optional[T]],
+                       result_type: Type[T]) -> Optional[T]:
+        """キャッシュ経由でジオコーディング
+
+        未登録時のみ geocode() を呼び、結果（None を含む）を保存する。
+        geocode() が例外を送出した場合は一時的な障害とみなし保存しない。
+        """
+        cached = self.get(place_name, provider)
+        if cached is not MISS:
+            return result_type(**cached) if cached is not None else None
+
+        result = geocode()
+        self.set(place_name, provider, asdict(result) if is_dataclass(result) else result)
+        return result
+
+    def prune(self) -> int:
+        """期限切れエントリの削除"""
+        with self.pool.connection() as conn:
+            cursor = conn.execute("DELETE FROM geocoding_cache WHERE expires_at <= ?", (time.time(),))
+            conn.commit()
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """全エントリの削除"""
+        with self.pool.connection() as conn:
+            conn.execute("DELETE FROM geocoding_cache")
+            conn.commit()
+        self.memory.clear()
+
+    def size(self) -> int:
+        """永続キャッシュの件数"""
+        with self.pool.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM geocoding_cache").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ヒット率などの統計"""
+        hits = self.stats['memory_hits'] + self.stats['disk_hits']
+        lookups = hits + self.stats['misses']
+        return {
+            **self.stats,
+            'evictions': self.memory.evictions,
+            'memory_entries': len(self.memory),
+            'hit_rate': (hits / lookups * 100) if lookups else 0.0,
+        }
+
+
+_default_caches: Dict[str, GeocodingCache] = {}
+_default_lock = threading.Lock()
+
+
+def get_geocoding_cache(db_path: Union[str, Path] = DEFAULT_CACHE_PATH) -> GeocodingCache:
+    """プロセス内で共有するキャッシュ（パスごとに1インスタンス）"""
+    key = str(Path(db_path).resolve())
+    with _default_lock:
+        if key not in _default_caches:
+            _default_caches[key] = GeocodingCache(db_path)
+        return _default_caches[key]
@@ -14,11 +14,18 @@ Features:
 
 import re
 import logging
-from typing import List, Tuple, Dict, Optional
-from dataclasses import dataclass
+from array import array
+from itertools import accumulate
+from typing import List, Tuple, Dict, Optional, Iterator
+from dataclasses import dataclass, field
+
+from bungo_map.utils.aozora_text_cleaner import strip_aozora_markup, clean_sentences
 
 logger = logging.getLogger(__name__)
 
+# 平文（青空文庫の本文処理を通さないテキスト）の文境界
+PLAIN_SENTENCE_SPLIT = re.compile(r'[。！？]')
+
 @dataclass
 class SentenceContext:
     """文脈情報"""
@@ -28,6 +35,107 @@ class SentenceContext:
     sentence_index: int    # 文番号
     char_position: int     # 文字位置
 
+@dataclass
+class SentenceIndex:
+    """文索引（累積文字数と本文中の位置）
+    
+    offsets[i] は文iより前の文の文字数合計（len(sentences) + 1 要素）、
+    spans[2i], spans[2i+1] は文iの本文中の開始・終了位置（特定できない場合は -1）。
+    """
+    sentences: List[str]
+    offsets: array
+    spans: array
+    
+    # 本文中で文を探す際の探索幅（文長に加算する文字数）
+    SEARCH_MARGIN = 2000
+    # 文の先頭・末尾として照合する最大文字数
+    ANCHOR_LENGTH = 16
+    
+    @classmethod
+    def build(cls, sentences: List[str], main_content: str = "") -> 'SentenceIndex':
+        """文リストと本文から索引を構築（本文を先頭から1回走査）"""
+        offsets = array('q', [0])
+        offsets.extend(accumulate(len(sentence) for sentence in sentences))
+        
+        spans = array('q')
+        cursor = 0
+        for sentence in sentences:
+            start, end = cls._locate(main_content, sentence, cursor)
+            spans.extend((start, end))
+            if end >= 0:
+                cursor = end
+        
+        return cls(sentences=sentences, offsets=offsets, spans=spans)
+    
+    @classmethod
+    def _locate(cls, main_content: str, sentence: str, cursor: int) -> Tuple[int, int]:
+        """文の先頭・末尾の断片で本文中の位置を特定（文分割時の空白正規化を許容）"""
+        if not main_content or not sentence:
+            return -1, -1
+        
+        head = sentence[:cls.ANCHOR_LENGTH].split(' ')[0]
+        tail = sentence[-cls.ANCHOR_LENGTH:].split(' ')[-1]
+        if not head or not tail:
+            return -1, -1
+        
+        limit = cursor + len(sentence) + cls.SEARCH_MARGIN
+        start = main_content.find(head, cursor, limit)
+        if start < 0:
+            return -1, -1
+        
+        tail_start = main_content.find(tail, start, start + len(sentence) + cls.SEARCH_MARGIN)
+        if tail_start < 0:
+            return -1, -1
+        
+        return start, tail_start + len(tail)
+    
+    def char_position(self, index: int) -> int:
+        """文の文字位置（O(1)）"""
+        return self.offsets[index]
+    
+    def span(self, index: int) -> Tuple[int, int]:
+        """文の本文中の位置 (start, end)（O(1)）"""
+        return self.spans[2 * index], self.spans[2 * index + 1]
+    
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+@dataclass
+class ProcessedWork:
+    """作品1件分の前処理結果（全抽出器で共有）
+    
+    本文抽出・文分割・文索引・文クリーニングを作品ごとに1回だけ行い、
+    各抽出器はこの結果を受け取って地名検索のみを行う。
+    cleaned_sentences[i] は sentences[i] を clean_aozora_sentence で整形したもの。
+    """
+    work_id: int
+    main_content: str
+    sentences: List[str] = field(default_factory=list)
+    cleaned_sentences: List[str] = field(default_factory=list)
+    sentence_index: Optional[SentenceIndex] = None
+    error: str = ""
+    
+    @classmethod
+    def from_text(cls, work_id: int, text: str, min_length: int = 10) -> 'ProcessedWork':
+        """平文を句点で分割した前処理結果（短いテキスト・テスト用。文索引なし）"""
+        sentences = [sentence.strip() for sentence in PLAIN_SENTENCE_SPLIT.split(text or "")]
+        sentences = [sentence for sentence in sentences if len(sentence) >= min_length]
+        return cls(work_id, text or "", sentences, list(clean_sentences(sentences)))
+    
+    @property
+    def success(self) -> bool:
+        return not self.error
+    
+    def sentence_pairs(self) -> Iterator[Tuple[str, str]]:
+        """(文, クリーニング済みの文) を文番号順に返す"""
+        return zip(self.sentences, self.cleaned_sentences)
+    
+    def span(self, index: int) -> Tuple[int, int]:
+        """文の本文中の位置 (start, end)"""
+        if self.sentence_index is None:
+            return -1, -1
+        return self.sentence_index.span(index)
+
 class AozoraContentProcessor:
     """青空文庫コンテンツ処理クラス"""
     
@@ -78,14 +186,6 @@ class AozoraContentProcessor:
             r'[*＊]{3,}',
         ]
         
-        # ルビ・注釈パターン
-        self.ruby_patterns = [
-            r'《[^》]*》',           # ルビ
-            r'｜[^《]*《[^》]*》',    # ルビ（縦棒付き）
-            r'［＃[^］]*］',         # 注釈
-            r'〔[^〕]*〕',           # 編集注
-        ]
-        
         # 本文開始の指標
         self.content_start_indicators = [
             # 明確な本文開始
@@ -112,6 +212,9 @@ class AozoraContentProcessor:
             r'^[　\s]*[A-Z][a-z]+',        # 外国人名
         ]
         
+        # 直近に構築した文索引（get_sentence_context の索引省略時に再利用）
+        self._last_index: Optional[SentenceIndex] = None
+        
         print("📚 青空文庫コンテンツ処理システム初期化完了")
     
     def extract_main_content(self, raw_content: str) -> str:
@@ -235,18 +338,8 @@ class AozoraContentProcessor:
         return 0
     
     def _clean_ruby_and_annotations(self, content: str) -> str:
-        """ルビ・注釈の処理"""
-        
-        cleaned = content
-        
-        # ルビ・注釈パターンを除去
-        for pattern in self.ruby_patterns:
-            cleaned = re.sub(pattern, '', cleaned)
-        
-        # 縦棒だけが残った場合の処理
-        cleaned = re.sub(r'｜(?![《「])', '', cleaned)
-        
-        return cleaned
+        """ルビ・注釈の処理（ルビの親文字は残す）"""
+        return strip_aozora_markup(content)
     
     def _basic_cleaning(self, content: str) -> str:
         """基本的なクリーニング"""
@@ -467,12 +560,25 @@ class AozoraContentProcessor:
         
         return False
     
-    def get_sentence_context(self, sentences: List[str], target_index: int, context_length: int = 1) -> SentenceContext:
-        """指定した文の前後文脈を取得"""
+    def build_sentence_index(self, sentences: List[str], main_content: str = "") -> SentenceIndex:
+        """文索引を構築"""
+        index = SentenceIndex.build(sentences, main_content)
+        self._last_index = index
+        return index
+    
+    def get_sentence_context(self, sentences: List[str], target_index: int, context_length: int = 1,
+                             index: Optional[SentenceIndex] = None) -> SentenceContext:
+        """指定した文の前後文脈を取得（索引により O(context_length)）"""
         
         if not sentences or target_index < 0 or target_index >= len(sentences):
             return SentenceContext("", "", "", -1, -1)
         
+        if index is None or index.sentences is not sentences:
+            if self._last_index is not None and self._last_index.sentences is sentences:
+                index = self._last_index
+            else:
+                index = self.build_sentence_index(sentences)
+        
         # メイン文
         main_sentence = sentences[target_index]
         
@@ -491,11 +597,11 @@ class AozoraContentProcessor:
             before_text=before_text,
             after_text=after_text,
             sentence_index=target_index,
-            char_position=sum(len(s) for s in sentences[:target_index])
+            char_position=index.char_position(target_index)
         )
     
-    def process_work_content(self, work_id: int, raw_content: str) -> Dict:
-        """作品コンテンツの完全処理"""
+    def process_work(self, work_id: int, raw_content: str) -> ProcessedWork:
+        """作品コンテンツの前処理（本文抽出・文分割・文索引・文クリーニング）"""
         
         logger.info(f"📚 作品{work_id}の処理開始")
         
@@ -504,35 +610,46 @@ class AozoraContentProcessor:
         
         if len(main_content) < 100:
             logger.warning(f"⚠️ 作品{work_id}: 本文が短すぎます ({len(main_content)}文字)")
-            return {
-                'success': False,
-                'main_content': main_content,
-                'sentences': [],
-                'error': '本文が短すぎる'
-            }
+            return ProcessedWork(work_id, main_content, error='本文が短すぎる')
         
         # 2. 文分割
         sentences = self.split_into_sentences(main_content)
         
+        # 3. 文クリーニング（全抽出器で共有）
+        processed = ProcessedWork(work_id, main_content, sentences, list(clean_sentences(sentences)))
+        
         if len(sentences) < 5:
             logger.warning(f"⚠️ 作品{work_id}: 文数が少なすぎます ({len(sentences)}文)")
+            processed.error = '文数が少なすぎる'
+            return processed
+        
+        # 4. 文索引（文脈取得を O(1) にする）
+        processed.sentence_index = self.build_sentence_index(sentences, main_content)
+        
+        logger.info(f"✅ 作品{work_id}処理完了: {len(main_content)}文字, {len(sentences)}文")
+        return processed
+    
+    def process_work_content(self, work_id: int, raw_content: str) -> Dict:
+        """作品コンテンツの完全処理（dict形式）"""
+        processed = self.process_work(work_id, raw_content)
+        
+        if not processed.success:
             return {
                 'success': False,
-                'main_content': main_content,
-                'sentences': sentences,
-                'error': '文数が少なすぎる'
+                'main_content': processed.main_content,
+                'sentences': processed.sentences,
+                'error': processed.error
             }
         
-        logger.info(f"✅ 作品{work_id}処理完了: {len(main_content)}文字, {len(sentences)}文")
-        
         return {
             'success': True,
-            'main_content': main_content,
-            'sentences': sentences,
+            'main_content': processed.main_content,
+            'sentences': processed.sentences,
+            'sentence_index': processed.sentence_index,
             'stats': {
                 'original_length': len(raw_content),
-                'processed_length': len(main_content),
-                'sentence_count': len(sentences)
+                'processed_length': len(processed.main_content),
+                'sentence_count': len(processed.sentences)
             }
         }
 
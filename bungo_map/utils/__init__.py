@@ -6,5 +6,6 @@
 """
 
 from .geojson_exporter import GeoJSONExporter
+from .tile_exporter import TilePyramidExporter
 
-__all__ = ['GeoJSONExporter'] 
\ No newline at end of file
+__all__ = ['GeoJSONExporter', 'TilePyramidExporter'] 
\ No newline at end of file
@@ -3,134 +3,160 @@
 """
 🧹 青空文庫テキストクリーナー
 青空文庫特有のマークアップを除去し、地名抽出に適したテキストに前処理
+
+normalize_aozora はマークアップを1回の走査で除去し、元テキストへの位置対応を返す。
+AozoraTextCleaner・AozoraContentProcessor・AozoraExtractor の共通実装。
 """
 
 import re
 import logging
-from typing import List, Tuple
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from bungo_map.utils.lru import LRUCache, MISS
 
 logger = logging.getLogger(__name__)
 
+# 青空文庫マークアップのトークン（1回の走査で全種を検出）
+# 全候補の先頭を固定文字にしておくことで、正規表現エンジンが先頭文字の集合で
+# 非マークアップ部分を高速にスキップできる（行頭は ^ ではなく直前の改行で照合）。
+# 置換が必要なトークンのみ名前付きグループで識別し、その他は削除する。
+_AOZORA_MARKUP = re.compile(r"""
+    \n(?P<notes>-{5,}[^\n]*\n.*?\n-{5,}[^\n]*)          # 区切り線で囲まれた記号説明ブロック
+  | \n(?:底本|入力|校正)：.*\Z                           # 底本・入力・校正以降の奥付（本文末尾）
+  | \n(?P<blank_lines>(?:[ \t　]*\r?\n)*[ \t　]*)(?=\r?\n)  # 空行の連続（1行の空行に統一）
+  | ※［＃[^］\n]*］                                    # 外字注
+  | ［＃[^］\n]*］                                      # 入力者注
+  | 《[^》\n]*》                                        # ルビ
+  | ｜                                                 # ルビの付く文字列の開始記号
+  | 〔[^〕\n]*〕                                        # 編者注
+  | \r                                                 # CRLF改行のCR
+""", re.DOTALL | re.VERBOSE)
+
+# トークンの置換文字列（記載のないトークンは削除）
+_MARKUP_REPLACEMENTS = {
+    'notes': '\n',
+    'blank_lines': '\n',
+}
+
+# 冒頭の作品名・作者名（短い2行の後に空行）
+_TITLE_HEADER = re.compile(r'\A\s*[^\n]{1,20}\n[^\n]{1,20}\n(?=\s*\n)')
+
+# 文中に残ったメタ情報（行末まで除去）
+_SENTENCE_META = re.compile(r'(?:底本：|入力：|校正：|\d{4}（[^）]*）年|：ルビ|：入力者注).*|【[^】]*】')
+_WHITESPACE = re.compile(r'\s+')
+_LEADING_SYMBOLS = re.compile(r'^[：（）\s]*')
+_SYMBOL_ONLY_LINE = re.compile(r'^[：（）\s]*$')
+_RULE_LINE = re.compile(r'^[─\-=]{3,}$')
+_SENTENCE_END = re.compile(r'[。！？]')
+
+
+@dataclass
+class NormalizedText:
+    """正規化済みテキストと元テキストへの位置対応
+    
+    out_starts[i] から始まる出力区間は、元テキストの raw_starts[i] に対応する。
+    """
+    text: str
+    out_starts: array
+    raw_starts: array
+    
+    def to_raw(self, position: int) -> int:
+        """正規化後の文字位置を元テキストの文字位置に変換"""
+        index = bisect_right(self.out_starts, position) - 1
+        if index < 0:
+            return position
+        return self.raw_starts[index] + (position - self.out_starts[index])
+
+
+def normalize_aozora(text: str) -> NormalizedText:
+    """青空文庫マークアップを1回の線形走査で除去
+    
+    ルビ《》・｜・［＃…］・〔〕・記号説明ブロック・底本以降の奥付を除去し、
+    空行の連続を1行に、CRLFをLFに統一する。ルビの親文字は残す。
+    """
+    if not text:
+        return NormalizedText('', array('q'), array('q'))
+    
+    pieces = []
+    out_starts = array('q')
+    raw_starts = array('q')
+    out_pos = 0
+    last = 0
+    
+    # 先頭行も改行直後として扱えるよう、先頭に改行を補って走査する
+    scan = '\n' + text
+    for match in _AOZORA_MARKUP.finditer(scan):
+        start, end = match.span()
+        # 補った改行を含むトークンは置換文字列も出力しない
+        sentinel = start == 0
+        start = max(start - 1, 0)
+        end -= 1
+        if start > last:
+            out_starts.append(out_pos)
+            raw_starts.append(last)
+            pieces.append(text[last:start])
+            out_pos += start - last
+        replacement = _MARKUP_REPLACEMENTS.get(match.lastgroup)
+        if replacement and not sentinel:
+            out_starts.append(out_pos)
+            raw_starts.append(start)
+            pieces.append(replacement)
+            out_pos += len(replacement)
+        last = end
+    
+    if last < len(text):
+        out_starts.append(out_pos)
+        raw_starts.append(last)
+        pieces.append(text[last:])
+    
+    return NormalizedText(''.join(pieces), out_starts, raw_starts)
+
+
+def strip_aozora_markup(text: str) -> str:
+    """青空文庫マークアップを除去したテキスト（位置対応が不要な場合）"""
+    return normalize_aozora(text).text
+
+
 class AozoraTextCleaner:
     """青空文庫テキストの前処理クラス"""
     
-    def __init__(self):
-        # 強力なクリーニングパターン
-        self.strong_patterns = [
-            # ルビ記号の完全除去
-            (r'《[^》]*》', ''),  # 《ルビ》
-            (r'｜', ''),          # ルビ開始記号
-            
-            # 入力者注の完全除去
-            (r'［＃[^］]*］', ''),  # ［＃注釈］
-            (r'※［＃[^］]*］', ''), # ※［＃外字］
-            
-            # 青空文庫メタ情報の完全除去
-            (r'【[^】]*】.*?(?=\n\n|\n[^【])', '', re.DOTALL),  # 【説明】セクション
-            (r'底本：.*?(?=\n\n|$)', '', re.DOTALL),           # 底本情報
-            (r'入力：.*?(?=\n\n|$)', '', re.DOTALL),           # 入力者情報
-            (r'校正：.*?(?=\n\n|$)', '', re.DOTALL),           # 校正者情報
-            (r'初版発行.*?(?=\n\n|$)', '', re.DOTALL),         # 発行情報
-            (r'\d{4}（[^）]*）年.*?月.*?日.*?発行', ''),        # 発行日
-            
-            # 区切り線の除去
-            (r'-{5,}', ''),
-            (r'={5,}', ''),
-            (r'─{5,}', ''),
-            
-            # 記号説明パターン
-            (r'（例）[^）]*）[^。]*', ''),
-            (r'：[^。\n]*記号', ''),
-            (r'：[^。\n]*注.*?指定', ''),
-            
-            # 作品タイトル・作者名の除去（単独行）
-            (r'^[^\n]{1,20}\n[^\n]{1,20}\n(?=\n)', '', re.MULTILINE),
-            
-            # 空行と空白の整理
-            (r'\n\s*\n\s*\n+', '\n\n'),
-            (r'^\s+', '', re.MULTILINE),
-            (r'\s+$', '', re.MULTILINE),
-        ]
-        
-        # 除去対象のメタテキスト（完全一致・部分一致）
-        self.remove_patterns = [
-            r'【テキスト中に現れる記号について】',
-            r'※表題、副題は、底本編集時に与えられたものです',
-            r'このファイルは、著作権者によって公開されているものです',
-            r'転載・複製・翻案等は、著作権者に許可を得てください',
-            r'：ルビ$',
-            r'：入力者注',
-            r'主に外字の説明',
-            r'傍点の位置の指定',
-            r'ルビの付く文字列の始まりを特定する記号',
-        ]
-    
     def clean_text(self, text: str) -> str:
         """テキスト全体をクリーンアップ"""
         if not text:
             return ""
         
-        cleaned = text
-        
-        # 1. 特定パターンの除去
-        for pattern in self.remove_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.MULTILINE)
+        # 1. マークアップ・メタ情報の除去（1回の走査）
+        cleaned = strip_aozora_markup(text)
         
-        # 2. 強力なパターンマッチング
-        for pattern, replacement, *flags in self.strong_patterns:
-            flag = flags[0] if flags else 0
-            cleaned = re.sub(pattern, replacement, cleaned, flags=flag)
+        # 2. 冒頭の作品名・作者名の除去
+        cleaned = _TITLE_HEADER.sub('', cleaned, count=1)
         
         # 3. 最終整形
-        cleaned = self._final_formatting(cleaned)
-        
-        return cleaned
+        return self._final_formatting(cleaned)
     
     def clean_sentence(self, sentence: str) -> str:
         """文レベルでのクリーンアップ（地名抽出用）"""
         if not sentence:
             return ""
         
-        cleaned = sentence
-        
-        # ルビ除去
-        cleaned = re.sub(r'《[^》]*》', '', cleaned)
-        cleaned = re.sub(r'｜', '', cleaned)
-        
-        # 注釈除去
-        cleaned = re.sub(r'［＃[^］]*］', '', cleaned)
-        cleaned = re.sub(r'※［＃[^］]*］', '', cleaned)
+        # ルビ・注釈の除去
+        cleaned = strip_aozora_markup(sentence)
         
         # メタ情報らしき文字列の除去
-        meta_patterns = [
-            r'底本：.*',
-            r'入力：.*',
-            r'校正：.*',
-            r'\d{4}（[^）]*）年.*',
-            r'【[^】]*】',
-            r'：ルビ.*',
-            r'：入力者注.*',
-        ]
-        
-        for pattern in meta_patterns:
-            cleaned = re.sub(pattern, '', cleaned)
+        cleaned = _SENTENCE_META.sub('', cleaned)
         
         # 余分な空白・記号除去
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        cleaned = re.sub(r'^[：（）\s]*', '', cleaned)  # 行頭の記号除去
-        cleaned = cleaned.strip()
-        
-        return cleaned
+        cleaned = _WHITESPACE.sub(' ', cleaned)
+        cleaned = _LEADING_SYMBOLS.sub('', cleaned)  # 行頭の記号除去
+        return cleaned.strip()
     
     def _final_formatting(self, text: str) -> str:
         """最終整形"""
-        cleaned = text
-        
-        # 連続する空行を整理
-        cleaned = re.sub(r'\n\s*\n\s*\n+', '\n\n', cleaned)
-        
-        # 行の整理
-        lines = cleaned.split('\n')
+        # 行の整理（空行の連続は normalize_aozora で整理済み）
+        lines = text.split('\n')
         clean_lines = []
         
         for line in lines:
@@ -138,8 +164,8 @@ class AozoraTextCleaner:
             # 空行や無意味な行をスキップ
             if (line and 
                 len(line) > 2 and  # 短すぎる行は除外
-                not re.match(r'^[：（）\s]*$', line) and  # 記号のみの行は除外
-                not re.match(r'^[─\-=]{3,}$', line)):   # 区切り線は除外
+                not _SYMBOL_ONLY_LINE.match(line) and  # 記号のみの行は除外
+                not _RULE_LINE.match(line)):   # 区切り線は除外
                 clean_lines.append(line)
         
         cleaned = '\n'.join(clean_lines)
@@ -150,7 +176,7 @@ class AozoraTextCleaner:
         cleaned_text = self.clean_text(text)
         
         # 文境界で分割（句点、感嘆符、疑問符）
-        sentences = re.split(r'[。！？]', cleaned_text)
+        sentences = _SENTENCE_END.split(cleaned_text)
         
         # フィルタリング
         clean_sentences = []
@@ -178,15 +204,43 @@ class AozoraTextCleaner:
         return any(indicator in sentence for indicator in meta_indicators)
 
 # 既存の抽出器に統合するためのヘルパー関数
+# 同一文は抽出器・DBクリーンアップで繰り返しクリーニングされるため結果をメモ化する
+SENTENCE_CACHE_SIZE = 32768
+
+_shared_cleaner = AozoraTextCleaner()
+_sentence_cache = LRUCache(SENTENCE_CACHE_SIZE)
+
 def clean_aozora_text(text: str) -> str:
     """グローバル関数として提供"""
-    cleaner = AozoraTextCleaner()
-    return cleaner.clean_text(text)
+    return _shared_cleaner.clean_text(text)
 
 def clean_aozora_sentence(sentence: str) -> str:
-    """文レベルクリーニングのグローバル関数"""
-    cleaner = AozoraTextCleaner()
-    return cleaner.clean_sentence(sentence)
+    """文レベルクリーニングのグローバル関数（LRUでメモ化）"""
+    cleaned = _sentence_cache.get(sentence)
+    if cleaned is MISS:
+        cleaned = _shared_cleaner.clean_sentence(sentence)
+        _sentence_cache.put(sentence, cleaned)
+    return cleaned
+
+def clean_sentences(sentences: Iterable[str]) -> Iterator[str]:
+    """複数文の一括クリーニング（メモ・コンパイル済みパターンを共有）"""
+    for sentence in sentences:
+        yield clean_aozora_sentence(sentence)
+
+def sentence_cache_stats() -> Dict[str, Any]:
+    """文クリーニングメモのヒット率などの統計"""
+    lookups = _sentence_cache.hits + _sentence_cache.misses
+    return {
+        'hits': _sentence_cache.hits,
+        'misses': _sentence_cache.misses,
+        'evictions': _sentence_cache.evictions,
+        'entries': len(_sentence_cache),
+        'hit_rate': (_sentence_cache.hits / lookups * 100) if lookups else 0.0,
+    }
+
+def clear_sentence_cache() -> None:
+    """文クリーニングメモの破棄"""
+    _sentence_cache.clear()
 
 def test_cleaner():
     """テスト用関数"""
@@ -5,62 +5,89 @@ GeoJSONエクスポート機能
 データベースの地名データをGeoJSON形式で出力
 """
 
+import gzip
 import json
 import os
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, TextIO
 from pathlib import Path
 from bungo_map.core.database import Database
 from bungo_map.core.models import Author, Work, Place
 
 
+def classify_place_category(place_name: str) -> str:
+    """地名のカテゴリ分類（GeoJSON・タイル出力で共通）"""
+    if any(suffix in place_name for suffix in ['県', '府', '道', '都']):
+        return "prefecture"
+    elif any(suffix in place_name for suffix in ['市', '区', '町', '村']):
+        return "city"
+    elif any(suffix in place_name for suffix in ['海', '湖', '川', '山', '島']):
+        return "nature"
+    elif any(keyword in place_name for keyword in ['温泉', '神社', '寺', '駅']):
+        return "landmark"
+    elif place_name in ['本郷', '上野', '浅草', '朱雀大路']:
+        return "district"
+    else:
+        return "other"
+
+
 class GeoJSONExporter:
     """GeoJSONエクスポートクラス"""
     
     def __init__(self, db: Database):
         self.db = db
+        self.last_export_count = 0
     
-    def get_places_with_metadata(self) -> List[Dict[str, Any]]:
-        """座標付き地名データを作者・作品情報と共に取得"""
-        places_data = []
+    # エクスポート対象の列（create_geojson_feature が参照するキー）
+    METADATA_COLUMNS = [
+        'place_id', 'work_id', 'place_name', 'lat', 'lng',
+        'before_text', 'sentence', 'after_text', 'confidence', 'extraction_method',
+        'work_title', 'work_wiki_url', 'author_name', 'author_wiki_url',
+        'birth_year', 'death_year',
+    ]
+    
+    def iter_places_with_metadata(self, page_size: int = 5000) -> Iterator[Dict[str, Any]]:
+        """座標付き地名データを作者・作品情報と共に1件ずつ返すジェネレータ
         
-        with self.db.get_connection() as conn:
-            query = """
-            SELECT 
-                p.place_id, p.work_id, p.place_name, p.lat, p.lng,
-                p.before_text, p.sentence, p.after_text, p.confidence, p.extraction_method,
-                w.title as work_title, w.wiki_url as work_wiki_url,
-                a.name as author_name, a.wikipedia_url as author_wiki_url,
-                a.birth_year, a.death_year
-            FROM places p
-            JOIN works w ON p.work_id = w.work_id
-            JOIN authors a ON w.author_id = a.author_id
-            WHERE p.lat IS NOT NULL AND p.lng IS NOT NULL
-            ORDER BY a.name, w.title, p.place_name
-            """
+        place_id > 直前のID のキーセットページングで page_size 件ずつ読み込むため、
+        件数によらずメモリ上に保持するのは1ページ分のみ。
+        """
+        last_id = 0
+        while True:
+            with self.db.get_connection() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT 
+                        p.place_id, p.work_id, p.place_name, p.lat, p.lng,
+                        p.before_text, p.sentence, p.after_text, p.confidence, p.extraction_method,
+                        w.title as work_title, w.wiki_url as work_wiki_url,
+                        a.name as author_name, a.wikipedia_url as author_wiki_url,
+                        a.birth_year, a.death_year
+                    FROM places p
+                    JOIN works w ON p.work_id = w.work_id
+                    JOIN authors a ON w.author_id = a.author_id
+                    WHERE p.lat IS NOT NULL AND p.lng IS NOT NULL AND p.place_id > ?
+                    ORDER BY p.place_id
+                    LIMIT ?
+                    """,
+                    (last_id, page_size)
+                ).fetchall()
+            
+            for row in rows:
+                yield dict(zip(self.METADATA_COLUMNS, row))
             
-            cursor = conn.execute(query)
-            for row in cursor.fetchall():
-                places_data.append({
-                    'place_id': row[0],
-                    'work_id': row[1],
-                    'place_name': row[2],
-                    'lat': row[3],
-                    'lng': row[4],
-                    'before_text': row[5],
-                    'sentence': row[6],
-                    'after_text': row[7],
-                    'confidence': row[8],
-                    'extraction_method': row[9],
-                    'work_title': row[10],
-                    'work_wiki_url': row[11],
-                    'author_name': row[12],
-                    'author_wiki_url': row[13],
-                    'birth_year': row[14],
-                    'death_year': row[15]
-                })
-        
-        return places_data
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1][0]
+    
+    def get_places_with_metadata(self) -> List[Dict[str, Any]]:
+        """座標付き地名データを作者・作品情報と共に取得（全件をリストで返す）"""
+        return list(self.iter_places_with_metadata())
+    
+    def iter_features(self, page_size: int = 5000) -> Iterator[Dict[str, Any]]:
+        """GeoJSONのFeatureを1件ずつ返すジェネレータ"""
+        for place_data in self.iter_places_with_metadata(page_size):
+            yield self.create_geojson_feature(place_data)
     
     def create_geojson_feature(self, place_data: Dict[str, Any]) -> Dict[str, Any]:
         """地名データからGeoJSONのFeatureを作成"""
@@ -104,7 +131,7 @@ class GeoJSONExporter:
             "author_wiki_url": place_data['author_wiki_url'],
             
             # カテゴリ分類
-            "category": self._classify_place_category(place_data['place_name']),
+            "category": classify_place_category(place_data['place_name']),
             "era": self._classify_era(place_data['birth_year']),
             
             # メタデータ
@@ -123,21 +150,6 @@ class GeoJSONExporter:
         
         return feature
     
-    def _classify_place_category(self, place_name: str) -> str:
-        """地名のカテゴリ分類"""
-        if any(suffix in place_name for suffix in ['県', '府', '道', '都']):
-            return "prefecture"
-        elif any(suffix in place_name for suffix in ['市', '区', '町', '村']):
-            return "city"
-        elif any(suffix in place_name for suffix in ['海', '湖', '川', '山', '島']):
-            return "nature"
-        elif any(keyword in place_name for keyword in ['温泉', '神社', '寺', '駅']):
-            return "landmark"
-        elif place_name in ['本郷', '上野', '浅草', '朱雀大路']:
-            return "district"
-        else:
-            return "other"
-    
     def _classify_era(self, birth_year: Optional[int]) -> str:
         """作者の生年による時代分類"""
         if not birth_year:
@@ -153,53 +165,111 @@ class GeoJSONExporter:
         else:
             return "modern"
     
+    def _summary_counts(self) -> Dict[str, int]:
+        """エクスポート対象の地名数・作者数・作品数（SQLで集計）"""
+        with self.db.get_connection() as conn:
+            row = conn.execute("""
+            SELECT COUNT(*), COUNT(DISTINCT a.name), COUNT(DISTINCT w.title)
+            FROM places p
+            JOIN works w ON p.work_id = w.work_id
+            JOIN authors a ON w.author_id = a.author_id
+            WHERE p.lat IS NOT NULL AND p.lng IS NOT NULL
+            """).fetchone()
+        return {
+            "total_places": row[0],
+            "unique_authors": row[1],
+            "unique_works": row[2],
+        }
+    
+    def _collection_metadata(self) -> Dict[str, Any]:
+        """FeatureCollectionのメタデータ"""
+        return {
+            "title": "文豪ゆかり地図",
+            "description": "日本の文豪作品に登場する地名データ",
+            "version": "2.0.0",
+            "generated_at": datetime.now().isoformat(),
+            **self._summary_counts(),
+            "coordinate_system": "WGS84",
+            "data_source": "bungo-map v2.0"
+        }
+    
     def create_geojson(self) -> Dict[str, Any]:
-        """GeoJSONデータを作成"""
-        places_data = self.get_places_with_metadata()
-        
-        # 統計情報
-        total_places = len(places_data)
-        unique_authors = len(set(place['author_name'] for place in places_data))
-        unique_works = len(set(place['work_title'] for place in places_data))
-        
-        # Features作成
-        features = []
-        for place_data in places_data:
-            feature = self.create_geojson_feature(place_data)
-            features.append(feature)
-        
-        # GeoJSON FeatureCollection作成
-        geojson = {
+        """GeoJSONデータを作成（全Featureをメモリ上に構築）"""
+        return {
             "type": "FeatureCollection",
-            "metadata": {
-                "title": "文豪ゆかり地図",
-                "description": "日本の文豪作品に登場する地名データ",
-                "version": "2.0.0",
-                "generated_at": datetime.now().isoformat(),
-                "total_places": total_places,
-                "unique_authors": unique_authors,
-                "unique_works": unique_works,
-                "coordinate_system": "WGS84",
-                "data_source": "bungo-map v2.0"
-            },
-            "features": features
+            "metadata": self._collection_metadata(),
+            "features": list(self.iter_features())
         }
+    
+    def write_geojson(self, f: TextIO, indent: Optional[int] = 2) -> int:
+        """FeatureCollectionをFeature単位で逐次書き込み
+        
+        出力は json.dump(create_geojson()) と同じ構造だが、
+        Featureのリストを構築しないためメモリ使用量は件数に依存しない。
+        
+        Returns:
+            書き込んだFeature数
+        """
+        newline = "\n" if indent is not None else ""
+        pad = " " * indent if indent is not None else ""
+        separator = "," + newline if indent is not None else ","
+        
+        metadata = json.dumps(self._collection_metadata(), ensure_ascii=False, indent=indent)
+        f.write("{" + newline)
+        f.write(f'{pad}"type": "FeatureCollection",{newline}')
+        f.write(f'{pad}"metadata": {metadata.replace(chr(10), chr(10) + pad)},{newline}')
+        f.write(f'{pad}"features": [')
+        
+        count = 0
+        for feature in self.iter_features():
+            text = json.dumps(feature, ensure_ascii=False, indent=indent)
+            if indent is not None:
+                text = pad * 2 + text.replace("\n", "\n" + pad * 2)
+            f.write((separator if count else newline) + text)
+            count += 1
+        
+        f.write((newline + pad if count else "") + "]" + newline + "}" + newline)
+        return count
+    
+    def write_geojson_seq(self, f: TextIO) -> int:
+        """改行区切りGeoJSON（GeoJSONSeq）として1行1Featureで書き込み
         
-        return geojson
+        Returns:
+            書き込んだFeature数
+        """
+        count = 0
+        for feature in self.iter_features():
+            f.write(json.dumps(feature, ensure_ascii=False, separators=(',', ':')))
+            f.write("\n")
+            count += 1
+        return count
     
-    def export_to_file(self, output_path: str, indent: int = 2) -> bool:
-        """GeoJSONファイルにエクスポート"""
+    def export_to_file(self, output_path: str, indent: Optional[int] = 2,
+                       seq: bool = False, compress: Optional[bool] = None) -> bool:
+        """GeoJSONファイルにストリーミングでエクスポート
+        
+        Args:
+            seq: True の場合は改行区切りGeoJSON（GeoJSONSeq）で出力
+            compress: gzip圧縮するか（None の場合は拡張子 .gz で判定）
+        """
         try:
             # ディレクトリが存在しない場合は作成
             output_dir = Path(output_path).parent
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            # GeoJSONデータ作成
-            geojson_data = self.create_geojson()
+            if compress is None:
+                compress = str(output_path).endswith('.gz')
+            
+            if compress:
+                f = gzip.open(output_path, 'wt', encoding='utf-8', compresslevel=6)
+            else:
+                f = open(output_path, 'w', encoding='utf-8')
             
-            # ファイルに書き込み
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(geojson_data, f, ensure_ascii=False, indent=indent)
+            with f:
+                if seq:
+                    self.last_export_count = self.write_geojson_seq(f)
+                else:
+                    self.last_export_count = self.write_geojson(f, indent=indent)
             
             return True
             
@@ -208,37 +278,38 @@ class GeoJSONExporter:
             return False
     
     def get_export_stats(self) -> Dict[str, Any]:
-        """エクスポート可能データの統計情報"""
-        places_data = self.get_places_with_metadata()
-        
-        # 統計計算
-        stats = {
-            "total_places": len(places_data),
-            "unique_authors": len(set(place['author_name'] for place in places_data)),
-            "unique_works": len(set(place['work_title'] for place in places_data)),
-        }
-        
-        # 作者別統計
-        author_stats = {}
-        for place in places_data:
-            author = place['author_name']
-            if author not in author_stats:
-                author_stats[author] = {"places": 0, "works": set()}
-            author_stats[author]["places"] += 1
-            author_stats[author]["works"].add(place['work_title'])
-        
-        # 作者別統計を整理
-        for author in author_stats:
-            author_stats[author]["works"] = len(author_stats[author]["works"])
+        """エクスポート可能データの統計情報（SQLで集計）"""
+        stats = self._summary_counts()
         
-        stats["by_author"] = author_stats
-        
-        # カテゴリ別統計
-        category_stats = {}
-        for place in places_data:
-            category = self._classify_place_category(place['place_name'])
-            category_stats[category] = category_stats.get(category, 0) + 1
+        with self.db.get_connection() as conn:
+            # 作者別統計
+            author_stats = {}
+            for author, places, works in conn.execute("""
+            SELECT a.name, COUNT(*), COUNT(DISTINCT w.title)
+            FROM places p
+            JOIN works w ON p.work_id = w.work_id
+            JOIN authors a ON w.author_id = a.author_id
+            WHERE p.lat IS NOT NULL AND p.lng IS NOT NULL
+            GROUP BY a.name
+            ORDER BY a.name
+            """):
+                author_stats[author] = {"places": places, "works": works}
+            
+            stats["by_author"] = author_stats
+            
+            # カテゴリ別統計（地名ごとの件数から分類）
+            category_stats = {}
+            for place_name, count in conn.execute("""
+            SELECT p.place_name, COUNT(*)
+            FROM places p
+            JOIN works w ON p.work_id = w.work_id
+            JOIN authors a ON w.author_id = a.author_id
+            WHERE p.lat IS NOT NULL AND p.lng IS NOT NULL
+            GROUP BY p.place_name
+            """):
+                category = classify_place_category(place_name)
+                category_stats[category] = category_stats.get(category, 0) + count
         
         stats["by_category"] = category_stats
         
-        return stats 
\ No newline at end of file
+        return stats
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文中位置に基づく地名の重複解消
+抽出器ごとの包含チェック（地名文字列の部分一致）を、文字位置の区間による判定に置き換える
+
+- 候補を優先度順にソートし、採用済み区間と重ならないものだけを採用
+- 採用済みの文字位置は文長のバイト列で管理（ソート O(n log n) + 文長・区間長の合計に比例する走査）
+- 位置で判定するため、同じ地名が文中に複数回現れても別々に扱える（列挙文など）
+- 同じ文が作品内に複数回現れても、文番号（sentence_index）で出現ごとに判定する
+- 抽出手法の優先度は ExtractionCoordinator と共通（METHOD_PRIORITY）
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+Span = Tuple[int, int]
+
+# 抽出手法の優先度（数値が小さいほど高優先度）
+METHOD_PRIORITY: Dict[str, int] = {
+    'regex': 1,         # Regex系は高精度
+    'ai_compound': 2,   # 複合地名抽出
+    'ginza_nlp': 3,     # GinzaNLP
+}
+DEFAULT_METHOD_PRIORITY = len(METHOD_PRIORITY) + 1
+
+# extraction_method の接頭辞 → METHOD_PRIORITY のキー
+_METHOD_PREFIXES = (
+    ('precise_compound', 'ai_compound'),
+    ('ai_compound', 'ai_compound'),
+    ('regex', 'regex'),
+    ('ginza', 'ginza_nlp'),
+)
+
+
+def method_priority(extraction_method: Optional[str]) -> int:
+    """抽出手法名（'regex_市区町村'・'precise_compound_city_ward' 等）の優先度"""
+    if extraction_method:
+        for prefix, method in _METHOD_PREFIXES:
+            if extraction_method.startswith(prefix):
+                return METHOD_PRIORITY[method]
+    return DEFAULT_METHOD_PRIORITY
+
+
+def place_rank(place: Any) -> Tuple[int, int, float]:
+    """地名候補の優先順（長い地名 > 手法の優先度 > 高信頼度）"""
+    return (-len(place.place_name), method_priority(place.extraction_method), -place.confidence)
+
+
+def select_non_overlapping(items: Iterable[T], span: Callable[[T], Span],
+                           rank: Callable[[T], Any]) -> List[T]:
+    """rank の小さい順に、採用済みの区間と重ならない候補を採用
+
+    区間は文中の位置を想定し、採用済みの文字位置を max(end) 長のバイト列で管理する。
+
+    Returns:
+        採用した候補（開始位置順）
+    """
+    spanned = [(span(item), item) for item in items]
+    if not spanned:
+        return []
+
+    occupied = bytearray(max(end for (_, end), _ in spanned))
+    selected: List[Tuple[Span, T]] = []
+
+    for (start, end), item in sorted(spanned, key=lambda pair: rank(pair[1])):
+        if occupied.find(1, start, end) >= 0:
+            continue
+        occupied[start:end] = b'\x01' * (end - start)
+        selected.append(((start, end), item))
+
+    selected.sort(key=lambda pair: pair[0])
+    return [item for _, item in selected]
+
+
+def overlapping_groups(items: Iterable[T], span: Callable[[T], Span]) -> List[List[T]]:
+    """区間が連鎖的に重なる候補のグループ（2件以上のもののみ、開始位置順の走査）"""
+    groups: List[List[T]] = []
+    group: List[T] = []
+    group_end = -1
+
+    for item in sorted(items, key=span):
+        start, end = span(item)
+        if group and start < group_end:
+            group.append(item)
+            group_end = max(group_end, end)
+            continue
+        if len(group) > 1:
+            groups.append(group)
+        group, group_end = [item], end
+
+    if len(group) > 1:
+        groups.append(group)
+    return groups
+
+
+def _candidate_spans(sentence: str, candidates: List[Any]) -> List[Optional[Span]]:
+    """候補の文中位置（start_pos/end_pos が無い候補は同名の出現を先頭から順に割り当てる）"""
+    cursors: Dict[str, int] = {}
+    spans: List[Optional[Span]] = []
+
+    for candidate in candidates:
+        start = getattr(candidate, 'start_pos', None)
+        end = getattr(candidate, 'end_pos', None)
+        if start is not None and end is not None:
+            spans.append((start, end))
+            continue
+
+        name = candidate.place_name
+        start = sentence.find(name, cursors.get(name, 0)) if name else -1
+        if start < 0:
+            spans.append(None)
+            continue
+        cursors[name] = start + len(name)
+        spans.append((start, start + len(name)))
+
+    return spans
+
+
+def resolve_overlaps(candidates: Iterable[T], rank: Callable[[T], Any] = place_rank) -> List[T]:
+    """文ごとに位置の重なる地名候補を解消
+
+    候補は place_name・sentence と、任意で sentence_index（作品内の文番号）・
+    start_pos・end_pos（sentence 内の位置）を持つ。
+    位置が無い候補は同名の出現位置を順に割り当て、文中に見つからない候補はそのまま残す。
+
+    Args:
+        candidates: 地名候補（Place・ExtractionResult 等）。(work_id, sentence_index, sentence) ごとに判定する。
+            sentence_index が無い候補は文の内容のみで判定する
+        rank: 優先順のキー（小さいほど優先）
+    """
+    groups: Dict[Tuple[Any, Optional[int], str], List[T]] = {}
+    for candidate in candidates:
+        key = (
+            getattr(candidate, 'work_id', None),
+            getattr(candidate, 'sentence_index', None),
+            candidate.sentence or "",
+        )
+        groups.setdefault(key, []).append(candidate)
+
+    resolved: List[T] = []
+    for (_, _, sentence), group in groups.items():
+        if len(group) == 1:
+            resolved.extend(group)
+            continue
+
+        spans = _candidate_spans(sentence, group)
+        located = [(span, candidate) for span, candidate in zip(spans, group) if span is not None]
+        resolved.extend(
+            candidate for _, candidate in select_non_overlapping(
+                located, span=lambda pair: pair[0], rank=lambda pair: rank(pair[1])
+            )
+        )
+        resolved.extend(candidate for span, candidate in zip(spans, group) if span is None)
+
+    return resolved
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+タイルピラミッドエクスポート機能
+地名データをズームレベルごとにクラスタリングした z/x/y タイルとして出力
+
+- Webメルカトル（256pxタイル）上のグリッドクラスタリング
+- 最大ズームでは同一・近接地点（merge_radius px 四方）のみを集約し、それ未満では下位ズームのクラスタを再集約
+- 地名はページ単位で読み込みながら最大ズームのグリッドに集約するため、
+  メモリ上に保持するのは最大ズームのセル数分のみ（地名の総数によらない）
+- 出力はタイルごとのGeoJSON（ディレクトリ）またはMBTiles（gzip圧縮JSON）
+- ピン表示に必要なプロパティ（title・subtitle・category）のみを保持
+"""
+
+import gzip
+import json
+import math
+import sqlite3
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from bungo_map.core.database import Database
+from bungo_map.utils.geojson_exporter import classify_place_category
+
+TILE_SIZE = 256
+MAX_MERCATOR_LAT = 85.05112878
+
+
+def project(lat: float, lng: float, zoom: int) -> Tuple[float, float]:
+    """緯度経度をズームレベル zoom のピクセル座標に変換（Webメルカトル）"""
+    world = TILE_SIZE * (2 ** zoom)
+    lat = max(-MAX_MERCATOR_LAT, min(MAX_MERCATOR_LAT, lat))
+    sin_lat = math.sin(math.radians(lat))
+    x = (lng + 180.0) / 360.0 * world
+    y = (0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)) * world
+    return min(max(x, 0.0), world - 1e-9), min(max(y, 0.0), world - 1e-9)
+
+
+class TilePyramidExporter:
+    """クラスタリング済みタイルピラミッドのエクスポートクラス
+
+    各ズームのアイテムは [経度, 緯度, 件数, ピン用プロパティ]。
+    件数が2以上のものはクラスタとして point_count のみを持つ（プロパティは None）。
+    """
+
+    def __init__(self, db: Database, min_zoom: int = 0, max_zoom: int = 14,
+                 cluster_radius: int = 40, merge_radius: int = 2):
+        if not 0 <= min_zoom <= max_zoom:
+            raise ValueError("0 <= min_zoom <= max_zoom である必要があります")
+        self.db = db
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.cluster_radius = cluster_radius
+        self.merge_radius = merge_radius
+        self.bounds = (-180.0, -MAX_MERCATOR_LAT, 180.0, MAX_MERCATOR_LAT)
+
+        # 統計情報
+        self.stats = {
+            'places': 0,
+            'tiles': 0,
+            'features': 0,
+            'clusters': 0,
+            'tiles_by_zoom': {},
+        }
+
+    def iter_pin_places(self, page_size: int = 10000) -> Iterator[Tuple[float, float, Dict[str, str]]]:
+        """座標付き地名を (緯度, 経度, ピン用プロパティ) で1件ずつ返す"""
+        last_id = 0
+        while True:
+            with self.db.get_connection() as conn:
+                rows = conn.execute(
+                    """SELECT p.place_id, p.place_name, p.lat, p.lng,
+                              w.title as work_title, a.name as author_name
+                       FROM places p
+                       JOIN works w ON p.work_id = w.work_id
+                       JOIN authors a ON w.author_id = a.author_id
+                       WHERE p.lat IS NOT NULL AND p.lng IS NOT NULL AND p.place_id > ?
+                       ORDER BY p.place_id
+                       LIMIT ?""",
+                    (last_id, page_size)
+                ).fetchall()
+
+            for place_id, place_name, lat, lng, work_title, author_name in rows:
+                yield lat, lng, {
+                    'title': place_name,
+                    'subtitle': f"{author_name}『{work_title}』",
+                    'category': classify_place_category(place_name),
+                }
+
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1][0]
+
+    def _iter_pin_items(self) -> Iterator[List[Any]]:
+        """座標付き地名を [経度, 緯度, 1, ピン用プロパティ] で返し、件数と範囲を記録"""
+        count = 0
+        west = south = math.inf
+        east = north = -math.inf
+        for lat, lng, props in self.iter_pin_places():
+            count += 1
+            west, east = min(west, lng), max(east, lng)
+            south, north = min(south, lat), max(north, lat)
+            yield [lng, lat, 1, props]
+
+        self.stats['places'] = count
+        if count:
+            self.bounds = (west, south, east, north)
+
+    def _cluster(self, items: Iterable[List[Any]], zoom: int, radius: int) -> List[List[Any]]:
+        """radius px 四方のグリッドでアイテムを集約（重心は件数で加重）"""
+        cells: Dict[Tuple[int, int], List[Any]] = {}
+        for lng, lat, count, props in items:
+            x, y = project(lat, lng, zoom)
+            key = (int(x // radius), int(y // radius))
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [lng * count, lat * count, count, props]
+            else:
+                cell[0] += lng * count
+                cell[1] += lat * count
+                cell[2] += count
+                cell[3] = None  # クラスタはプロパティを持たない
+
+        return [[lng_sum / count, lat_sum / count, count, props]
+                for lng_sum, lat_sum, count, props in cells.values()]
+
+    def _tile_features(self, items: List[List[Any]], zoom: int) -> Dict[Tuple[int, int], List[Dict]]:
+        """アイテムをタイルごとのGeoJSON Featureに振り分け"""
+        tiles: Dict[Tuple[int, int], List[Dict]] = defaultdict(list)
+        for lng, lat, count, props in items:
+            x, y = project(lat, lng, zoom)
+            if count > 1:
+                props = {'cluster': True, 'point_count': count}
+                self.stats['clusters'] += 1
+            tiles[(int(x // TILE_SIZE), int(y // TILE_SIZE))].append({
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [round(lng, 6), round(lat, 6)]},
+                'properties': props,
+            })
+        return tiles
+
+    def iter_tiles(self) -> Iterator[Tuple[int, int, int, Dict[str, Any]]]:
+        """(z, x, y, FeatureCollection) を最大ズームから順に返す
+
+        最大ズームのグリッドは地名をページ単位で読み込みながら構築する（同一・近接地点は集約）。
+        """
+        items = self._cluster(self._iter_pin_items(), self.max_zoom, self.merge_radius)
+
+        for zoom in range(self.max_zoom, self.min_zoom - 1, -1):
+            if zoom < self.max_zoom:
+                items = self._cluster(items, zoom, self.cluster_radius)
+
+            tiles = self._tile_features(items, zoom)
+            self.stats['tiles_by_zoom'][zoom] = len(tiles)
+            for (x, y), features in tiles.items():
+                self.stats['tiles'] += 1
+                self.stats['features'] += len(features)
+                yield zoom, x, y, {'type': 'FeatureCollection', 'features': features}
+
+    def export_directory(self, output_dir: str) -> Dict[str, Any]:
+        """{output_dir}/{z}/{x}/{y}.json として出力"""
+        root = Path(output_dir)
+        for zoom, x, y, collection in self.iter_tiles():
+            path = root / str(zoom) / str(x) / f"{y}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(collection, f, ensure_ascii=False, separators=(',', ':'))
+
+        with open(root / 'metadata.json', 'w', encoding='utf-8') as f:
+            json.dump(self._metadata(), f, ensure_ascii=False, indent=2)
+        return self.stats
+
+    def export_mbtiles(self, output_path: str, batch_size: int = 1000) -> Dict[str, Any]:
+        """MBTiles（タイルはgzip圧縮JSON、行番号はTMS）として出力"""
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            path.unlink()
+
+        conn = sqlite3.connect(str(path))
+        try:
+            conn.execute("CREATE TABLE metadata (name TEXT, value TEXT)")
+            conn.execute("""
+            CREATE TABLE tiles (
+                zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB
+            )
+            """)
+
+            batch = []
+            for zoom, x, y, collection in self.iter_tiles():
+                data = json.dumps(collection, ensure_ascii=False, separators=(',', ':'))
+                batch.append((zoom, x, (2 ** zoom) - 1 - y, gzip.compress(data.encode('utf-8'))))
+                if len(batch) >= batch_size:
+                    conn.executemany("INSERT INTO tiles VALUES (?, ?, ?, ?)", batch)
+                    batch.clear()
+            if batch:
+                conn.executemany("INSERT INTO tiles VALUES (?, ?, ?, ?)", batch)
+
+            conn.execute("CREATE UNIQUE INDEX tile_index ON tiles (zoom_level, tile_column, tile_row)")
+            conn.executemany(
+                "INSERT INTO metadata VALUES (?, ?)",
+                [(name, str(value)) for name, value in self._metadata().items()]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return self.stats
+
+    def _metadata(self) -> Dict[str, Any]:
+        """タイルセットのメタデータ（MBTiles仕様の項目名）"""
+        return {
+            'name': '文豪ゆかり地図',
+            'description': '日本の文豪作品に登場する地名（クラスタリング済み）',
+            'format': 'json',
+            'type': 'overlay',
+            'version': '2.0.0',
+            'minzoom': self.min_zoom,
+            'maxzoom': self.max_zoom,
+            'bounds': ','.join(f"{value:.6f}" for value in self.bounds),
+        }